@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AK Parti Dinamik Puanlama Sistemi - Dinamik Metod Kaydı
+dynamic_methods/ klasöründeki üretilmiş hesaplama metodlarının yüklenmesi,
+derlenmiş kodun önbelleklenmesi, tek seferlik doğrulama kayıtları ve
+CPU süresi / bellek sınırlı alt süreçte çalıştırılması
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import marshal
+import hashlib
+import threading
+import multiprocessing
+from pathlib import Path
+from types import CodeType
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: sadece duvar saati zaman aşımı uygulanır
+    resource = None
+
+
+def fonksiyon_adlari(aktivite: str):
+    """Metodun aranacağı adlar (prompt '__' önekini istiyor, sistem '_' önekini kullanıyor)"""
+    return (f'_{aktivite}_puani_hesapla', f'__{aktivite}_puani_hesapla')
+
+
+# Kaynak özeti -> derlenmiş kod (süreç içindeki tüm sistem örnekleri paylaşır)
+_derlenmis_kodlar: Dict[str, CodeType] = {}
+_derleme_kilidi = threading.Lock()
+
+
+class DinamikMetodKaydi:
+    """Üretilmiş hesaplama metodlarının kaydı
+
+    - <aktivite>_method.py dosyaları başlangıçta okunur (katsayı başlık satırından)
+    - Kaynak kod SHA-256 özetiyle bir kez derlenir; derlenmiş kod bellekte ve
+      veri_cache altında (marshal, Python sürümüne özel) tutulur
+    - Doğrulama sonucu kaynak özeti + veri şeması için bir kez kaydedilir
+    """
+
+    DOSYA_SONEKI = '_method.py'
+    KATSAYI_DESENI = re.compile(r'^#\s*Katsayı:\s*([0-9.]+)\s*$', re.MULTILINE)
+
+    def __init__(self, metod_klasoru, onbellek_klasoru):
+        self.metod_klasoru = Path(metod_klasoru)
+        self.derleme_klasoru = Path(onbellek_klasoru) / 'dinamik_metodlar'
+        self.dogrulama_dosyasi = Path(onbellek_klasoru) / 'dinamik_metod_dogrulama.json'
+        self._dogrulamalar = None
+
+    @staticmethod
+    def kaynak_ozeti(kaynak: str) -> str:
+        return hashlib.sha256(kaynak.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _atomik_yaz(yol: Path, yaz):
+        yol.parent.mkdir(parents=True, exist_ok=True)
+        gecici_yol = yol.with_name(f'{yol.name}.{os.getpid()}.tmp')
+        yaz(gecici_yol)
+        os.replace(gecici_yol, yol)
+
+    # Metod dosyaları
+    def _kayit_olustur(self, aktivite: str, dosya: Path, kaynak: str) -> Dict:
+        katsayi = self.KATSAYI_DESENI.search(kaynak)
+        return {
+            'aktivite': aktivite,
+            'dosya': dosya,
+            'kaynak': kaynak,
+            'ozet': self.kaynak_ozeti(kaynak),
+            'katsayi': float(katsayi.group(1)) if katsayi else None
+        }
+
+    def kayitli_metod(self, aktivite: str) -> Optional[Dict]:
+        """Aktivite için kaydedilmiş metod (yoksa None)"""
+        dosya = self.metod_klasoru / f'{aktivite}{self.DOSYA_SONEKI}'
+        if not dosya.exists():
+            return None
+        try:
+            with open(dosya, 'r', encoding='utf-8') as f:
+                return self._kayit_olustur(aktivite, dosya, f.read())
+        except Exception as e:
+            print(f"⚠️ Kayıtlı metod okunamadı ({dosya.name}): {e}")
+            return None
+
+    def kayitli_metodlar(self) -> Dict[str, Dict]:
+        """dynamic_methods/ altındaki tüm kayıtlı metodlar: aktivite -> kayıt"""
+        kayitlar = {}
+        for dosya in sorted(self.metod_klasoru.glob(f'*{self.DOSYA_SONEKI}')):
+            aktivite = dosya.name[:-len(self.DOSYA_SONEKI)]
+            kayit = self.kayitli_metod(aktivite)
+            if kayit is not None:
+                kayitlar[aktivite] = kayit
+        return kayitlar
+
+    def kaydet(self, aktivite: str, python_kodu: str, katsayi: float) -> Dict:
+        """Üretilen kodu başlık satırlarıyla birlikte atomik olarak kaydet"""
+        kaynak = (f"# {aktivite.title()} aktivitesi için Claude tarafından oluşturulan hesaplama metodu\n"
+                  f"# Katsayı: {katsayi}\n\n"
+                  f"{python_kodu}")
+        dosya = self.metod_klasoru / f'{aktivite}{self.DOSYA_SONEKI}'
+
+        def yaz(yol):
+            with open(yol, 'w', encoding='utf-8') as f:
+                f.write(kaynak)
+
+        self._atomik_yaz(dosya, yaz)
+        return self._kayit_olustur(aktivite, dosya, kaynak)
+
+    # Derleme
+    def derle(self, kayit: Dict) -> CodeType:
+        """Kaynak özetine göre derlenmiş kodu döndür (bellek -> disk -> compile)"""
+        ozet = kayit['ozet']
+        with _derleme_kilidi:
+            kod = _derlenmis_kodlar.get(ozet)
+        if kod is not None:
+            return kod
+
+        yol = self.derleme_klasoru / f'{ozet[:40]}.{sys.implementation.cache_tag}.marshal'
+        if yol.exists():
+            try:
+                with open(yol, 'rb') as f:
+                    kod = marshal.load(f)
+            except Exception as e:
+                print(f"⚠️ Derlenmiş metod okunamadı ({yol.name}): {e}")
+                kod = None
+
+        if kod is None:
+            kod = compile(kayit['kaynak'], str(kayit['dosya']), 'exec')
+
+            def yaz(gecici_yol):
+                with open(gecici_yol, 'wb') as f:
+                    marshal.dump(kod, f)
+
+            try:
+                self._atomik_yaz(yol, yaz)
+            except Exception as e:
+                print(f"⚠️ Derlenmiş metod yazılamadı ({yol.name}): {e}")
+
+        with _derleme_kilidi:
+            _derlenmis_kodlar[ozet] = kod
+        return kod
+
+    # Doğrulama kayıtları
+    def _dogrulamalari_yukle(self) -> Dict:
+        if self._dogrulamalar is None:
+            self._dogrulamalar = {}
+            if self.dogrulama_dosyasi.exists():
+                try:
+                    with open(self.dogrulama_dosyasi, 'r', encoding='utf-8') as f:
+                        self._dogrulamalar = json.load(f)
+                except Exception as e:
+                    print(f"⚠️ Metod doğrulama kayıtları okunamadı: {e}")
+        return self._dogrulamalar
+
+    def dogrulama_sonucu(self, kaynak_ozeti: str, sema_ozeti: str) -> Optional[Dict]:
+        """Önceki doğrulama sonucu ({'gecerli': bool, 'hata': ...}) veya None"""
+        return self._dogrulamalari_yukle().get(f'{kaynak_ozeti}:{sema_ozeti}')
+
+    def dogrulama_kaydet(self, aktivite: str, kaynak_ozeti: str, sema_ozeti: str, hata: Optional[str]):
+        dogrulamalar = self._dogrulamalari_yukle()
+        dogrulamalar[f'{kaynak_ozeti}:{sema_ozeti}'] = {
+            'aktivite': aktivite,
+            'gecerli': hata is None,
+            'hata': hata,
+            'zaman': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+
+        def yaz(yol):
+            with open(yol, 'w', encoding='utf-8') as f:
+                json.dump(dogrulamalar, f, ensure_ascii=False, indent=2)
+
+        try:
+            self._atomik_yaz(self.dogrulama_dosyasi, yaz)
+        except Exception as e:
+            print(f"⚠️ Metod doğrulama kaydı yazılamadı: {e}")
+
+
+class DinamikMetodHatasi(RuntimeError):
+    """Metodun kendi hatası (istisna, eksik fonksiyon, beklenmeyen sonuç) - aynı kod ve veriyle tekrarlar"""
+
+
+class DinamikMetodSinirHatasi(RuntimeError):
+    """CPU/bellek sınırı aşıldı veya alt süreç sonlandı - makinenin o anki yüküne bağlı olabilir"""
+
+
+class DinamikMetodBaglami:
+    """Alt süreçte üretilmiş metoda 'self' olarak verilen salt veri nesnesi
+
+    Metodların kullanması beklenen alanlar (prompt'taki gereksinimler) kopyalanır;
+    sistemin geri kalanına (dosyalar, API anahtarı, diğer aktiviteler) erişim yoktur.
+    """
+
+    def __init__(self, aktivite: str, df, aktivite_katsayilari: Dict[str, float],
+                 kategori_katsayilar: Dict[str, Dict], il_kategorileri: Dict[str, Dict],
+                 nufus_bilgileri: Dict[str, Any]):
+        self.veriler = {aktivite: df}
+        self.aktivite_katsayilari = dict(aktivite_katsayilari)
+        self.kategori_katsayilar = dict(kategori_katsayilar)
+        self.il_kategorileri = dict(il_kategorileri)
+        self.nufus_bilgileri = dict(nufus_bilgileri)
+
+    def _nufus_verileri_yukle(self):
+        return self.nufus_bilgileri
+
+
+def sonucu_dizilere_cevir(aktivite: str, sonuc) -> Dict[str, Any]:
+    """{il: {'toplam_<aktivite>': puan, ...}} sonucunu sütun dizilerine çevir
+
+    Sayısal detaylar float64, diğerleri nesne dizisi olur; eksik detaylar NaN/None.
+    Beklenen biçimde olmayan sonuçlar ValueError verir.
+    """
+    import numpy as np
+
+    if not isinstance(sonuc, Mapping):
+        raise ValueError(f"sonuç sözlük değil ({type(sonuc).__name__})")
+    toplam_anahtari = f'toplam_{aktivite}'
+    iller = []
+    sutun_adlari = {toplam_anahtari: None}
+    for il, detay in sonuc.items():
+        if not isinstance(detay, Mapping) or toplam_anahtari not in detay:
+            raise ValueError(f"'{il}' için '{toplam_anahtari}' değeri yok")
+        iller.append(str(il))
+        sutun_adlari.update(dict.fromkeys(detay))
+
+    sutunlar = {}
+    for ad in sutun_adlari:
+        degerler = [detay.get(ad) for detay in sonuc.values()]
+        try:
+            sutunlar[ad] = np.asarray(degerler, dtype=np.float64)
+        except (TypeError, ValueError):
+            if ad == toplam_anahtari:
+                raise ValueError(f"'{toplam_anahtari}' değerleri sayısal değil")
+            sutunlar[ad] = np.array(degerler, dtype=object)
+    return {'iller': iller, 'sutunlar': sutunlar}
+
+
+def _alt_surecte_calistir(baglanti, kod_baytlari: bytes, aktivite: str, baglam: DinamikMetodBaglami,
+                          cpu_siniri: int, bellek_siniri_mb: int):
+    """Alt süreç giriş noktası: sınırları uygula, metodu çalıştır, dizileri geri gönder"""
+    try:
+        if resource is not None:
+            if cpu_siniri:
+                resource.setrlimit(resource.RLIMIT_CPU, (cpu_siniri, cpu_siniri + 1))
+            if bellek_siniri_mb:
+                sinir = bellek_siniri_mb * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (sinir, sinir))
+
+        import numpy as np
+        import pandas as pd
+
+        isim_alani = {'self': baglam, 'pd': pd, 'np': np, 'json': json}
+        exec(marshal.loads(kod_baytlari), isim_alani)
+        fonksiyon = next((isim_alani[ad] for ad in fonksiyon_adlari(aktivite)
+                          if callable(isim_alani.get(ad))), None)
+        if fonksiyon is None:
+            raise NameError(f"_{aktivite}_puani_hesapla fonksiyonu bulunamadı")
+
+        diziler = sonucu_dizilere_cevir(aktivite, fonksiyon(baglam))
+        if resource is not None:
+            diziler['en_yuksek_bellek_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        baglanti.send(('tamam', diziler))
+    except BaseException as e:  # MemoryError dahil - hata mesajı ana sürece iletilir
+        try:
+            durum = 'sinir' if isinstance(e, MemoryError) else 'hata'
+            baglanti.send((durum, f"{type(e).__name__}: {e}"))
+        except Exception:
+            pass
+    finally:
+        baglanti.close()
+
+
+class DinamikMetodYurutucusu:
+    """Üretilmiş metodları CPU süresi ve bellek sınırlı alt süreçte çalıştırır
+
+    - CPU süresi RLIMIT_CPU, bellek RLIMIT_AS ile sınırlanır (Linux RSS sınırını
+      uygulamadığı için adres alanı sınırı kullanılır); duvar saati zaman aşımında
+      alt süreç sonlandırılır
+    - Sonuç il listesi + NumPy sütun dizileri olarak boru (pipe) üzerinden döner
+    - POSIX'te forkserver kullanılır: pandas/numpy bir kez yüklenir, her çalıştırma
+      hazır süreçten çatallanır
+    """
+
+    def __init__(self, zaman_asimi: float = 60.0, cpu_siniri: int = 60, bellek_siniri_mb: int = 2048):
+        self.zaman_asimi = zaman_asimi
+        self.cpu_siniri = cpu_siniri
+        self.bellek_siniri_mb = bellek_siniri_mb
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            self._baglam = multiprocessing.get_context('forkserver')
+            self._baglam.set_forkserver_preload(['numpy', 'pandas', __name__])
+        else:
+            self._baglam = multiprocessing.get_context('spawn')
+
+    def calistir(self, kod: CodeType, aktivite: str, baglam: DinamikMetodBaglami) -> Dict[str, Any]:
+        """Metodu alt süreçte çalıştır: {'iller': [...], 'sutunlar': {ad: dizi}, 'en_yuksek_bellek_kb': ...}
+
+        Zaman aşımında TimeoutError, CPU/bellek sınırı aşımında DinamikMetodSinirHatasi,
+        metodun kendi hatasında DinamikMetodHatasi verir (ikisi de RuntimeError).
+        """
+        alici, gonderici = self._baglam.Pipe(duplex=False)
+        surec = self._baglam.Process(
+            target=_alt_surecte_calistir,
+            args=(gonderici, marshal.dumps(kod), aktivite, baglam, self.cpu_siniri, self.bellek_siniri_mb),
+            daemon=True
+        )
+        surec.start()
+        gonderici.close()
+        try:
+            if not alici.poll(self.zaman_asimi):
+                raise TimeoutError(f"{self.zaman_asimi:g} sn içinde tamamlanmadı")
+            try:
+                durum, veri = alici.recv()
+            except EOFError:
+                surec.join(1)
+                raise DinamikMetodSinirHatasi(f"alt süreç sonlandı (çıkış kodu {surec.exitcode})")
+        finally:
+            alici.close()
+            if surec.is_alive():
+                surec.kill()
+            surec.join()
+
+        if durum == 'sinir':
+            raise DinamikMetodSinirHatasi(veri)
+        if durum != 'tamam':
+            raise DinamikMetodHatasi(veri)
+        return veri
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AK Parti Dinamik Puanlama Sistemi - LLM İstemcisi
+Yeni aktivite analizi için eşzamanlı, tekrar denemeli ve önbellekli API çağrıları
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import asyncio
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+import openai
+
+
+class LLMIstegi(NamedTuple):
+    """Tek bir sohbet tamamlama isteği
+
+    onbellek_anahtari çağıran tarafından verilir (ör. aktivite şeması + katsayı);
+    aynı anahtarlı istek bir kez yanıtlandıktan sonra API tekrar çağrılmaz.
+    """
+    onbellek_anahtari: str
+    mesajlar: List[Dict[str, str]]
+    sicaklik: float = 0.3
+
+
+# Geçici hatalar tekrar denenir; anahtar/istek hataları denenmez
+TEKRAR_DENENECEK_HATALAR = (
+    openai.error.Timeout,
+    openai.error.APIError,
+    openai.error.APIConnectionError,
+    openai.error.RateLimitError,
+    openai.error.ServiceUnavailableError,
+    openai.error.TryAgain,
+    asyncio.TimeoutError
+)
+
+
+class LLMIstemcisi:
+    """openai.ChatCompletion.acreate üzerine asenkron istemci katmanı
+
+    - Tüm istekler asyncio.gather ile eşzamanlı gönderilir (eşzamanlılık sınırlı)
+    - Geçici hatalarda üstel bekleme ile tekrar denenir, her deneme zaman aşımına tabidir
+    - Başarılı yanıtlar diske yazılır; aynı anahtarla tekrar çalıştırmada API çağrılmaz
+    - api_base ile yerel bir taklit (stub) sunucuya yönlendirilebilir
+    """
+
+    def __init__(self, api_key: Optional[str], onbellek_klasoru, model: str = "gpt-4",
+                 api_base: Optional[str] = None, zaman_asimi: float = 60.0, deneme_sayisi: int = 3,
+                 eszamanli_istek: int = 4, temel_bekleme: float = 1.0, max_bekleme: float = 30.0):
+        self.api_key = api_key
+        self.onbellek_klasoru = Path(onbellek_klasoru)
+        self.model = model
+        self.api_base = api_base
+        self.zaman_asimi = zaman_asimi
+        self.deneme_sayisi = max(1, deneme_sayisi)
+        self.eszamanli_istek = max(1, eszamanli_istek)
+        self.temel_bekleme = temel_bekleme
+        self.max_bekleme = max_bekleme
+        self.istatistikler = {'api_cagrisi': 0, 'onbellek_isabeti': 0, 'tekrar_deneme': 0, 'hata': 0}
+
+    @classmethod
+    def ortamdan_olustur(cls, api_key: Optional[str], onbellek_klasoru) -> 'LLMIstemcisi':
+        """Ayarları ortam değişkenlerinden oku (OPENAI_API_BASE, LLM_MODEL, LLM_ZAMAN_ASIMI, ...)"""
+        return cls(
+            api_key=api_key,
+            onbellek_klasoru=onbellek_klasoru,
+            model=os.environ.get('LLM_MODEL', 'gpt-4'),
+            api_base=os.environ.get('OPENAI_API_BASE') or None,
+            zaman_asimi=float(os.environ.get('LLM_ZAMAN_ASIMI', '60')),
+            deneme_sayisi=int(os.environ.get('LLM_DENEME_SAYISI', '3')),
+            eszamanli_istek=int(os.environ.get('LLM_ESZAMANLI_ISTEK', '4'))
+        )
+
+    # Önbellek
+    def _onbellek_yolu(self, istek: LLMIstegi) -> Path:
+        """Anahtar, model ve sıcaklığa göre önbellek dosyası (model değişirse yeniden sorulur)"""
+        metin = json.dumps([istek.onbellek_anahtari, self.model, istek.sicaklik], ensure_ascii=False)
+        return self.onbellek_klasoru / f"{hashlib.sha256(metin.encode('utf-8')).hexdigest()[:40]}.json"
+
+    def _onbellekten_oku(self, istek: LLMIstegi) -> Optional[str]:
+        yol = self._onbellek_yolu(istek)
+        if not yol.exists():
+            return None
+        try:
+            with open(yol, 'r', encoding='utf-8') as f:
+                return json.load(f)['yanit']
+        except Exception as e:
+            print(f"⚠️ LLM önbelleği okunamadı ({yol.name}): {e}")
+            return None
+
+    def _onbellege_yaz(self, istek: LLMIstegi, yanit: str):
+        """Yanıtı atomik olarak yaz (yarım kalan dosya okunmaz)"""
+        yol = self._onbellek_yolu(istek)
+        try:
+            yol.parent.mkdir(parents=True, exist_ok=True)
+            gecici_yol = yol.with_suffix(f'.{os.getpid()}.tmp')
+            with open(gecici_yol, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'anahtar': istek.onbellek_anahtari,
+                    'model': self.model,
+                    'zaman': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'yanit': yanit
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(gecici_yol, yol)
+        except Exception as e:
+            print(f"⚠️ LLM önbelleğine yazılamadı ({yol.name}): {e}")
+
+    # API çağrıları
+    async def _istek_gonder(self, istek: LLMIstegi, sinirlayici: asyncio.Semaphore) -> Optional[str]:
+        """Tek isteği önbellek -> API (tekrar denemeli) sırasıyla yanıtla; başarısızsa None"""
+        yanit = self._onbellekten_oku(istek)
+        if yanit is not None:
+            self.istatistikler['onbellek_isabeti'] += 1
+            return yanit
+
+        if not self.api_key:
+            return None
+
+        for deneme in range(self.deneme_sayisi):
+            try:
+                async with sinirlayici:
+                    self.istatistikler['api_cagrisi'] += 1
+                    cevap = await asyncio.wait_for(
+                        openai.ChatCompletion.acreate(
+                            model=self.model,
+                            messages=istek.mesajlar,
+                            temperature=istek.sicaklik,
+                            api_key=self.api_key,
+                            api_base=self.api_base,
+                            request_timeout=self.zaman_asimi
+                        ),
+                        timeout=self.zaman_asimi
+                    )
+                yanit = cevap.choices[0].message.content
+                self._onbellege_yaz(istek, yanit)
+                return yanit
+            except TEKRAR_DENENECEK_HATALAR as e:
+                if deneme + 1 >= self.deneme_sayisi:
+                    print(f"❌ LLM isteği {self.deneme_sayisi} denemede başarısız: {type(e).__name__}: {e}")
+                    break
+                bekleme = min(self.max_bekleme, self.temel_bekleme * 2 ** deneme) * random.uniform(0.5, 1.0)
+                self.istatistikler['tekrar_deneme'] += 1
+                print(f"🔁 LLM isteği tekrar denenecek ({deneme + 1}/{self.deneme_sayisi}, {bekleme:.1f} sn): {type(e).__name__}")
+                await asyncio.sleep(bekleme)
+            except Exception as e:
+                print(f"❌ LLM isteği hatası: {type(e).__name__}: {e}")
+                break
+
+        self.istatistikler['hata'] += 1
+        return None
+
+    async def atoplu_tamamla(self, istekler: List[LLMIstegi]) -> List[Optional[str]]:
+        """Tüm istekleri eşzamanlı yanıtla (sonuçlar istek sırasıyla, başarısızlar None)"""
+        sinirlayici = asyncio.Semaphore(self.eszamanli_istek)
+        return list(await asyncio.gather(*(self._istek_gonder(istek, sinirlayici) for istek in istekler)))
+
+    def toplu_tamamla(self, istekler: List[LLMIstegi]) -> List[Optional[str]]:
+        """atoplu_tamamla'nın senkron karşılığı (çalışan bir olay döngüsü varsa ayrı iş parçacığında)"""
+        if not istekler:
+            return []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.atoplu_tamamla(istekler))
+        with ThreadPoolExecutor(max_workers=1) as havuz:
+            return havuz.submit(asyncio.run, self.atoplu_tamamla(istekler)).result()
+
+    def tamamla(self, istek: LLMIstegi) -> Optional[str]:
+        """Tek istek için senkron yanıt"""
+        return self.toplu_tamamla([istek])[0]
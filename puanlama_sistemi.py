@@ -6,9 +6,18 @@ AK Parti 81 İl Adil Puanlama Sistemi
 """
 
 import pandas as pd
+import numpy as np
 import warnings
 import os
 
+try:
+    from standardize_provinces import standardize_province_codes
+except ImportError:  # Standartlaştırma modülü yoksa İL değerleri olduğu gibi kullanılır
+    standardize_province_codes = None
+
+# Plaka kodlu il boyutu ve hizalı aktivite puanları dinamik sistemle ortaktır
+from sistem import AktivitePuanlari, IlBoyutu, PLAKA_IL_BOYUTU
+
 warnings.filterwarnings('ignore')
 
 class AKPartiPuanlamaSistemi:
@@ -38,6 +47,9 @@ class AKPartiPuanlamaSistemi:
         self.il_kategorileri = {}
         self.kategori_katsayilar = {}
         self.sonuclar = {}
+        self.il_boyutu = None  # plaka kodu yoksa üyelik verisindeki illerden kurulan boyut
+        self.puan_matrisi = None  # il boyutu × aktivite ham puan dizisi (genel_puanlama_hesapla)
+        self.puan_maskesi = None  # il boyutu × aktivite veri maskesi
         self.nufus_bilgileri = None  # Cache için
         
         # Klasör oluştur
@@ -54,6 +66,10 @@ class AKPartiPuanlamaSistemi:
             self.veriler['danisma'] = pd.read_csv('data/Danışma_Meclisi.csv', encoding='utf-8')
             self.veriler['bayrak'] = pd.read_csv('data/Bayrak_Çalışması.csv', encoding='utf-8')
             
+            # İl isimlerini bellekte standartlaştır (dosyalar değiştirilmez)
+            for aktivite, df in self.veriler.items():
+                self.veriler[aktivite] = self._il_isimlerini_standartlastir(df)
+            
             # Veri temizleme
             self._veri_temizle()
             
@@ -64,6 +80,15 @@ class AKPartiPuanlamaSistemi:
             print(f"❌ Veri yükleme hatası: {e}")
             return False
     
+    @staticmethod
+    def _il_isimlerini_standartlastir(df):
+        """İL sütununu kanonik isimlere çevir ve plaka kodunu İL_KODU sütununa ekle"""
+        if 'İL' not in df.columns or standardize_province_codes is None:
+            return df
+        df = df.copy()
+        df['İL'], df['İL_KODU'] = standardize_province_codes(df['İL'])
+        return df
+    
     def _veri_temizle(self):
         """Veri temizleme ve düzeltme işlemleri"""
         
@@ -106,7 +131,7 @@ class AKPartiPuanlamaSistemi:
             return self.nufus_bilgileri
         
         try:
-            nufus_df = pd.read_csv('data/il_ilçe_nüfus.csv', encoding='utf-8')
+            nufus_df = self._il_isimlerini_standartlastir(pd.read_csv('data/il_ilçe_nüfus.csv', encoding='utf-8'))
             self.nufus_bilgileri = dict(zip(nufus_df['İL'], nufus_df['NÜFUS']))
         except Exception as e:
             print(f"⚠️ il_ilçe_nüfus.csv bulunamadı: {e}")
@@ -181,6 +206,18 @@ class AKPartiPuanlamaSistemi:
         
         print("✅ İl kategorileri ve katsayılar belirlendi")
     
+    def _il_boyutu_al(self) -> IlBoyutu:
+        """Aktivite puanlarının hizalandığı il boyutu (plaka kodlu 81 il)
+        
+        Standartlaştırma modülü yoksa boyut üyelik verisindeki illerden kurulur.
+        """
+        if PLAKA_IL_BOYUTU is not None:
+            return PLAKA_IL_BOYUTU
+        iller = list(self.veriler['uyelik']['İL'].unique())
+        if self.il_boyutu is None or list(self.il_boyutu.adlar) != iller:
+            self.il_boyutu = IlBoyutu(iller)
+        return self.il_boyutu
+    
     def uyelik_puani_hesapla(self):
         """İyileştirilmiş Üyelik Puanlaması - 40 Puan"""
         puanlar = {}
@@ -261,7 +298,7 @@ class AKPartiPuanlamaSistemi:
                 'toplam_uyelik': toplam_uyelik
             }
         
-        return puanlar
+        return AktivitePuanlari.sozlukten(self._il_boyutu_al(), 'uyelik', puanlar)
     
     def danisma_puani_hesapla(self):
         """İyileştirilmiş Danışma Meclisi Puanlaması - 30 Puan (İl + İlçe Ayrımı)"""
@@ -353,7 +390,7 @@ class AKPartiPuanlamaSistemi:
                 'toplam_birim': len(il_danisma)
             }
         
-        return puanlar
+        return AktivitePuanlari.sozlukten(self._il_boyutu_al(), 'danisma', puanlar)
     
     def ramazan_puani_hesapla(self):
         """Nüfus Oranı Bazlı Ramazan Puanlaması - 20 Puan (Nüfus Erişim Oranı)"""
@@ -441,7 +478,7 @@ class AKPartiPuanlamaSistemi:
                 'toplam_ramazan': toplam_ramazan
             }
         
-        return puanlar
+        return AktivitePuanlari.sozlukten(self._il_boyutu_al(), 'ramazan', puanlar)
     
     def bayrak_puani_hesapla(self):
         """Nüfus Bazlı Bayrak Puanlaması - 10 Puan (Nüfus Erişim Oranı)"""
@@ -507,7 +544,7 @@ class AKPartiPuanlamaSistemi:
                 'toplam_bayrak': toplam_bayrak
             }
         
-        return puanlar
+        return AktivitePuanlari.sozlukten(self._il_boyutu_al(), 'bayrak', puanlar)
     
     def genel_puanlama_hesapla(self):
         """Genel puanlamayı hesapla ve nüfus bazlı adaleti uygula"""
@@ -519,48 +556,63 @@ class AKPartiPuanlamaSistemi:
         ramazan_puanlari = self.ramazan_puani_hesapla()
         bayrak_puanlari = self.bayrak_puani_hesapla()
         
+        # Her aktivite il boyutuna hizalı puan dizisi döndürür: matris sütunları yan yana
+        # dizilir, verisi olmayan il maskede False, puanı 0 olur
+        aktiviteler = [uyelik_puanlari, danisma_puanlari, ramazan_puanlari, bayrak_puanlari]
+        ham = np.column_stack([puanlar.puan for puanlar in aktiviteler])
+        mevcut = np.column_stack([puanlar.mevcut for puanlar in aktiviteler])
+        
+        # Ham toplam = Final puan (genel toplamda katsayı uygulanmıyor) - aktivite sırasıyla toplanır
+        ham_toplam = np.zeros(len(ham))
+        for j in range(len(aktiviteler)):
+            ham_toplam += ham[:, j]
+        final_puan = np.minimum(self.MAX_TOPLAM_PUAN, ham_toplam)  # Maksimum puan sınırı
+        
+        self.puan_matrisi = ham
+        self.puan_maskesi = mevcut
+        
+        # Sonuçlar üyelik verisindeki il sırasıyla; il boyutundaki konumları plaka kodundan
+        uyelik_df = self.veriler['uyelik'].drop_duplicates('İL')
+        iller = uyelik_df['İL'].tolist()
+        il_kodlari = uyelik_df['İL_KODU'].to_numpy() if 'İL_KODU' in uyelik_df.columns else None
+        konumlar = self._il_boyutu_al().konumlar(iller, il_kodlari)
+        mevcut_uye = uyelik_df['MEVCUT ÜYE'].tolist()  # her il için ilk üyelik satırı
+        
         genel_sonuclar = {}
         
-        for il in self.veriler['uyelik']['İL'].unique():
-            # Alt puanları al
-            uyelik = uyelik_puanlari.get(il, {})
-            danisma = danisma_puanlari.get(il, {})
-            ramazan = ramazan_puanlari.get(il, {})
-            bayrak = bayrak_puanlari.get(il, {})
-            
-            # Ham puanlar
+        for i, il in enumerate(iller):
+            # Detaylar raporlara aynen aktarılır (aktivite puanı detaydaki orijinal tipiyle)
+            uyelik, danisma, ramazan, bayrak = (puanlar.get(il, {}) for puanlar in aktiviteler)
             uyelik_puan = uyelik.get('toplam_uyelik', 0)
             danisma_puan = danisma.get('toplam_danisma', 0)
             ramazan_puan = ramazan.get('toplam_ramazan', 0)
             bayrak_puan = bayrak.get('toplam_bayrak', 0)
             
-            # Ham toplam = Final puan (genel toplamda katsayı uygulanmıyor)
-            ham_toplam = uyelik_puan + danisma_puan + ramazan_puan + bayrak_puan
-            final_puan = min(self.MAX_TOPLAM_PUAN, ham_toplam)  # Maksimum puan sınırı
+            # İl boyutunda olmayan il (standartlaştırılamayan isim) hiçbir aktivitede puan almaz
+            konum = konumlar[i]
+            ham_puan = float(ham_toplam[konum]) if konum >= 0 else 0.0
+            final = float(final_puan[konum]) if konum >= 0 else 0.0
             
             # İl kategorisi bilgisi (sadece raporlama için)
             kategori_katsayi = self.kategori_katsayilar.get(il, {}).get('katsayi', 1.0)
             
-            # İl bilgileri
-            il_bilgi = self.veriler['uyelik'][self.veriler['uyelik']['İL'] == il].iloc[0]
-            
             genel_sonuclar[il] = {
                 'il_adi': il,
                 'il_kategorisi': self.il_kategorileri.get(il, {}).get('kategori', 'Bilinmiyor'),
                 'kategori_grup': self.kategori_katsayilar.get(il, {}).get('grup', 'Orta İl'),
                 'kategori_katsayi': kategori_katsayi,
                 'nufus': self.il_kategorileri.get(il, {}).get('nufus', 0),
-                'mevcut_uye': il_bilgi['MEVCUT ÜYE'],
+                'mevcut_uye': mevcut_uye[i],
                 
                 # Ham puanlar
                 'uyelik_puan': uyelik_puan,
                 'danisma_puan': danisma_puan,
                 'ramazan_puan': ramazan_puan,
                 'bayrak_puan': bayrak_puan,
-                'ham_toplam': ham_toplam,
+                'ham_toplam': ham_puan,
                 
                 # Final
-                'final_puan': final_puan,
+                'final_puan': final,
                 
                 # Detaylar
                 'uyelik_detay': uyelik,
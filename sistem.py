@@ -6,15 +6,488 @@ AK Parti Dinamik Puanlama Sistemi
 """
 
 import pandas as pd
+import numpy as np
 import warnings
 import os
 import json
-from typing import Dict, List, Optional, Any
+import time
+import hashlib
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 import openai
 from pathlib import Path
 
+try:
+    from standardize_provinces import standardize_province_codes, PROVINCE_PLATE_CODES
+except ImportError:  # Standartlaştırma modülü yoksa İL değerleri olduğu gibi kullanılır
+    standardize_province_codes = None
+    PROVINCE_PLATE_CODES = None
+
 warnings.filterwarnings('ignore')
 
+class IlReferansTablosu:
+    """İl referans tablosu: nüfus, ilçe sayısı, kategori ve kategori katsayısı
+    
+    Nüfus dosyasından bir kez oluşturulur ve değiştirilemez; aynı süreçteki tüm
+    sistem örnekleri ve web istekleri tarafından paylaşılır (bkz. il_referans_tablosu_al).
+    """
+    
+    def __init__(self, kayitlar: Dict[str, Dict], ozet: str, esikler, kategori_katsayilari: Dict[str, float],
+                 varsayilan_nufus: int, il_kodlari: Optional[Dict[str, int]] = None):
+        self._esikler = tuple(esikler)  # (mega, büyük, orta)
+        self._kategori_katsayilari = MappingProxyType(dict(kategori_katsayilari))
+        self._varsayilan_nufus = varsayilan_nufus
+        self.kayitlar = MappingProxyType({il: MappingProxyType(kayit) for il, kayit in kayitlar.items()})
+        self.nufus = MappingProxyType({il: kayit['nufus'] for il, kayit in kayitlar.items()})
+        self.ozet = ozet
+        
+        # Plaka koduyla indekslenen nüfus dizisi (0: il değil / bilinmiyor -> varsayılan nüfus)
+        self.nufus_dizisi = np.full(82, float(varsayilan_nufus))
+        for il, kod in (il_kodlari or {}).items():
+            if kod > 0 and il in kayitlar:
+                self.nufus_dizisi[kod] = kayitlar[il]['nufus']
+        self.nufus_dizisi.setflags(write=False)
+    
+    def kategori_bul(self, nufus) -> str:
+        """Nüfusa göre il kategorisi"""
+        mega_esik, buyuk_esik, orta_esik = self._esikler
+        if nufus >= mega_esik:
+            return "Mega İl"
+        elif nufus >= buyuk_esik:
+            return "Büyük İl"
+        elif nufus >= orta_esik:
+            return "Orta İl"
+        return "Küçük İl"
+    
+    def _kayit_olustur(self, nufus, ilce_sayisi=None) -> Dict:
+        kategori = self.kategori_bul(nufus)
+        return {
+            'nufus': nufus,
+            'ilce_sayisi': ilce_sayisi,
+            'kategori': kategori,
+            'katsayi': self._kategori_katsayilari.get(kategori, 1.15)
+        }
+    
+    def kayit(self, il: str) -> Mapping:
+        """İlin referans kaydı (tabloda yoksa varsayılan nüfusla)"""
+        kayit = self.kayitlar.get(il)
+        if kayit is None:
+            kayit = MappingProxyType(self._kayit_olustur(self._varsayilan_nufus))
+        return kayit
+    
+    def nufus_dizisi_al(self, il_kodlari, iller=None) -> np.ndarray:
+        """Satırların nüfusunu plaka kodundan tek dizi erişimiyle eşleştir
+        
+        Kodu 0 olan satırlar (standartlaştırılamayan isimler) verilirse il adıyla aranır.
+        """
+        il_kodlari = np.asarray(il_kodlari, dtype=np.int64)
+        nufus = self.nufus_dizisi[il_kodlari]
+        bilinmeyen = il_kodlari == 0
+        if iller is not None and bilinmeyen.any():
+            nufus[bilinmeyen] = [self.nufus.get(il, self._varsayilan_nufus)
+                                 for il in np.asarray(iller, dtype=object)[bilinmeyen]]
+        return nufus
+    
+    @classmethod
+    def dosyadan_yukle(cls, dosya_yolu, esikler, kategori_katsayilari: Dict[str, float],
+                       varsayilan_nufus: int) -> 'IlReferansTablosu':
+        """İL, İLÇE_SAYISI, NÜFUS sütunlu CSV'den tabloyu oluştur (il isimleri standartlaştırılır)"""
+        with open(dosya_yolu, 'rb') as f:
+            icerik = f.read()
+        nufus_df = pd.read_csv(dosya_yolu, encoding='utf-8')
+        
+        il_kodlari = {}
+        if standardize_province_codes is not None:
+            nufus_df['İL'], kodlar = standardize_province_codes(nufus_df['İL'])
+            il_kodlari = dict(zip(nufus_df['İL'], kodlar.tolist()))
+        
+        tablo = cls({}, hashlib.sha256(icerik).hexdigest(), esikler, kategori_katsayilari, varsayilan_nufus)
+        ilce_sayilari = nufus_df['İLÇE_SAYISI'] if 'İLÇE_SAYISI' in nufus_df.columns else [None] * len(nufus_df)
+        kayitlar = {
+            il: tablo._kayit_olustur(nufus, ilce_sayisi)
+            for il, nufus, ilce_sayisi in zip(nufus_df['İL'], nufus_df['NÜFUS'], ilce_sayilari)
+        }
+        return cls(kayitlar, tablo.ozet, esikler, kategori_katsayilari, varsayilan_nufus, il_kodlari)
+
+
+# Süreç genelinde il referans tabloları: (dosya, eşikler) -> ((mtime, boyut), tablo)
+_il_referans_tablolari = {}
+_il_referans_kilidi = threading.Lock()
+
+
+def il_referans_tablosu_al(dosya_yolu, esikler, kategori_katsayilari: Dict[str, float],
+                           varsayilan_nufus: int) -> IlReferansTablosu:
+    """Paylaşılan il referans tablosunu döndür; dosya değiştiyse (mtime/boyut) yeniden yükle
+    
+    Dosya yoksa FileNotFoundError fırlatır.
+    """
+    yol = str(Path(dosya_yolu).resolve())
+    durum = os.stat(yol)
+    imza = (durum.st_mtime_ns, durum.st_size)
+    anahtar = (yol, tuple(esikler), tuple(sorted(kategori_katsayilari.items())), varsayilan_nufus)
+    
+    with _il_referans_kilidi:
+        kayit = _il_referans_tablolari.get(anahtar)
+        if kayit is not None and kayit[0] == imza:
+            return kayit[1]
+        
+        tablo = IlReferansTablosu.dosyadan_yukle(yol, esikler, kategori_katsayilari, varsayilan_nufus)
+        _il_referans_tablolari[anahtar] = (imza, tablo)
+        return tablo
+
+
+class IlBoyutu:
+    """Sabit il boyutu - tüm aktivite puan dizilerinin hizalandığı eksen
+    
+    Varsayılan boyut 81 ilin plaka kodu sırasıdır (konum = kod - 1); il adları
+    ve kodları dizi olarak tutulur. Satırlar plaka kodundan (İL_KODU) ya da
+    kodu olmayan verilerde il adından konuma çevrilir.
+    """
+    
+    def __init__(self, adlar: List[str], kodlar: Optional[List[int]] = None):
+        self.adlar = np.array(list(adlar), dtype=object)
+        self.kodlar = np.asarray(kodlar if kodlar is not None else range(1, len(self.adlar) + 1), dtype=np.int64)
+        self._ad_konumlari = {ad: i for i, ad in enumerate(self.adlar)}
+        self._kod_konumlari = np.full(int(self.kodlar.max(initial=0)) + 1, -1, dtype=np.int64)
+        self._kod_konumlari[self.kodlar] = np.arange(len(self.adlar))
+        self.ozet = hashlib.sha256(json.dumps([list(map(str, self.adlar)), self.kodlar.tolist()],
+                                              ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def plaka_kodlarindan(cls, plaka_kodlari: Dict[str, int]) -> 'IlBoyutu':
+        """İl adı -> plaka kodu sözlüğünden kod sırasıyla boyut kur"""
+        sirali = sorted(plaka_kodlari.items(), key=lambda kayit: kayit[1])
+        return cls([il for il, _ in sirali], [kod for _, kod in sirali])
+    
+    def __len__(self) -> int:
+        return len(self.adlar)
+    
+    def konum(self, il) -> int:
+        """İl adının boyuttaki konumu (yoksa -1)"""
+        return self._ad_konumlari.get(il, -1)
+    
+    def konumlar(self, iller, il_kodlari=None) -> np.ndarray:
+        """Satırların boyuttaki konumları - önce plaka kodu, kodu olmayanlarda il adı (yoksa -1)"""
+        iller = np.asarray(iller, dtype=object)
+        konumlar = np.full(len(iller), -1, dtype=np.int64)
+        if il_kodlari is not None:
+            kodlar = np.asarray(il_kodlari, dtype=np.int64)
+            gecerli = (kodlar > 0) & (kodlar < len(self._kod_konumlari))
+            konumlar[gecerli] = self._kod_konumlari[kodlar[gecerli]]
+        eksik = konumlar < 0
+        if eksik.any():
+            konumlar[eksik] = [self._ad_konumlari.get(il, -1) for il in iller[eksik]]
+        return konumlar
+
+
+# Plaka kodlu 81 il boyutu (standartlaştırma modülü yoksa boyut verideki illerden kurulur)
+PLAKA_IL_BOYUTU = IlBoyutu.plaka_kodlarindan(PROVINCE_PLATE_CODES) if PROVINCE_PLATE_CODES else None
+
+
+def _python_degeri(deger):
+    """NumPy skalerini Python değerine çevir (detay sözlükleri için)"""
+    return deger.item() if isinstance(deger, np.generic) else deger
+
+
+class AktivitePuanlari(Mapping):
+    """Bir aktivitenin il boyutuna hizalı puanları
+    
+    puan dizisi ilin toplam aktivite puanı, mevcut maskesi ilin bu aktivitede
+    sonucu olup olmadığıdır (eksik il = False, puan 0). Detaylar vektörel
+    metodlarda sütun dizileri, döngüsel/dinamik metodlarda il sözlükleri olarak
+    tutulur; eski il -> detay sözlüğü erişimi Mapping arayüzüyle korunur.
+    """
+    
+    def __init__(self, boyut: IlBoyutu, toplam_anahtari: str, puan: np.ndarray, mevcut: np.ndarray,
+                 sutunlar: Optional[Dict[str, np.ndarray]] = None, detay_var: Optional[np.ndarray] = None,
+                 sozlukler: Optional[Dict[int, Dict]] = None):
+        self.boyut = boyut
+        self.toplam_anahtari = toplam_anahtari
+        self.puan = puan
+        self.mevcut = mevcut
+        self.sutunlar = sutunlar or {}
+        self.detay_var = detay_var  # False olan illerde detay sadece toplam puandır
+        self.sozlukler = sozlukler
+        self.katsayi = None  # puanların hesaplandığı aktivite katsayısı (genel puanlamada atanır)
+    
+    @staticmethod
+    def _atlananlari_bildir(aktivite: str, iller):
+        atlanan = sorted({str(il) for il in iller if not pd.isna(il)})
+        if atlanan:
+            print(f"⚠️ {aktivite}: il boyutunda olmayan isimler atlandı: {', '.join(atlanan[:10])}")
+    
+    @classmethod
+    def dizilerden(cls, boyut: IlBoyutu, aktivite: str, iller, konumlar: np.ndarray,
+                   sutunlar: Dict[str, Any], detay_var=None) -> 'AktivitePuanlari':
+        """Satır dizilerini boyuta hizala (aynı il birden fazla satırda geçerse son satır geçerli)"""
+        konumlar = np.asarray(konumlar, dtype=np.int64)
+        satirlar = np.flatnonzero(konumlar >= 0)
+        if len(satirlar) < len(konumlar):
+            cls._atlananlari_bildir(aktivite, np.asarray(iller, dtype=object)[konumlar < 0])
+        
+        ters = satirlar[::-1]
+        _, ilk = np.unique(konumlar[ters], return_index=True)
+        secili = ters[ilk]
+        hedef = konumlar[secili]
+        
+        mevcut = np.zeros(len(boyut), dtype=bool)
+        mevcut[hedef] = True
+        
+        hizali = {}
+        for ad, dizi in sutunlar.items():
+            dizi = np.asarray(dizi)
+            tam = np.full(len(boyut), None, dtype=object) if dizi.dtype == object else np.zeros(len(boyut), dtype=dizi.dtype)
+            tam[hedef] = dizi[secili]
+            hizali[ad] = tam
+        
+        toplam_anahtari = f'toplam_{aktivite}'
+        puan = np.where(mevcut, hizali[toplam_anahtari], 0).astype(float)
+        
+        detay = None
+        if detay_var is not None:
+            detay = np.zeros(len(boyut), dtype=bool)
+            detay[hedef] = np.asarray(detay_var, dtype=bool)[secili]
+        
+        return cls(boyut, toplam_anahtari, puan, mevcut, sutunlar=hizali, detay_var=detay)
+    
+    @classmethod
+    def sozlukten(cls, boyut: IlBoyutu, aktivite: str, puanlar: Dict[str, Dict]) -> 'AktivitePuanlari':
+        """il -> detay sözlüğü biçimindeki (döngüsel/dinamik metod) puanları boyuta hizala"""
+        toplam_anahtari = f'toplam_{aktivite}'
+        puan = np.zeros(len(boyut))
+        mevcut = np.zeros(len(boyut), dtype=bool)
+        sozlukler = {}
+        atlanan = []
+        for il, detay in puanlar.items():
+            i = boyut.konum(il)
+            if i < 0:
+                atlanan.append(il)
+                continue
+            puan[i] = detay.get(toplam_anahtari, 0)
+            mevcut[i] = True
+            sozlukler[i] = detay
+        cls._atlananlari_bildir(aktivite, atlanan)
+        return cls(boyut, toplam_anahtari, puan, mevcut, sozlukler=sozlukler)
+    
+    # Mapping arayüzü (eski il -> detay sözlüğü erişimi)
+    def __getitem__(self, il: str) -> Dict:
+        i = self.boyut.konum(il)
+        if i < 0 or not self.mevcut[i]:
+            raise KeyError(il)
+        if self.sozlukler is not None:
+            return self.sozlukler[i]
+        if self.detay_var is not None and not self.detay_var[i]:
+            return {self.toplam_anahtari: _python_degeri(self.puan[i])}
+        return {ad: _python_degeri(dizi[i]) for ad, dizi in self.sutunlar.items()}
+    
+    def __iter__(self):
+        return iter(self.boyut.adlar[self.mevcut].tolist())
+    
+    def __len__(self) -> int:
+        return int(self.mevcut.sum())
+    
+    def __contains__(self, il) -> bool:
+        i = self.boyut.konum(il)
+        return i >= 0 and bool(self.mevcut[i])
+
+
+class PuanSonuclari(Mapping):
+    """İl × aktivite puan matrisi - genel puanlamanın sonuç yapısı
+    
+    Satırlar iller, sütunlar aktivitelerdir; ham, normalize, ağırlık ve final
+    puanlar dizi olarak tutulur. Sıralama, yeniden ağırlıklandırma ve rapor
+    dizeler üzerinden yapılır. Eski sözlük biçimi (sonuclar[il]) sadece istendiğinde
+    oluşturulur, böylece mevcut kodlar değişmeden çalışır.
+    
+    il_kodlari satırların plaka kodları, mevcut ise il × aktivite veri maskesidir.
+    """
+    
+    def __init__(self, iller: List[str], aktiviteler: List[str], ham: np.ndarray,
+                 katsayilar: Dict[str, float], aktivite_puanlari: Dict[str, Dict],
+                 il_bilgileri: Dict[str, np.ndarray], il_kodlari: Optional[np.ndarray] = None,
+                 mevcut: Optional[np.ndarray] = None):
+        self.iller = list(iller)
+        self.il_kodlari = il_kodlari
+        self.mevcut = mevcut
+        self.aktiviteler = list(aktiviteler)
+        self.ham = ham
+        self.katsayilar = dict(katsayilar)
+        self.aktivite_puanlari = aktivite_puanlari  # il detayları için (lazy)
+        self.il_bilgileri = il_bilgileri  # kategori, grup, kategori_katsayi, nufus dizileri
+        self._il_sira = {il: i for i, il in enumerate(self.iller)}
+        self._hesapla()
+    
+    def _hesapla(self):
+        """Katsayılardan normalize, ağırlık, final ve toplam dizilerini hesapla"""
+        self.toplam_katsayi = sum(self.katsayilar.values())
+        aktivite_katsayilari = np.array([self.katsayilar.get(a, 1.0) for a in self.aktiviteler], dtype=float)
+        max_puanlar = aktivite_katsayilari * 10
+        
+        # Ham puanı 0-1 arasında normalize et (max puan 0 ise 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.normalize = np.where(max_puanlar > 0, np.minimum(self.ham / max_puanlar, 1.0), 0.0)
+        
+        # Toplam katsayı 0 ise (tüm katsayılar sıfırlanmış) ağırlıklar da 0
+        if self.toplam_katsayi > 0:
+            self.agirlik = np.array([self.katsayilar.get(a, 0) / self.toplam_katsayi * 100
+                                     for a in self.aktiviteler], dtype=float)
+        else:
+            self.agirlik = np.zeros(len(self.aktiviteler))
+        self.final = self.normalize * self.agirlik
+        
+        # Toplam puan (100 üzerinden) - aktivite sırasıyla toplanır
+        self.toplam_puan = np.zeros(len(self.iller))
+        for j in range(len(self.aktiviteler)):
+            self.toplam_puan += self.final[:, j]
+    
+    @classmethod
+    def olustur(cls, aktivite_puanlari: Dict[str, AktivitePuanlari], katsayilar: Dict[str, float],
+                il_kategorileri: Dict, kategori_katsayilar: Dict) -> 'PuanSonuclari':
+        """Boyuta hizalı aktivite puan dizilerini yığarak matrisi kur
+        
+        Satırlar en az bir aktivitede sonucu olan iller (boyut sırasıyla); bir
+        aktivitede eksik olan ilin puanı 0, maskesi False olur.
+        """
+        aktiviteler = list(aktivite_puanlari.keys())
+        if not aktiviteler:
+            return cls([], [], np.zeros((0, 0)), katsayilar, {}, {
+                'il_kategorisi': np.array([], dtype=object), 'kategori_grup': np.array([], dtype=object),
+                'kategori_katsayi': np.array([], dtype=float), 'nufus': np.array([], dtype=object)
+            }, np.array([], dtype=np.int64), np.zeros((0, 0), dtype=bool))
+        
+        boyut = aktivite_puanlari[aktiviteler[0]].boyut
+        tam_ham = np.column_stack([aktivite_puanlari[a].puan for a in aktiviteler])
+        tam_mevcut = np.column_stack([aktivite_puanlari[a].mevcut for a in aktiviteler])
+        
+        # Önbellekten gelen puanlar başka katsayıyla hesaplanmış olabilir; metodlar
+        # max_puan ile doğrusal olduğundan ham puan katsayı oranında ölçeklenir
+        olcekler = np.ones(len(aktiviteler))
+        for j, aktivite in enumerate(aktiviteler):
+            eski_katsayi = aktivite_puanlari[aktivite].katsayi
+            if eski_katsayi:
+                olcekler[j] = katsayilar.get(aktivite, 1.0) / eski_katsayi
+        
+        satirlar = np.flatnonzero(tam_mevcut.any(axis=1))
+        iller = boyut.adlar[satirlar].tolist()
+        ham = tam_ham[satirlar] * olcekler
+        
+        il_bilgileri = {
+            'il_kategorisi': np.array([il_kategorileri.get(il, {}).get('kategori', 'Bilinmiyor') for il in iller], dtype=object),
+            'kategori_grup': np.array([kategori_katsayilar.get(il, {}).get('grup', 'Orta İl') for il in iller], dtype=object),
+            'kategori_katsayi': np.array([kategori_katsayilar.get(il, {}).get('katsayi', 1.0) for il in iller], dtype=float),
+            'nufus': np.array([il_kategorileri.get(il, {}).get('nufus', 0) for il in iller], dtype=object)
+        }
+        return cls(iller, aktiviteler, ham, katsayilar, aktivite_puanlari, il_bilgileri,
+                   boyut.kodlar[satirlar], tam_mevcut[satirlar])
+    
+    def duz_veri(self) -> Dict:
+        """Yeniden ağırlıklandırma için gereken düz listeler/sözlükler (ör. web session'ında saklanır)
+        
+        Sınıf nesneleri ve aktivite detayları dahil edilmez; duz_veriden ile geri kurulur.
+        """
+        return {
+            'iller': list(self.iller),
+            'aktiviteler': list(self.aktiviteler),
+            'normalize': self.normalize.tolist(),
+            'katsayilar': {aktivite: float(katsayi) for aktivite, katsayi in self.katsayilar.items()},
+            'il_bilgileri': {ad: [_python_degeri(deger) for deger in dizi] for ad, dizi in self.il_bilgileri.items()}
+        }
+    
+    @classmethod
+    def duz_veriden(cls, veri: Dict) -> 'PuanSonuclari':
+        """duz_veri çıktısından sonuçları kur - ham puan normalize × max_puan, aktivite detayları boş"""
+        aktiviteler = veri['aktiviteler']
+        normalize = np.array(veri['normalize'], dtype=float).reshape(len(veri['iller']), len(aktiviteler))
+        max_puanlar = np.array([veri['katsayilar'].get(a, 1.0) for a in aktiviteler], dtype=float) * 10
+        il_bilgileri = {
+            ad: np.array(degerler, dtype=float if ad == 'kategori_katsayi' else object)
+            for ad, degerler in veri['il_bilgileri'].items()
+        }
+        return cls(veri['iller'], aktiviteler, normalize * max_puanlar, veri['katsayilar'], {}, il_bilgileri)
+    
+    # Mapping arayüzü (eski il -> sözlük erişimi)
+    def __getitem__(self, il: str) -> Dict:
+        i = self._il_sira[il]
+        kayit = {
+            'il_adi': il,
+            'il_kategorisi': self.il_bilgileri['il_kategorisi'][i],
+            'kategori_grup': self.il_bilgileri['kategori_grup'][i],
+            'kategori_katsayi': float(self.il_bilgileri['kategori_katsayi'][i]),
+            'nufus': self.il_bilgileri['nufus'][i],
+            'toplam_puan': float(self.toplam_puan[i]),  # 100 üzerinden
+            'toplam_katsayi': self.toplam_katsayi
+        }
+        for j, aktivite in enumerate(self.aktiviteler):
+            kayit[f'{aktivite}_ham_puan'] = float(self.ham[i, j])
+            kayit[f'{aktivite}_normalize_puan'] = float(self.normalize[i, j])
+            kayit[f'{aktivite}_agirlik'] = float(self.agirlik[j])
+            kayit[f'{aktivite}_final_puan'] = float(self.final[i, j])
+            kayit[f'{aktivite}_detay'] = self.aktivite_puanlari.get(aktivite, {}).get(il, {})
+        return kayit
+    
+    def __iter__(self):
+        return iter(self.iller)
+    
+    def __len__(self) -> int:
+        return len(self.iller)
+    
+    def __contains__(self, il) -> bool:
+        return il in self._il_sira
+    
+    def siralama(self) -> np.ndarray:
+        """Toplam puana göre azalan il indeksleri (eşitlikte ilk sıra korunur)"""
+        return np.argsort(-self.toplam_puan, kind='stable')
+    
+    def agirlikli_toplamlar(self, katsayilar: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Normalize matrisi yeni katsayılarla tek matris-vektör çarpımıyla ağırlıklandır
+        
+        Normalize puanlar katsayıdan bağımsızdır (metodlar max_puan ile doğrusal).
+        Verilmeyen aktiviteler mevcut katsayılarını korur; toplam katsayıya verisi
+        olmayan aktiviteler de dahildir.
+        """
+        yeni_katsayilar = dict(self.katsayilar)
+        yeni_katsayilar.update(katsayilar or {})
+        toplam_katsayi = sum(yeni_katsayilar.values())
+        if toplam_katsayi <= 0:
+            return np.zeros(len(self.iller))
+        
+        agirliklar = np.array([yeni_katsayilar.get(a, 0) / toplam_katsayi * 100
+                               for a in self.aktiviteler], dtype=float)
+        return self.normalize @ agirliklar
+    
+    def rapor_tablosu(self, aktiviteler: List[str]) -> pd.DataFrame:
+        """Genel performans raporu tablosu (sıralı, GENEL_SIRALAMA ile)"""
+        rapor = {
+            'İL': self.iller,
+            'İL_KATEGORİSİ': self.il_bilgileri['il_kategorisi'],
+            'KATEGORİ_GRUP': self.il_bilgileri['kategori_grup'],
+            'KATEGORİ_KATSAYI': self.il_bilgileri['kategori_katsayi'],
+            'NÜFUS': self.il_bilgileri['nufus'],
+            'TOPLAM_PUAN': np.round(self.toplam_puan, 2),  # 100 üzerinden
+            'TOPLAM_KATSAYI': np.full(len(self.iller), self.toplam_katsayi)
+        }
+        
+        sutun_sira = {aktivite: j for j, aktivite in enumerate(self.aktiviteler)}
+        for aktivite in aktiviteler:
+            j = sutun_sira.get(aktivite)
+            if j is not None:
+                ham, final, agirlik = np.round(self.ham[:, j], 1), np.round(self.final[:, j], 2), self.agirlik[j]
+            else:
+                # Sonuçta olmayan aktivite: puan 0, ağırlık katsayıdan
+                ham = final = np.zeros(len(self.iller))
+                katsayi = self.katsayilar.get(aktivite, 0)
+                agirlik = (katsayi / self.toplam_katsayi) * 100 if self.toplam_katsayi > 0 else 0
+            rapor[f'{aktivite.upper()}_HAM_PUAN'] = ham
+            rapor[f'{aktivite.upper()}_FINAL_PUAN'] = final
+            rapor[f'{aktivite.upper()}_AGIRLIK'] = np.full(len(self.iller), round(agirlik, 2))
+        
+        df_rapor = pd.DataFrame(rapor)
+        df_rapor = df_rapor.sort_values('TOPLAM_PUAN', ascending=False, kind='mergesort')
+        df_rapor['GENEL_SIRALAMA'] = range(1, len(df_rapor) + 1)
+        return df_rapor
+
 class DinamikPuanlamaSistemi:
     # İl kategorileri için nüfus eşikleri (mevcut sistemden)
     MEGA_IL_ESIK = 3000000
@@ -22,6 +495,9 @@ class DinamikPuanlamaSistemi:
     ORTA_IL_ESIK = 500000
     VARSAYILAN_NUFUS = 500000
     
+    # Nüfus dosyası adları (web/data'da Türkçe karaktersiz ad kullanılıyor)
+    NUFUS_DOSYA_ADLARI = ('il_ilçe_nüfus.csv', 'il_ilce_nufus.csv')
+    
     # Kategori katsayıları (mevcut sistemden)
     KATEGORI_KATSAYILARI = {
         "Mega İl": 1.0,      # En kolay (3M+ nüfus, büyük kaynak, altyapı)
@@ -38,8 +514,114 @@ class DinamikPuanlamaSistemi:
         'bayrak': 1.0       # Bayrak (10 puan -> 1.0 katsayı)
     }
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Dinamik Puanlama Sistemi"""
+    # Eşik tabloları: artan eşikler ve her aralığın çarpanı
+    # Çarpan listesi eşiklerden bir fazladır: ilk çarpan en düşük eşiğin altı içindir
+    # dynamic_configs/esik_tablolari.json ile kod değiştirmeden güncellenebilir
+    VARSAYILAN_ESIK_TABLOLARI = {
+        'uyelik_temel': {
+            'esikler': [10, 15, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+            'carpanlar': [0, 3/27, 6/27, 9/27, 12/27, 15/27, 17/27, 19/27, 21/27, 23/27, 25/27, 1.0]
+        },
+        'uyelik_mukemmellik': {
+            'esikler': [100, 120, 150, 200],
+            'carpanlar': [0, 2/8, 4/8, 6/8, 1.0]
+        },
+        'uyelik_yk': {
+            'esikler': [20, 40, 60, 80, 100],
+            'carpanlar': [0, 1/5, 2/5, 3/5, 4/5, 1.0]
+        },
+        'danisma': {
+            'esikler': [0.10, 0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 0.95],
+            'carpanlar': [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+        },
+        'ramazan_aktivite': {
+            'esikler': [1, 2, 4, 6, 8],
+            'carpanlar': [0, 1/5, 2/5, 3/5, 4/5, 1.0]
+        }
+    }
+    
+    # Bayrak çalışma türü bonus çarpanları (listede olmayan türler 0)
+    VARSAYILAN_CALISMA_TURU_CARPANLARI = {
+        'TOPLANTI': 1.0,
+        'DUYURU': 1/2
+    }
+    
+    # Ramazan aktivite çeşitliliği sütunları
+    RAMAZAN_AKTIVITE_SUTUNLARI = [
+        'GÖNÜL SOFRASI', 'SAHUR PROGRAMI', 'İFTAR PROGRAMI',
+        'ÇAT KAPI ZİYARET', 'YARDIM DAĞITIMI',
+        'ŞEHİT GAZİ AİLELERİ, STK, ESNAF, KIRAATHANE, YAŞLI, HASTA, ENGELLİ ZİYARETLERİ',
+        'CAMİ ÇALIŞMALARI', 'MAHALLE / KÖY, TAZİYE, MEZARLIK ZİYARETLERİ',
+        'ÜYE ARAMA VE MESAJ ÇALIŞMALARI'
+    ]
+    # Danışma dosyasında aranan ay adları ve akışlı okuma parça boyutu
+    AY_ADLARI = ['OCAK', 'ŞUBAT', 'MART', 'NİSAN', 'MAYIS', 'HAZİRAN',
+                 'TEMMUZ', 'AĞUSTOS', 'EYLÜL', 'EKİM', 'KASIM', 'ARALIK']
+    DANISMA_PARCA_BOYUTU = 5000
+    
+    # Yüklemede eklenen plaka kodu sütunu (il bazlı birleştirmelerin tamsayı anahtarı)
+    IL_KODU_SUTUNU = 'İL_KODU'
+    
+    # Başlık satırından aktivite tespiti için ayırt edici sütunlar (danışma: İLÇE + ay sütunları)
+    AKTIVITE_BASLIK_IMZALARI = {
+        'uyelik': ['YAPILAN YENİ ÜYE SAYISI', 'MEVCUT ÜYE'],
+        'ramazan': ['TOPLAM ULAŞILAN KİŞİ'],
+        'bayrak': ['BAYRAK ADEDİ']
+    }
+    
+    # Temizlenmiş veri önbelleği (anahtar: dosya içerik özeti + temizleme sürümü)
+    # Temizleme mantığı değiştiğinde sürümü artırın, eski önbellek kullanılmaz
+    VERI_ONBELLEK_KLASORU = 'veri_cache'
+    VERI_TEMIZLEME_SURUMU = 4
+    # Puanlama mantığı değiştiğinde artırın (diskteki aktivite puanları geçersiz olur)
+    PUANLAMA_SURUMU = 3
+    # Yeni aktivite dosyaları sadece manifestoda tanımlıysa işlenir; diğerleri inceleme kuyruğuna alınır
+    AKTIVITE_MANIFESTO_DOSYASI = 'aktivite_manifestosu.json'
+    INCELEME_KUYRUGU_DOSYASI = 'inceleme_kuyrugu.json'
+    # Üretilmiş dinamik metodlar bu kadar satırlık örnek veriyle bir kez doğrulanır
+    DINAMIK_METOD_ORNEK_SATIR = 20
+    # Üretilmiş metodlar alt süreçte çalışır: duvar saati (sn), CPU süresi (sn) ve bellek (MB) sınırları
+    DINAMIK_METOD_ZAMAN_ASIMI = 60
+    DINAMIK_METOD_CPU_SINIRI = 60
+    DINAMIK_METOD_BELLEK_SINIRI_MB = 2048
+    
+    # Bilinen aktivite dosyalarının okuma şeması - sayısal sütunlar binlik ayraçlı
+    # ("1,234") yazıldığı için okuma sırasında thousands=',' ile tiplenir
+    VERI_SEMALARI = {
+        'uyelik': {
+            'sayisal': ['YAPILMASI GEREKEN TOPLAM ÜYE', 'YÖNETİM KURULU YAPMASI GEREKEN ÜYE SAYISI',
+                        'YÖNETİM KURULU ÜYELERİ TARAFINDAN REFERANS OLUNAN YENİ ÜYE SAYISI',
+                        'YAPILAN YENİ ÜYE SAYISI', 'SİLİNEN  ÜYE SAYISI', 'MEVCUT ÜYE'],
+            'yuzde': ['HEDEFE ULAŞMA ORANI'],
+            'bos_sifir': True
+        },
+        'ramazan': {
+            'sayisal': RAMAZAN_AKTIVITE_SUTUNLARI + ['TOPLAM ULAŞILAN KİŞİ'],
+            'yuzde': [],
+            'bos_sifir': True
+        },
+        'bayrak': {
+            'sayisal': ['BAYRAK ADEDİ'],
+            'yuzde': [],
+            'bos_sifir': False
+        }
+    }
+    
+    def __init__(self, openai_api_key: Optional[str] = None, vektorel_hesaplama: bool = True,
+                 calisma_klasoru: Optional[str] = None, cikti_klasoru: Optional[str] = None):
+        """Dinamik Puanlama Sistemi
+        
+        Tüm dosya yolları calisma_klasoru'na (varsayılan: mevcut dizin) göre çözülür;
+        çalışma dizini değiştirilmediği için farklı klasörlerle paralel analiz yapılabilir.
+        """
+        # Çalışma alanı yolları
+        self.calisma_klasoru = Path(calisma_klasoru or os.getcwd()).resolve()
+        self.veri_klasoru = self.calisma_klasoru / 'data'
+        self.cikti_klasoru = Path(cikti_klasoru).resolve() if cikti_klasoru else self.calisma_klasoru / 'output_csv'
+        self.config_klasoru = self.calisma_klasoru / 'dynamic_configs'
+        self.metod_klasoru = self.calisma_klasoru / 'dynamic_methods'
+        self.onbellek_klasoru = self.calisma_klasoru / self.VERI_ONBELLEK_KLASORU
+        
         self.veriler = {}
         self.il_kategorileri = {}
         self.kategori_katsayilar = {}
@@ -47,19 +629,38 @@ class DinamikPuanlamaSistemi:
         self.nufus_bilgileri = None
         self.aktivite_katsayilari = self.VARSAYILAN_ONEM_KATSAYILARI.copy()
         self.hesaplama_metodlari = {}
-        
-        # OpenAI API ayarları
+        self.vektorel_hesaplama = vektorel_hesaplama  # NumPy tabanlı sütunsal puanlama
+        self.danisma_sayimi = None  # (aylar, il bazında durum sayımları) - akışlı okumadan
+        self.temizlenen_aktiviteler = set()
+        self.aktivite_girdi_ozetleri = {}  # aktivite -> girdi dosyasının içerik özeti
+        self.aktivite_puan_onbellegi = {}  # aktivite -> (bağımlılık anahtarı, puanlar)
+        self.aktivite_puanlari = {}
+        self.il_referans = None  # paylaşılan IlReferansTablosu
+        self.il_boyutu = None  # plaka kodu yoksa verideki illerden kurulan boyut
+        self.llm_istemcisi = None  # yeni aktivite analizi için LLMIstemcisi (ilk kullanımda)
+        self.dinamik_metod_kaydi = None  # dynamic_methods/ kaydı (ilk kullanımda)
+        self.dinamik_metod_yurutucusu = None  # üretilmiş metodlar için alt süreç yürütücüsü
+        self.aktivite_manifestosu = {}  # aktivite -> manifesto kaydı (katsayı, sütun eşlemesi, yöntem)
+        self.nufus_ozeti = None
+        self.kategori_anahtari = None
+        self.esik_tablolari = {}
+        self.calisma_turu_carpanlari = {}
+        
+        # OpenAI API ayarları (anahtar global değil, her çağrıya verilir)
+        self.openai_api_key = openai_api_key
         if openai_api_key:
-            openai.api_key = openai_api_key
             self.claude_api_available = True
         else:
             self.claude_api_available = False
             print("⚠️ OpenAI API key not provided. New activity analysis will be limited.")
         
         # Klasörleri oluştur
-        os.makedirs('output_csv', exist_ok=True)
-        os.makedirs('dynamic_configs', exist_ok=True)
-        os.makedirs('dynamic_methods', exist_ok=True)
+        os.makedirs(self.cikti_klasoru, exist_ok=True)
+        os.makedirs(self.config_klasoru, exist_ok=True)
+        os.makedirs(self.metod_klasoru, exist_ok=True)
+        
+        # Puanlama eşik tablolarını yükle
+        self._esik_tablolarini_yukle()
         
         # Mevcut hesaplama metodlarını yükle
         self._load_core_calculation_methods()
@@ -72,6 +673,60 @@ class DinamikPuanlamaSistemi:
             'ramazan': self._ramazan_puani_hesapla,
             'bayrak': self._bayrak_puani_hesapla
         }
+    
+    def _esik_tablolarini_yukle(self, dosya_yolu: Optional[str] = None):
+        """Eşik tablolarını JSON'dan yükle (dosya yoksa veya hatalıysa varsayılanlar kullanılır)"""
+        if dosya_yolu is None:
+            dosya_yolu = self.config_klasoru / 'esik_tablolari.json'
+        self.esik_tablolari = {ad: dict(tablo) for ad, tablo in self.VARSAYILAN_ESIK_TABLOLARI.items()}
+        self.calisma_turu_carpanlari = dict(self.VARSAYILAN_CALISMA_TURU_CARPANLARI)
+        
+        if not os.path.exists(dosya_yolu):
+            return
+        
+        try:
+            with open(dosya_yolu, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Eşik tabloları okunamadı ({dosya_yolu}): {e} - varsayılanlar kullanılıyor")
+            return
+        
+        if not isinstance(config, dict):
+            print(f"⚠️ Eşik tabloları geçersiz ({dosya_yolu}): JSON nesnesi bekleniyor - varsayılanlar kullanılıyor")
+            return
+        
+        # Her tablo ayrı doğrulanır; hatalı tablo yalnızca kendi varsayılanına döner
+        tablolar = config.get('esik_tablolari', {})
+        if not isinstance(tablolar, dict):
+            print("⚠️ 'esik_tablolari' bir nesne olmalı - varsayılan eşik tabloları kullanılıyor")
+            tablolar = {}
+        for ad, tablo in tablolar.items():
+            try:
+                esikler = [float(esik) for esik in tablo.get('esikler', [])]
+                carpanlar = [float(carpan) for carpan in tablo.get('carpanlar', [])]
+            except (AttributeError, TypeError, ValueError) as e:
+                print(f"⚠️ '{ad}' eşik tablosu okunamadı ({e}) - varsayılan kullanılıyor")
+                continue
+            if len(carpanlar) != len(esikler) + 1 or esikler != sorted(esikler):
+                print(f"⚠️ '{ad}' eşik tablosu geçersiz (artan eşikler ve eşik sayısı + 1 çarpan gerekli) - varsayılan kullanılıyor")
+                continue
+            self.esik_tablolari[ad] = {'esikler': esikler, 'carpanlar': carpanlar}
+        
+        turler = config.get('calisma_turu_carpanlari', {})
+        if not isinstance(turler, dict):
+            print("⚠️ 'calisma_turu_carpanlari' bir nesne olmalı - varsayılan çarpanlar kullanılıyor")
+            turler = {}
+        for tur, carpan in turler.items():
+            try:
+                self.calisma_turu_carpanlari[str(tur).strip().upper()] = float(carpan)
+            except (TypeError, ValueError) as e:
+                print(f"⚠️ '{tur}' çalışma türü çarpanı geçersiz ({e}) - varsayılan kullanılıyor")
+    
+    def _esik_carpani(self, tablo_adi: str, degerler):
+        """Adı verilen eşik tablosunu tek bir değere ya da bir sütunun tamamına uygula"""
+        tablo = self.esik_tablolari[tablo_adi]
+        carpanlar = self._esik_carpanlari(degerler, tablo['esikler'], tablo['carpanlar'])
+        return carpanlar if np.ndim(degerler) else float(carpanlar)
         
     def dinamik_veri_yukle(self):
         """Data klasöründen mevcut CSV dosyalarını dinamik olarak yükle"""
@@ -80,18 +735,24 @@ class DinamikPuanlamaSistemi:
             
             # Mevcut veri dosyalarını kontrol et
             data_files = {
-                'uyelik': 'data/Üyelik.csv',
-                'danisma': 'data/Danışma_Meclisi.csv',
-                'ramazan': 'data/Ramazan_Çalışmaları.csv',
-                'bayrak': 'data/Bayrak_Çalışması.csv'
+                'uyelik': self.veri_klasoru / 'Üyelik.csv',
+                'danisma': self.veri_klasoru / 'Danışma_Meclisi.csv',
+                'ramazan': self.veri_klasoru / 'Ramazan_Çalışmaları.csv',
+                'bayrak': self.veri_klasoru / 'Bayrak_Çalışması.csv'
             }
             
             loaded_activities = []
             
             for aktivite, dosya_yolu in data_files.items():
                 if os.path.exists(dosya_yolu):
+                    # Danışma dosyası her ay büyür: parça parça okunup il bazında sayılır
+                    if aktivite == 'danisma' and self.vektorel_hesaplama:
+                        if self._danisma_dosyasini_akisla_oku(dosya_yolu):
+                            loaded_activities.append(aktivite)
+                            print(f"✅ {aktivite.title()} verisi yüklendi: {dosya_yolu}")
+                        continue
                     try:
-                        self.veriler[aktivite] = pd.read_csv(dosya_yolu, encoding='utf-8')
+                        self.veriler[aktivite] = self._veri_dosyasi_yukle(aktivite, dosya_yolu)
                         loaded_activities.append(aktivite)
                         print(f"✅ {aktivite.title()} verisi yüklendi: {dosya_yolu}")
                     except Exception as e:
@@ -117,19 +778,18 @@ class DinamikPuanlamaSistemi:
     
     def _detect_new_activities(self):
         """Data klasöründe yeni aktivite dosyalarını tespit et"""
-        if not os.path.exists('data'):
+        if not self.veri_klasoru.exists():
             return
             
         # Bilinen dosyalar
         known_files = {
             'Üyelik.csv', 'Danışma_Meclisi.csv', 
             'Ramazan_Çalışmaları.csv', 'Bayrak_Çalışması.csv',
-            'il_ilçe_nüfus.csv'
+            *self.NUFUS_DOSYA_ADLARI
         }
         
         # Data klasöründeki tüm CSV dosyalarını kontrol et
-        data_path = Path('data')
-        csv_files = list(data_path.glob('*.csv'))
+        csv_files = list(self.veri_klasoru.glob('*.csv'))
         
         new_activities = []
         for csv_file in csv_files:
@@ -140,91 +800,416 @@ class DinamikPuanlamaSistemi:
             print(f"🆕 {len(new_activities)} yeni aktivite dosyası tespit edildi:")
             for file in new_activities:
                 print(f"   - {file.name}")
-                self._process_new_activity(file)
+            
+            self._aktivite_manifestosunu_yukle()
+            
+            # Daha önce metodu üretilmiş aktiviteler API'ye gitmeden kayıttan yüklenir;
+            # manifestoda tanımlı olanlar işlenir, diğerleri inceleme kuyruğuna alınır
+            kayitli_metodlar = self._dinamik_metod_kaydi_al().kayitli_metodlar()
+            islenecekler = []
+            incelenecekler = []
+            for file in new_activities:
+                aktivite_adi, manifest_kaydi = self._manifest_kaydi_bul(file)
+                if self._kayitli_aktiviteyi_yukle(file, aktivite_adi, kayitli_metodlar):
+                    continue
+                if manifest_kaydi is None:
+                    incelenecekler.append((file, aktivite_adi))
+                else:
+                    islenecekler.append((file, aktivite_adi))
+            
+            if islenecekler:
+                self._yeni_aktiviteleri_isle(islenecekler)
+            if incelenecekler:
+                self._inceleme_kuyruguna_ekle(incelenecekler)
+    
+    @staticmethod
+    def _aktivite_adi_bul(csv_file: Path) -> str:
+        """Aktivite adını dosya adından çıkar"""
+        return csv_file.stem.lower().replace(' ', '_').replace('ç', 'c').replace('ğ', 'g').replace('ı', 'i').replace('ö', 'o').replace('ş', 's').replace('ü', 'u')
+    
+    def _aktivite_manifestosunu_yukle(self, dosya_yolu: Optional[str] = None) -> Dict[str, Dict]:
+        """Yeni aktivite manifestosunu yükle (dynamic_configs/aktivite_manifestosu.json)
+        
+        {"aktiviteler": {"<aktivite>": {"katsayi": 2.0, "dosya": "<Dosya>.csv",
+        "sutun_eslemesi": {"<csv sütunu>": "<sistem sütunu>"}, "yontem": "llm" | "varsayilan",
+        "config": {...varsayılan metod ayarları...}}}} - katsayi dışındaki alanlar isteğe bağlıdır.
+        "dosya" verilmezse dosya adından çıkarılan aktivite adıyla eşleştirilir. Geçersiz
+        kayıtlar uyarıyla atlanır (dosyaları inceleme kuyruğuna düşer).
+        """
+        if dosya_yolu is None:
+            dosya_yolu = self.config_klasoru / self.AKTIVITE_MANIFESTO_DOSYASI
+        self.aktivite_manifestosu = {}
+        
+        if not os.path.exists(dosya_yolu):
+            return self.aktivite_manifestosu
+        
+        try:
+            with open(dosya_yolu, 'r', encoding='utf-8') as f:
+                manifesto = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Aktivite manifestosu okunamadı ({dosya_yolu}): {e}")
+            return self.aktivite_manifestosu
+        
+        for aktivite, kayit in manifesto.get('aktiviteler', {}).items():
+            try:
+                katsayi = float(kayit['katsayi'])
+                if katsayi <= 0:
+                    raise ValueError("katsayı 0'dan büyük olmalı")
+                yontem = kayit.get('yontem', 'llm')
+                if yontem not in ('llm', 'varsayilan'):
+                    raise ValueError(f"bilinmeyen yöntem '{yontem}'")
+                self.aktivite_manifestosu[aktivite] = {
+                    'dosya': kayit.get('dosya'),
+                    'katsayi': katsayi,
+                    'sutun_eslemesi': {str(kaynak): str(hedef) for kaynak, hedef in kayit.get('sutun_eslemesi', {}).items()},
+                    'yontem': yontem,
+                    'config': dict(kayit.get('config', {}))
+                }
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                print(f"⚠️ Manifestodaki '{aktivite}' kaydı geçersiz ({e}) - atlanıyor")
+        
+        return self.aktivite_manifestosu
+    
+    def _manifest_kaydi_bul(self, csv_file: Path) -> Tuple[str, Optional[Dict]]:
+        """Dosyanın aktivite adı ve manifesto kaydı (önce "dosya" alanı, sonra dosya adından çıkarılan ad)"""
+        for aktivite, kayit in self.aktivite_manifestosu.items():
+            if kayit['dosya'] == csv_file.name:
+                return aktivite, kayit
+        aktivite_adi = self._aktivite_adi_bul(csv_file)
+        return aktivite_adi, self.aktivite_manifestosu.get(aktivite_adi)
+    
+    def _inceleme_kuyrugunu_guncelle(self, guncelle):
+        """inceleme_kuyrugu.json'u oku, guncelle(kuyruk) uygula ve atomik olarak yaz"""
+        kuyruk_dosyasi = self.config_klasoru / self.INCELEME_KUYRUGU_DOSYASI
+        kuyruk = {}
+        if kuyruk_dosyasi.exists():
+            try:
+                with open(kuyruk_dosyasi, 'r', encoding='utf-8') as f:
+                    kuyruk = json.load(f)
+            except Exception as e:
+                print(f"⚠️ İnceleme kuyruğu okunamadı, yeniden oluşturuluyor: {e}")
+        
+        if not guncelle(kuyruk):
+            return kuyruk_dosyasi
+        
+        gecici_dosya = kuyruk_dosyasi.with_name(f'{kuyruk_dosyasi.name}.{os.getpid()}.tmp')
+        with open(gecici_dosya, 'w', encoding='utf-8') as f:
+            json.dump(kuyruk, f, ensure_ascii=False, indent=2)
+        os.replace(gecici_dosya, kuyruk_dosyasi)
+        return kuyruk_dosyasi
+    
+    def _inceleme_kuyruguna_ekle(self, dosyalar: List[Tuple[Path, str]]):
+        """Manifestoda olmayan dosyaları analize almadan inceleme kuyruğuna yaz"""
+        simdi = time.strftime('%Y-%m-%dT%H:%M:%S')
+        kayitlar = {}
+        for csv_file, aktivite_adi in dosyalar:
+            try:
+                sutunlar = list(pd.read_csv(csv_file, encoding='utf-8', nrows=0).columns)
+                icerik_ozeti = self._dosya_ozeti(csv_file)
+            except Exception as e:
+                print(f"⚠️ {csv_file.name} okunamadı: {e}")
+                sutunlar, icerik_ozeti = [], None
+            kayitlar[aktivite_adi] = {
+                'dosya': csv_file.name,
+                'sutunlar': sutunlar,
+                'icerik_ozeti': icerik_ozeti,
+                'ilk_gorulme': simdi,
+                'son_gorulme': simdi,
+                'onerilen_manifest_kaydi': {
+                    'dosya': csv_file.name,
+                    'katsayi': None,
+                    'sutun_eslemesi': {},
+                    'yontem': 'llm'
+                }
+            }
+            print(f"📥 {csv_file.name} manifestoda yok, inceleme kuyruğuna alındı (analize dahil edilmedi)")
+        
+        def ekle(kuyruk):
+            for aktivite_adi, kayit in kayitlar.items():
+                kayit['ilk_gorulme'] = kuyruk.get(aktivite_adi, {}).get('ilk_gorulme', simdi)
+                kuyruk[aktivite_adi] = kayit
+            return True
+        
+        kuyruk_dosyasi = self._inceleme_kuyrugunu_guncelle(ekle)
+        print(f"📋 {len(kayitlar)} dosya incelemede: {kuyruk_dosyasi}")
+        print(f"   Katsayıyı {self.config_klasoru / self.AKTIVITE_MANIFESTO_DOSYASI} dosyasına ekleyip tekrar çalıştırın")
+    
+    def _inceleme_kuyrugundan_cikar(self, aktivite_adi: str, dosya_adi: str):
+        """Sisteme alınan aktiviteyi (manifestoda farklı adla tanımlansa da) inceleme kuyruğundan çıkar"""
+        kuyruk_dosyasi = self.config_klasoru / self.INCELEME_KUYRUGU_DOSYASI
+        if not kuyruk_dosyasi.exists():
+            return
+        
+        def cikar(kuyruk):
+            silinecekler = [ad for ad, kayit in kuyruk.items()
+                            if ad == aktivite_adi or kayit.get('dosya') == dosya_adi]
+            for ad in silinecekler:
+                del kuyruk[ad]
+            return bool(silinecekler)
+        
+        self._inceleme_kuyrugunu_guncelle(cikar)
+    
+    def _kayitli_aktiviteyi_yukle(self, csv_file: Path, aktivite_adi: str, kayitli_metodlar: Dict[str, Dict]) -> bool:
+        """Kayıtlı metodu veya konfigürasyonu olan aktiviteyi yükle - yoksa False (yeni aktivite olarak işlenir)
+        
+        Manifestoda kaydı varsa katsayı ve sütun eşlemesi manifestodan gelir.
+        """
+        kayit = kayitli_metodlar.get(aktivite_adi)
+        config_file = self.config_klasoru / f'{aktivite_adi}_config.json'
+        if kayit is None and not config_file.exists():
+            return False
+        
+        manifest_kaydi = self.aktivite_manifestosu.get(aktivite_adi, {})
+        try:
+            self.veriler[aktivite_adi] = self._veri_dosyasi_yukle(
+                aktivite_adi, csv_file, sutun_eslemesi=manifest_kaydi.get('sutun_eslemesi')
+            )
+            
+            if kayit is not None:
+                katsayi = manifest_kaydi.get('katsayi', kayit['katsayi'] if kayit['katsayi'] is not None else 1.0)
+                self.aktivite_katsayilari[aktivite_adi] = katsayi
+                if self._dinamik_metodu_bagla(kayit):
+                    print(f"♻️ {aktivite_adi} kayıtlı metodla yüklendi: {kayit['dosya'].name}")
+                    return True
+                if not config_file.exists():
+                    print(f"⚠️ {aktivite_adi} kayıtlı metodu kullanılamıyor, varsayılan metod kullanılıyor")
+                    self._create_default_activity_config(aktivite_adi, self.veriler[aktivite_adi], katsayi)
+                    return True
+            
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            if 'katsayi' in manifest_kaydi:
+                config['importance_coefficient'] = manifest_kaydi['katsayi']
+            self.aktivite_katsayilari[aktivite_adi] = config.get('importance_coefficient', 1.0)
+            self._create_calculation_method(aktivite_adi, config)
+            print(f"♻️ {aktivite_adi} kayıtlı konfigürasyonla yüklendi: {config_file.name}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Kayıtlı aktivite yüklenemedi ({csv_file.name}): {e}")
+            self.veriler.pop(aktivite_adi, None)
+            return False
+    
+    def _dinamik_metod_kaydi_al(self):
+        """dynamic_methods/ kaydı (ilk kullanımda oluşturulur)"""
+        if self.dinamik_metod_kaydi is None:
+            from dinamik_metodlar import DinamikMetodKaydi
+            self.dinamik_metod_kaydi = DinamikMetodKaydi(self.metod_klasoru, self.onbellek_klasoru)
+        return self.dinamik_metod_kaydi
+    
+    def _dinamik_metod_yurutucusu_al(self):
+        """Üretilmiş metodları sınırlı alt süreçte çalıştıran yürütücü (ilk kullanımda oluşturulur)"""
+        if self.dinamik_metod_yurutucusu is None:
+            from dinamik_metodlar import DinamikMetodYurutucusu
+            self.dinamik_metod_yurutucusu = DinamikMetodYurutucusu(
+                zaman_asimi=self.DINAMIK_METOD_ZAMAN_ASIMI,
+                cpu_siniri=self.DINAMIK_METOD_CPU_SINIRI,
+                bellek_siniri_mb=self.DINAMIK_METOD_BELLEK_SINIRI_MB
+            )
+        return self.dinamik_metod_yurutucusu
+    
+    def _dinamik_metod_baglami(self, aktivite_adi: str, df: pd.DataFrame):
+        """Alt süreçteki metoda 'self' yerine verilecek veri kopyası"""
+        from dinamik_metodlar import DinamikMetodBaglami
+        return DinamikMetodBaglami(
+            aktivite_adi, df, self.aktivite_katsayilari, self.kategori_katsayilar,
+            self.il_kategorileri, self._nufus_verileri_yukle()
+        )
+    
+    def _dinamik_metodu_bagla(self, kayit: Dict) -> bool:
+        """Kayıtlı metodu derle, gerekiyorsa örnek veriyle doğrula ve alt süreçte çalışacak şekilde sisteme ekle"""
+        aktivite_adi = kayit['aktivite']
+        try:
+            kod = self._dinamik_metod_kaydi_al().derle(kayit)
+        except Exception as e:
+            print(f"❌ {aktivite_adi} metodu derlenemedi: {e}")
+            return False
+        
+        if not self._dinamik_metodu_dogrula(aktivite_adi, kod, kayit['ozet']):
+            return False
+        
+        def izole_hesaplama_metodu():
+            """Üretilmiş metodu sınırlı alt süreçte çalıştır"""
+            return self._dinamik_metodu_calistir(aktivite_adi, kod)
+        
+        setattr(self, f'_{aktivite_adi}_puani_hesapla', izole_hesaplama_metodu)
+        self.hesaplama_metodlari[aktivite_adi] = izole_hesaplama_metodu
+        return True
+    
+    def _dinamik_metodu_calistir(self, aktivite_adi: str, kod) -> AktivitePuanlari:
+        """Üretilmiş metodu alt süreçte çalıştır - zaman aşımı/hata/sınır aşımında varsayılan min-max metoda düş"""
+        df = self.veriler[aktivite_adi]
+        try:
+            diziler = self._dinamik_metod_yurutucusu_al().calistir(
+                kod, aktivite_adi, self._dinamik_metod_baglami(aktivite_adi, df)
+            )
+            boyut = self._il_boyutu_al()
+            return AktivitePuanlari.dizilerden(
+                boyut, aktivite_adi, diziler['iller'], boyut.konumlar(diziler['iller']), diziler['sutunlar']
+            )
+        except Exception as e:
+            # Alt süreç başlatılamaması, veri aktarımı veya hizalama hataları da dahil
+            print(f"⚠️ {aktivite_adi} metodu çalıştırılamadı ({e}), varsayılan min-max metod kullanılıyor")
+            katsayi = self.aktivite_katsayilari.get(aktivite_adi, 1.0)
+            self._create_calculation_method(aktivite_adi, self._varsayilan_aktivite_configi(aktivite_adi, df, katsayi))
+            return self.hesaplama_metodlari[aktivite_adi]()
+    
+    def _dinamik_metodu_dogrula(self, aktivite_adi: str, kod, kaynak_ozeti: str) -> bool:
+        """Metodu örnek veri üzerinde alt süreçte bir kez çalıştır (aynı kaynak + şema için sonuç kayıttan gelir)"""
+        kayit_defteri = self._dinamik_metod_kaydi_al()
+        df = self.veriler[aktivite_adi]
+        sema_ozeti = self._ozet_al(list(map(str, df.columns)), list(map(str, df.dtypes)))
+        
+        onceki = kayit_defteri.dogrulama_sonucu(kaynak_ozeti, sema_ozeti)
+        if onceki is not None:
+            if not onceki['gecerli']:
+                print(f"❌ {aktivite_adi} metodu daha önce doğrulanamadı: {onceki['hata']}")
+            return onceki['gecerli']
+        
+        from dinamik_metodlar import DinamikMetodHatasi
+        
+        ornek = df.head(self.DINAMIK_METOD_ORNEK_SATIR).reset_index(drop=True)
+        try:
+            self._dinamik_metod_yurutucusu_al().calistir(
+                kod, aktivite_adi, self._dinamik_metod_baglami(aktivite_adi, ornek)
+            )
+            hata = None
+        except DinamikMetodHatasi as e:
+            hata = str(e)
+        except (TimeoutError, RuntimeError) as e:
+            # Zaman aşımı / sınır aşımı kalıcı kaydedilmez, sonraki çalıştırmada tekrar doğrulanır
+            print(f"⚠️ {aktivite_adi} metodu doğrulanırken sınır aşıldı ({e}), bu çalıştırmada kullanılmıyor")
+            return False
+        
+        kayit_defteri.dogrulama_kaydet(aktivite_adi, kaynak_ozeti, sema_ozeti, hata)
+        if hata is not None:
+            print(f"❌ {aktivite_adi} metodu doğrulanamadı: {hata}")
+        return hata is None
     
     def _process_new_activity(self, csv_file: Path):
-        """Yeni aktivite dosyasını işle ve Claude API ile analiz et"""
+        """Yeni aktivite dosyasını işle ve Claude API ile analiz et (manifestoda yoksa inceleme kuyruğuna alınır)"""
+        self._aktivite_manifestosunu_yukle()
+        aktivite_adi, manifest_kaydi = self._manifest_kaydi_bul(csv_file)
+        if manifest_kaydi is None:
+            self._inceleme_kuyruguna_ekle([(csv_file, aktivite_adi)])
+            return
+        self._yeni_aktiviteleri_isle([(csv_file, aktivite_adi)])
+    
+    def _yeni_aktiviteleri_isle(self, dosyalar: List[Tuple[Path, str]]):
+        """Manifestodaki yeni aktivite dosyalarını işle - hesaplama metodu istekleri tek seferde eşzamanlı gönderilir"""
+        dosya_adlari = {aktivite_adi: csv_file.name for csv_file, aktivite_adi in dosyalar}
+        hazirlananlar = []
+        for csv_file, aktivite_adi in dosyalar:
+            hazirlanan = self._yeni_aktiviteyi_hazirla(csv_file, aktivite_adi)
+            if hazirlanan is not None:
+                hazirlananlar.append(hazirlanan)
+        
+        if not hazirlananlar:
+            return
+        
+        # Claude API ile hesaplama metodolojisi iste (manifestoda yöntemi 'llm' olanlar için birlikte)
+        llm_ile = [self.claude_api_available and self.aktivite_manifestosu[aktivite_adi]['yontem'] == 'llm'
+                   for aktivite_adi, _, _ in hazirlananlar]
+        yanitlar = [None] * len(hazirlananlar)
+        if any(llm_ile):
+            istenenler = [i for i, llm in enumerate(llm_ile) if llm]
+            print(f"🤖 Claude API'den {len(istenenler)} aktivite için hesaplama metodolojisi isteniyor...")
+            istekler = [self._hesaplama_metodu_istegi(*hazirlananlar[i]) for i in istenenler]
+            for i, yanit in zip(istenenler, self._llm_istemcisi_al().toplu_tamamla(istekler)):
+                yanitlar[i] = yanit
+        
+        for (aktivite_adi, df, yeni_katsayi), llm, yanit in zip(hazirlananlar, llm_ile, yanitlar):
+            try:
+                if not llm:
+                    if not self.claude_api_available:
+                        print(f"⚠️ Claude API mevcut değil, varsayılan metod kullanılıyor")
+                    self._create_default_activity_config(aktivite_adi, df, yeni_katsayi)
+                else:
+                    hesaplama_metodu = self._hesaplama_kodunu_ayikla(yanit) if yanit else None
+                    if hesaplama_metodu:
+                        # Claude'dan gelen metodunu sisteme entegre et
+                        if self._integrate_claude_method(aktivite_adi, hesaplama_metodu, yeni_katsayi):
+                            print(f"✅ {aktivite_adi.title()} aktivitesi Claude metodolojisi ile sisteme entegre edildi")
+                    else:
+                        print(f"⚠️ Claude API'den yanıt alınamadı, varsayılan metod kullanılıyor")
+                        self._create_default_activity_config(aktivite_adi, df, yeni_katsayi)
+                self._inceleme_kuyrugundan_cikar(aktivite_adi, dosya_adlari[aktivite_adi])
+            except Exception as e:
+                print(f"❌ Yeni aktivite işleme hatası ({aktivite_adi}): {e}")
+    
+    def _yeni_aktiviteyi_hazirla(self, csv_file: Path, aktivite_adi: str):
+        """Yeni aktivite dosyasını manifestodaki sütun eşlemesiyle yükle: (aktivite_adi, df, katsayi) veya None"""
         try:
-            # CSV dosyasını yükle
-            df = pd.read_csv(csv_file, encoding='utf-8')
+            manifest_kaydi = self.aktivite_manifestosu[aktivite_adi]
             
-            # Aktivite adını dosya adından çıkar
-            aktivite_adi = csv_file.stem.lower().replace(' ', '_').replace('ç', 'c').replace('ğ', 'g').replace('ı', 'i').replace('ö', 'o').replace('ş', 's').replace('ü', 'u')
+            # CSV dosyasını yükle
+            df = self._veri_dosyasi_yukle(aktivite_adi, csv_file, sutun_eslemesi=manifest_kaydi['sutun_eslemesi'])
             
             print(f"🔍 Yeni aktivite analiz ediliyor: {aktivite_adi}")
             
             # Veriyi sisteme ekle
             self.veriler[aktivite_adi] = df
             
-            # Kullanıcıdan yeni aktivite için katsayı iste
-            print(f"\n🆕 Yeni aktivite tespit edildi: {aktivite_adi}")
-            print("📊 MEVCUT SİSTEM:")
-            for akt, kats in self.aktivite_katsayilari.items():
-                if akt in self.veriler:
-                    print(f"   - {akt.title()}: {kats} katsayı")
-            toplam = sum(self.aktivite_katsayilari.values())
-            print(f"   - TOPLAM: {toplam} katsayı")
-            
-            # Kullanıcıdan katsayı al
-            while True:
-                try:
-                    katsayi_input = input(f"\n❓ '{aktivite_adi.title()}' aktivitesi için önem katsayısı girin: ")
-                    yeni_katsayi = float(katsayi_input)
-                    if yeni_katsayi > 0:
-                        break
-                    else:
-                        print("⚠️ Katsayı 0'dan büyük olmalı!")
-                except ValueError:
-                    print("⚠️ Lütfen geçerli bir sayı girin!")
+            # Katsayı manifestodan gelir (kullanıcıya sorulmaz)
+            yeni_katsayi = manifest_kaydi['katsayi']
+            print(f"🆕 Yeni aktivite: {aktivite_adi} - manifestodan {yeni_katsayi} katsayı")
             
-            # Claude API ile hesaplama metodolojisi iste
-            if self.claude_api_available:
-                print(f"🤖 Claude API'den {aktivite_adi} için hesaplama metodolojisi isteniyor...")
-                hesaplama_metodu = self._request_calculation_method_from_claude(aktivite_adi, df, yeni_katsayi)
-                
-                if hesaplama_metodu:
-                    # Claude'dan gelen metodunu sisteme entegre et
-                    self._integrate_claude_method(aktivite_adi, hesaplama_metodu, yeni_katsayi)
-                    print(f"✅ {aktivite_adi.title()} aktivitesi Claude metodolojisi ile sisteme entegre edildi")
-                else:
-                    print(f"⚠️ Claude API'den yanıt alınamadı, varsayılan metod kullanılıyor")
-                    self._create_default_activity_config(aktivite_adi, df, yeni_katsayi)
-            else:
-                print(f"⚠️ Claude API mevcut değil, varsayılan metod kullanılıyor")
-                self._create_default_activity_config(aktivite_adi, df, yeni_katsayi)
+            return aktivite_adi, df, yeni_katsayi
                 
         except Exception as e:
             print(f"❌ Yeni aktivite işleme hatası ({csv_file.name}): {e}")
+            return None
     
-    def _analyze_new_activity_with_api(self, aktivite_adi: str, df: pd.DataFrame) -> Optional[Dict]:
-        """Claude API ile yeni aktiviteyi analiz et"""
-        try:
-            # DataFrame'in yapısını analiz et
-            df_info = {
-                'columns': list(df.columns),
-                'sample_data': df.head(3).to_dict(),
-                'data_types': df.dtypes.to_dict(),
-                'shape': df.shape
-            }
-            
-            # Mevcut metodoloji bilgilerini hazırla
-            metodoloji = {
-                'il_kategorileri': self.KATEGORI_KATSAYILARI,
-                'mevcut_aktiviteler': {
-                    'uyelik': 'Hedefe ulaşma oranı, yönetim kurulu performansı (4.0 katsayı)',
-                    'danisma': 'İl ve ilçe toplantı performansları (3.0 katsayı)',
-                    'ramazan': 'Nüfus erişim oranı ve aktivite çeşitliliği (2.0 katsayı)',
-                    'bayrak': 'Nüfus bazlı bayrak oranı ve çalışma türü (1.0 katsayı)'
-                },
-                'puanlama_sistemi': '10\'luk önem katsayısı sistemi (1.0-10.0 arası)'
-            }
-            
-            # API prompt'u hazırla
-            prompt = f"""
+    def _llm_istemcisi_al(self):
+        """Asenkron, tekrar denemeli ve önbellekli LLM istemcisi (ilk kullanımda oluşturulur)"""
+        if self.llm_istemcisi is None:
+            from llm_istemcisi import LLMIstemcisi
+            self.llm_istemcisi = LLMIstemcisi.ortamdan_olustur(
+                self.openai_api_key, self.onbellek_klasoru / 'llm'
+            )
+        return self.llm_istemcisi
+    
+    @staticmethod
+    def _df_bilgisi(df: pd.DataFrame) -> Dict:
+        """Prompt için DataFrame yapısı"""
+        return {
+            'columns': list(df.columns),
+            'sample_data': df.head(3).to_dict(),
+            'data_types': df.dtypes.to_dict(),
+            'shape': df.shape
+        }
+    
+    def _llm_onbellek_anahtari(self, istek_turu: str, aktivite_adi: str, df: pd.DataFrame,
+                               katsayi: Optional[float] = None) -> str:
+        """Aktivite şeması (sütunlar + tipler) ve katsayıdan LLM önbellek anahtarı"""
+        return self._ozet_al(istek_turu, aktivite_adi, list(map(str, df.columns)),
+                             list(map(str, df.dtypes)), katsayi)
+    
+    def _analiz_istegi(self, aktivite_adi: str, df: pd.DataFrame):
+        """Yeni aktivite analizi için LLM isteği"""
+        from llm_istemcisi import LLMIstegi
+        
+        # DataFrame'in yapısını analiz et
+        df_info = self._df_bilgisi(df)
+        
+        # Mevcut metodoloji bilgilerini hazırla
+        metodoloji = {
+            'il_kategorileri': self.KATEGORI_KATSAYILARI,
+            'mevcut_aktiviteler': {
+                'uyelik': 'Hedefe ulaşma oranı, yönetim kurulu performansı (4.0 katsayı)',
+                'danisma': 'İl ve ilçe toplantı performansları (3.0 katsayı)',
+                'ramazan': 'Nüfus erişim oranı ve aktivite çeşitliliği (2.0 katsayı)',
+                'bayrak': 'Nüfus bazlı bayrak oranı ve çalışma türü (1.0 katsayı)'
+            },
+            'puanlama_sistemi': '10\'luk önem katsayısı sistemi (1.0-10.0 arası)'
+        }
+        
+        # API prompt'u hazırla
+        prompt = f"""
 AK Parti performans değerlendirme sistemine yeni bir aktivite entegre edilecek.
 
 YENİ AKTİVİTE: {aktivite_adi}
-VERİ YAPISI: {json.dumps(df_info, ensure_ascii=False, indent=2)}
+VERİ YAPISI: {json.dumps(df_info, ensure_ascii=False, indent=2, default=str)}
 
 MEVCUT METODOLOJİ: {json.dumps(metodoloji, ensure_ascii=False, indent=2)}
 
@@ -245,37 +1230,40 @@ JSON formatı:
     "calculation_logic": "detaylı hesaplama mantığı"
 }}
 """
-            
-            # API çağrısı yap
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Sen AK Parti performans analiz uzmanısın. Yeni aktiviteleri mevcut metodolojiye entegre etme konusunda uzmansın."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            
-            # Yanıtı parse et
-            response_text = response.choices[0].message.content
-            
-            # JSON'u çıkarmaya çalış
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                analiz_sonucu = json.loads(json_match.group())
-                return analiz_sonucu
-            else:
-                print(f"❌ API yanıtı JSON formatında değil: {response_text}")
+        
+        return LLMIstegi(
+            onbellek_anahtari=self._llm_onbellek_anahtari('analiz', aktivite_adi, df),
+            mesajlar=[
+                {"role": "system", "content": "Sen AK Parti performans analiz uzmanısın. Yeni aktiviteleri mevcut metodolojiye entegre etme konusunda uzmansın."},
+                {"role": "user", "content": prompt}
+            ],
+            sicaklik=0.3
+        )
+
+    @staticmethod
+    def _analiz_json_ayikla(response_text: str) -> Optional[Dict]:
+        """Analiz yanıtından JSON'u çıkar"""
+        import re
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if json_match:
+            return json.loads(json_match.group())
+        print(f"❌ API yanıtı JSON formatında değil: {response_text}")
+        return None
+    
+    def _analyze_new_activity_with_api(self, aktivite_adi: str, df: pd.DataFrame) -> Optional[Dict]:
+        """Claude API ile yeni aktiviteyi analiz et"""
+        try:
+            response_text = self._llm_istemcisi_al().tamamla(self._analiz_istegi(aktivite_adi, df))
+            if response_text is None:
                 return None
-                
+            return self._analiz_json_ayikla(response_text)
         except Exception as e:
             print(f"❌ API analiz hatası: {e}")
             return None
     
     def _save_activity_config(self, aktivite_adi: str, config: Dict):
         """Aktivite konfigürasyonunu kaydet"""
-        config_file = f'dynamic_configs/{aktivite_adi}_config.json'
+        config_file = self.config_klasoru / f'{aktivite_adi}_config.json'
         
         with open(config_file, 'w', encoding='utf-8') as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
@@ -285,32 +1273,28 @@ JSON formatı:
         
         print(f"💾 {aktivite_adi} konfigürasyonu kaydedildi: {config_file}")
     
-    def _request_calculation_method_from_claude(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float) -> Optional[str]:
-        """Claude API'den yeni aktivite için hesaplama metodolojisi iste"""
-        try:
-            # DataFrame'in yapısını analiz et
-            df_info = {
-                'columns': list(df.columns),
-                'sample_data': df.head(3).to_dict(),
-                'data_types': df.dtypes.to_dict(),
-                'shape': df.shape
-            }
-            
-            # Mevcut metodoloji bilgilerini hazırla
-            mevcut_metodoloji = {
-                'uyelik': 'Hedefe ulaşma oranı, yönetim kurulu performansı, mükemmellik ödülü sistemi',
-                'danisma': 'İl başkanlığı + İlçe toplantı performansları, kategori bonusu sistemi',
-                'ramazan': 'Nüfus erişim oranı (normalize) + aktivite çeşitliliği puanlaması',
-                'bayrak': 'Nüfus bazlı bayrak oranı (normalize) + çalışma türü bonusu'
-            }
-            
-            # API prompt'u hazırla
-            prompt = f"""
+    def _hesaplama_metodu_istegi(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float):
+        """Yeni aktivite hesaplama metodu için LLM isteği"""
+        from llm_istemcisi import LLMIstegi
+        
+        # DataFrame'in yapısını analiz et
+        df_info = self._df_bilgisi(df)
+        
+        # Mevcut metodoloji bilgilerini hazırla
+        mevcut_metodoloji = {
+            'uyelik': 'Hedefe ulaşma oranı, yönetim kurulu performansı, mükemmellik ödülü sistemi',
+            'danisma': 'İl başkanlığı + İlçe toplantı performansları, kategori bonusu sistemi',
+            'ramazan': 'Nüfus erişim oranı (normalize) + aktivite çeşitliliği puanlaması',
+            'bayrak': 'Nüfus bazlı bayrak oranı (normalize) + çalışma türü bonusu'
+        }
+        
+        # API prompt'u hazırla
+        prompt = f"""
 AK Parti performans değerlendirme sistemine yeni aktivite entegre edilecek.
 
 YENİ AKTİVİTE: {aktivite_adi}
 KULLANICI KATSAYISI: {katsayi}
-VERİ YAPISI: {json.dumps(df_info, ensure_ascii=False, indent=2)}
+VERİ YAPISI: {json.dumps(df_info, ensure_ascii=False, indent=2, default=str)}
 
 MEVCUT METODOLOJİLER: {json.dumps(mevcut_metodoloji, ensure_ascii=False, indent=2)}
 
@@ -326,75 +1310,68 @@ GEREKSINIMLER:
 
 Sadece Python fonksiyonunu döndür, açıklama yazma:
 """
-            
-            # API çağrısı yap
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "Sen Python kod uzmanısın. Sadece istenen fonksiyonu döndür, başka hiçbir açıklama yapma."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
-            
-            # Yanıtı parse et
-            response_text = response.choices[0].message.content.strip()
-            
-            # Python kodunu temizle
-            if "```python" in response_text:
-                code_start = response_text.find("```python") + 9
-                code_end = response_text.find("```", code_start)
-                python_code = response_text[code_start:code_end].strip()
-            elif "def " in response_text:
-                python_code = response_text.strip()
-            else:
-                print(f"❌ Claude'dan geçerli Python kodu alınamadı")
+        
+        return LLMIstegi(
+            onbellek_anahtari=self._llm_onbellek_anahtari('hesaplama_metodu', aktivite_adi, df, katsayi),
+            mesajlar=[
+                {"role": "system", "content": "Sen Python kod uzmanısın. Sadece istenen fonksiyonu döndür, başka hiçbir açıklama yapma."},
+                {"role": "user", "content": prompt}
+            ],
+            sicaklik=0.1
+        )
+    
+    @staticmethod
+    def _hesaplama_kodunu_ayikla(response_text: str) -> Optional[str]:
+        """LLM yanıtından Python kodunu çıkar"""
+        response_text = response_text.strip()
+        
+        # Python kodunu temizle
+        if "```python" in response_text:
+            code_start = response_text.find("```python") + 9
+            code_end = response_text.find("```", code_start)
+            return response_text[code_start:code_end].strip()
+        elif "def " in response_text:
+            return response_text.strip()
+        
+        print(f"❌ Claude'dan geçerli Python kodu alınamadı")
+        return None
+    
+    def _request_calculation_method_from_claude(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float) -> Optional[str]:
+        """Claude API'den yeni aktivite için hesaplama metodolojisi iste"""
+        try:
+            istek = self._hesaplama_metodu_istegi(aktivite_adi, df, katsayi)
+            response_text = self._llm_istemcisi_al().tamamla(istek)
+            if response_text is None:
                 return None
-            
-            return python_code
+            return self._hesaplama_kodunu_ayikla(response_text)
                 
         except Exception as e:
             print(f"❌ Claude API hatası: {e}")
             return None
     
-    def _integrate_claude_method(self, aktivite_adi: str, python_code: str, katsayi: float):
-        """Claude'dan gelen Python kodunu sisteme entegre et"""
+    def _integrate_claude_method(self, aktivite_adi: str, python_code: str, katsayi: float) -> bool:
+        """Claude'dan gelen Python kodunu sisteme entegre et - kullanılamazsa varsayılan metod kurulur (False)"""
         try:
             # Katsayıyı güncelle
             self.aktivite_katsayilari[aktivite_adi] = katsayi
             
-            # Python kodunu dosyaya kaydet
-            method_file = f'dynamic_methods/{aktivite_adi}_method.py'
-            with open(method_file, 'w', encoding='utf-8') as f:
-                f.write(f"# {aktivite_adi.title()} aktivitesi için Claude tarafından oluşturulan hesaplama metodu\n")
-                f.write(f"# Katsayı: {katsayi}\n\n")
-                f.write(python_code)
+            # Python kodunu dosyaya kaydet (sonraki çalıştırmalar bu dosyadan yükler)
+            kayit = self._dinamik_metod_kaydi_al().kaydet(aktivite_adi, python_code, katsayi)
             
-            # Kodu çalıştırılabilir hale getir ve sisteme ekle
-            namespace = {'self': self, 'pd': pd, 'json': json}
-            exec(python_code, namespace)
+            # Derle, doğrula ve hesaplama metodları listesine ekle
+            if self._dinamik_metodu_bagla(kayit):
+                print(f"💾 {aktivite_adi} metodu kaydedildi: {kayit['dosya']}")
+                return True
             
-            # Fonksiyonu bul ve sisteme ekle
-            func_name = f'_{aktivite_adi}_puani_hesapla'
-            if func_name in namespace:
-                # Metodunu sınıfa bağla
-                method = namespace[func_name]
-                setattr(self, func_name, method.__get__(self, self.__class__))
-                
-                # Hesaplama metodları listesine ekle
-                self.hesaplama_metodlari[aktivite_adi] = getattr(self, func_name)
-                
-                print(f"💾 {aktivite_adi} metodu kaydedildi: {method_file}")
-            else:
-                print(f"❌ {func_name} fonksiyonu bulunamadı")
-                
         except Exception as e:
             print(f"❌ Claude metodunu entegre etme hatası: {e}")
-            # Hata durumunda varsayılan metod kullan
-            self._create_default_activity_config(aktivite_adi, self.veriler[aktivite_adi], katsayi)
+        
+        # Hata durumunda varsayılan metod kullan
+        self._create_default_activity_config(aktivite_adi, self.veriler[aktivite_adi], katsayi)
+        return False
     
-    def _create_default_activity_config(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float):
-        """Varsayılan aktivite konfigürasyonu oluştur"""
+    def _varsayilan_aktivite_configi(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float) -> Dict:
+        """Varsayılan (min-max normalizasyon) aktivite konfigürasyonu - manifestodaki 'config' alanları önceliklidir"""
         config = {
             "importance_coefficient": katsayi,
             "scoring_methodology": "Basic normalization scoring",
@@ -403,99 +1380,249 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             "category_coefficient": False,
             "calculation_logic": "Min-Max normalization based scoring"
         }
+        config.update(self.aktivite_manifestosu.get(aktivite_adi, {}).get('config', {}))
+        config["importance_coefficient"] = katsayi
+        return config
+    
+    def _create_default_activity_config(self, aktivite_adi: str, df: pd.DataFrame, katsayi: float):
+        """Varsayılan aktivite konfigürasyonu oluştur"""
+        config = self._varsayilan_aktivite_configi(aktivite_adi, df, katsayi)
         
         self._save_activity_config(aktivite_adi, config)
         self._create_calculation_method(aktivite_adi, config)
     
     def _create_calculation_method(self, aktivite_adi: str, config: Dict):
-        """Yeni aktivite için dinamik hesaplama metodu oluştur"""
+        """Yeni aktivite için dinamik hesaplama metodu oluştur
+        
+        Konfigürasyon alanları: key_columns (İL/İL_KODU hariç sayısal sütunlar),
+        column_weights ({sütun: ağırlık}, varsayılan eşit), population_normalization
+        (100 bin kişi başına değer), category_coefficient (1'den büyük il kategori katsayısı)
+        ve importance_coefficient (maksimum puan = katsayı * 10).
+        """
         def dynamic_calculation_method():
             """Dinamik olarak oluşturulan hesaplama metodu"""
-            puanlar = {}
-            
-            if aktivite_adi not in self.veriler:
-                return puanlar
-            
-            df = self.veriler[aktivite_adi]
-            key_columns = config.get('key_columns', [])
-            max_puan = config.get('importance_coefficient', 1.0) * 10  # 10'luk sistemde
-            
-            # Basit min-max normalizasyon
-            if key_columns and len(key_columns) > 0:
-                # İlk sütunu ana metrik olarak kullan
-                main_column = key_columns[0]
-                
-                if main_column in df.columns:
-                    # Numerik değerleri al
-                    numeric_values = pd.to_numeric(df[main_column], errors='coerce').fillna(0)
-                    
-                    if numeric_values.max() > numeric_values.min():
-                        # Min-Max normalizasyon
-                        normalized = (numeric_values - numeric_values.min()) / (numeric_values.max() - numeric_values.min())
-                        
-                        for idx, row in df.iterrows():
-                            if 'İL' in row:
-                                il = row['İL']
-                                puan = normalized.iloc[idx] * max_puan
-                                
-                                # Kategori katsayısı uygula (eğer gerekiyorsa)
-                                if config.get('category_coefficient', False):
-                                    kategori_katsayi = self.kategori_katsayilar.get(il, {}).get('katsayi', 1.0)
-                                    if kategori_katsayi > 1.0:
-                                        puan = puan * kategori_katsayi
-                                
-                                puanlar[il] = {
-                                    f'toplam_{aktivite_adi}': min(max_puan, puan),
-                                    'main_metric': numeric_values.iloc[idx],
-                                    'normalized_score': normalized.iloc[idx]
-                                }
-            
-            return puanlar
+            return self._varsayilan_puanlari_hesapla(aktivite_adi, config)
         
         # Metodu sisteme ekle
         self.hesaplama_metodlari[aktivite_adi] = dynamic_calculation_method
         
         print(f"🔧 {aktivite_adi} için hesaplama metodu oluşturuldu")
     
+    def _varsayilan_puan_sutunlari(self, df: pd.DataFrame, config: Dict) -> List[str]:
+        """Puanlamada kullanılacak sayısal sütunlar - key_columns'ta uygun sütun yoksa tüm sayısal sütunlar"""
+        il_sutunlari = {'İL', self.IL_KODU_SUTUNU}
+        
+        def sayisal_mi(sutun):
+            return pd.to_numeric(df[sutun], errors='coerce').notna().any()
+        
+        sutunlar = [sutun for sutun in config.get('key_columns', [])
+                    if sutun in df.columns and sutun not in il_sutunlari and sayisal_mi(sutun)]
+        if not sutunlar:
+            sutunlar = [sutun for sutun in df.columns if sutun not in il_sutunlari and sayisal_mi(sutun)]
+        return sutunlar
+    
+    def _varsayilan_puanlari_hesapla(self, aktivite_adi: str, config: Dict) -> AktivitePuanlari:
+        """Varsayılan puanlama: sütun bazında min-max normalizasyon, ağırlıklı toplam ve kategori katsayısı
+        
+        Sabit (min = max) sütunlar puana katkı vermez; hiç değişken sütun yoksa aktivite sonuçsuz kalır.
+        """
+        boyut = self._il_boyutu_al()
+        bos = AktivitePuanlari.sozlukten(boyut, aktivite_adi, {})
+        
+        df = self.veriler.get(aktivite_adi)
+        if df is None or 'İL' not in df.columns:
+            return bos
+        
+        sutunlar = self._varsayilan_puan_sutunlari(df, config)
+        if not sutunlar:
+            return bos
+        
+        max_puan = config.get('importance_coefficient', 1.0) * 10  # 10'luk sistemde
+        ham = np.column_stack([
+            pd.to_numeric(df[sutun], errors='coerce').fillna(0).to_numpy(dtype=float) for sutun in sutunlar
+        ])
+        
+        # Nüfus bazlı normalizasyon: 100 bin kişi başına değer
+        degerler = ham
+        if config.get('population_normalization', False):
+            nufus = self._satir_nufuslari(df)[:, None]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                degerler = np.where(nufus > 0, ham / np.where(nufus > 0, nufus, 1) * 100000, 0.0)
+        
+        # Sütun bazında min-max normalizasyon (sabit sütunlar ağırlıktan düşer)
+        en_kucuk = degerler.min(axis=0)
+        aralik = degerler.max(axis=0) - en_kucuk
+        degisken = aralik > 0
+        if not degisken.any():
+            return bos
+        normalize = np.zeros_like(degerler)
+        normalize[:, degisken] = (degerler[:, degisken] - en_kucuk[degisken]) / aralik[degisken]
+        
+        agirlik_ayari = config.get('column_weights') or {}
+        agirliklar = np.array([float(agirlik_ayari.get(sutun, 1.0)) for sutun in sutunlar])
+        agirliklar = np.where(degisken, np.clip(agirliklar, 0, None), 0.0)
+        if agirliklar.sum() <= 0:
+            return bos
+        skor = normalize @ (agirliklar / agirliklar.sum())
+        
+        puan = skor * max_puan
+        
+        # Kategori katsayısı uygula (eğer gerekiyorsa - sadece 1'den büyük katsayılar)
+        if config.get('category_coefficient', False):
+            katsayilar = df['İL'].map({
+                il: bilgi.get('katsayi', 1.0) for il, bilgi in self.kategori_katsayilar.items()
+            }).fillna(1.0).to_numpy(dtype=float)
+            puan = puan * np.maximum(katsayilar, 1.0)
+        
+        detaylar = {
+            f'toplam_{aktivite_adi}': np.minimum(max_puan, puan),
+            'main_metric': ham[:, 0],
+            'normalized_score': skor
+        }
+        if degerler is not ham:
+            detaylar['main_metric_100k'] = degerler[:, 0]
+        
+        return AktivitePuanlari.dizilerden(
+            boyut, aktivite_adi, df['İL'].to_numpy(), self._il_konumlari(df), detaylar
+        )
+    
     def _veri_temizle(self):
         """Mevcut veri temizleme metodları (puanlama_sistemi.py'den)"""
-        
-        # Üyelik verisi temizleme
-        if 'uyelik' in self.veriler:
-            numeric_cols = ['YAPILMASI GEREKEN TOPLAM ÜYE', 'YÖNETİM KURULU YAPMASI GEREKEN ÜYE SAYISI', 
-                           'YÖNETİM KURULU ÜYELERİ TARAFINDAN REFERANS OLUNAN YENİ ÜYE SAYISI',
-                           'YAPILAN YENİ ÜYE SAYISI', 'SİLİNEN  ÜYE SAYISI', 'MEVCUT ÜYE']
-            
-            for col in numeric_cols:
-                if col in self.veriler['uyelik'].columns:
-                    self.veriler['uyelik'][col] = (self.veriler['uyelik'][col]
-                                                 .astype(str)
-                                                 .str.replace(',', '')
-                                                 .str.replace('"', ''))
-                    self.veriler['uyelik'][col] = pd.to_numeric(self.veriler['uyelik'][col], errors='coerce').fillna(0)
-            
-            # Hedefe ulaşma oranını temizle
-            if 'HEDEFE ULAŞMA ORANI' in self.veriler['uyelik'].columns:
-                self.veriler['uyelik']['HEDEFE ULAŞMA ORANI'] = (self.veriler['uyelik']['HEDEFE ULAŞMA ORANI']
-                                                                .str.replace('%', '')
-                                                                .astype(float))
-        
-        # Ramazan verisi temizleme
-        if 'ramazan' in self.veriler:
-            ramazan_cols = ['GÖNÜL SOFRASI', 'SAHUR PROGRAMI', 'İFTAR PROGRAMI', 'TOPLAM ULAŞILAN KİŞİ']
-            for col in ramazan_cols:
-                if col in self.veriler['ramazan'].columns:
-                    self.veriler['ramazan'][col] = (self.veriler['ramazan'][col]
-                                                  .astype(str)
-                                                  .str.replace(',', '')
-                                                  .str.replace('"', ''))
-                    self.veriler['ramazan'][col] = pd.to_numeric(self.veriler['ramazan'][col], errors='coerce').fillna(0)
-            
-            # TOPLAM satırını çıkar
-            self.veriler['ramazan'] = self.veriler['ramazan'][self.veriler['ramazan']['İL'] != 'TOPLAM'].copy()
+        for aktivite in list(self.veriler.keys()):
+            # Önbellekten gelen veya daha önce temizlenen veriler tekrar temizlenmez
+            if aktivite in self.temizlenen_aktiviteler:
+                continue
+            self.veriler[aktivite] = self._aktivite_verisi_temizle(aktivite, self.veriler[aktivite])
+            self.temizlenen_aktiviteler.add(aktivite)
         
         print("✅ Veri temizleme tamamlandı")
     
+    def _aktivite_verisi_temizle(self, aktivite: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Tek bir aktivitenin verisini temizle (temizlenmiş kopyayı döndürür)
+        
+        Şemalı okumadan gelen sütunlar zaten sayısaldır; metin olarak kalan
+        sütunlar (şemasız okuma veya dışarıdan gelen veri) burada dönüştürülür.
+        """
+        df = self._il_isimlerini_standartlastir(df)
+        
+        sema = self.VERI_SEMALARI.get(aktivite)
+        if sema is None:
+            return df
+        
+        df = df.copy()
+        for col in sema['sayisal']:
+            if col not in df.columns:
+                continue
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col]
+                                        .astype(str)
+                                        .str.replace(',', '')
+                                        .str.replace('"', ''), errors='coerce')
+            if sema['bos_sifir']:
+                df[col] = df[col].fillna(0)
+        
+        # Yüzde sütunlarını temizle ("19%" -> 19.0)
+        for col in sema['yuzde']:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].str.replace('%', '').astype(float)
+        
+        # Ramazan verisinde TOPLAM satırını çıkar
+        if aktivite == 'ramazan' and 'İL' in df.columns:
+            df = df[df['İL'] != 'TOPLAM'].copy()
+        
+        return df
+    
+    def _il_isimlerini_standartlastir(self, df: pd.DataFrame) -> pd.DataFrame:
+        """İL sütununu kanonik isimlere çevir ve plaka kodunu İL_KODU sütununa ekle
+        
+        Girdi dosyası değiştirilmez; standartlaştırma sadece bellekteki veride yapılır.
+        """
+        if 'İL' not in df.columns or standardize_province_codes is None:
+            return df
+        df = df.copy()
+        df['İL'], df[self.IL_KODU_SUTUNU] = standardize_province_codes(df['İL'])
+        return df
+    
+    @staticmethod
+    def _yuzde_donustur(deger: str) -> float:
+        """Yüzde metnini sayıya çevir ("19%" -> 19.0, boş -> NaN)"""
+        deger = deger.strip().rstrip('%')
+        return float(deger) if deger else np.nan
+    
+    def _semali_csv_oku(self, aktivite: str, dosya_yolu) -> pd.DataFrame:
+        """Bilinen aktivite dosyasını şemaya göre tek geçişte tipli olarak oku"""
+        sema = self.VERI_SEMALARI.get(aktivite)
+        if sema is None:
+            return pd.read_csv(dosya_yolu, encoding='utf-8')
+        
+        sutunlar = pd.read_csv(dosya_yolu, encoding='utf-8', nrows=0).columns
+        try:
+            return pd.read_csv(
+                dosya_yolu, encoding='utf-8', thousands=',',
+                dtype={col: 'float64' for col in sema['sayisal'] if col in sutunlar},
+                converters={col: self._yuzde_donustur for col in sema['yuzde'] if col in sutunlar}
+            )
+        except ValueError as e:
+            # Beklenmeyen değer içeren dosyalar eski yöntemle (metin okuma + temizleme) işlenir
+            print(f"⚠️ {aktivite} tipli okunamadı, metin olarak okunuyor: {e}")
+            return pd.read_csv(dosya_yolu, encoding='utf-8')
+    
+    def _dosya_ozeti(self, dosya_yolu) -> str:
+        """Dosya içeriğinin SHA-256 özeti (önbellek anahtarı için)"""
+        ozet = hashlib.sha256()
+        with open(dosya_yolu, 'rb') as f:
+            for blok in iter(lambda: f.read(1024 * 1024), b''):
+                ozet.update(blok)
+        return ozet.hexdigest()
+    
+    def _onbellek_yolu(self, aktivite: str, icerik_ozeti: str) -> Path:
+        """İçerik özeti ve temizleme sürümüne göre önbellek dosyası yolu"""
+        return self.onbellek_klasoru / f"{aktivite}_{icerik_ozeti[:32]}_v{self.VERI_TEMIZLEME_SURUMU}.pkl"
+    
+    def _onbellekten_oku(self, yol: Path):
+        """Önbellek dosyasını oku (yoksa veya bozuksa None)"""
+        if not yol.exists():
+            return None
+        try:
+            return pd.read_pickle(yol)
+        except Exception as e:
+            print(f"⚠️ Önbellek okunamadı ({yol.name}): {e}")
+            return None
+    
+    def _onbellege_yaz(self, yol: Path, nesne):
+        """Önbelleğe atomik olarak yaz (yarım kalan dosya okunmaz)"""
+        try:
+            yol.parent.mkdir(parents=True, exist_ok=True)
+            gecici_yol = yol.with_suffix(f'.{os.getpid()}.tmp')
+            pd.to_pickle(nesne, gecici_yol)
+            os.replace(gecici_yol, yol)
+        except Exception as e:
+            print(f"⚠️ Önbelleğe yazılamadı ({yol.name}): {e}")
+    
+    def _veri_dosyasi_yukle(self, aktivite: str, dosya_yolu, icerik_ozeti: Optional[str] = None,
+                            sutun_eslemesi: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """CSV dosyasını temizlenmiş olarak yükle - değişmemiş dosya önbellekten ayrıştırmasız gelir
+        
+        icerik_ozeti önceden biliniyorsa (ör. yükleme sırasında hesaplandıysa) dosya tekrar okunmaz.
+        sutun_eslemesi (manifesto) verilirse sütunlar temizlemeden önce yeniden adlandırılır.
+        """
+        icerik_ozeti = icerik_ozeti or self._dosya_ozeti(dosya_yolu)
+        if sutun_eslemesi:
+            icerik_ozeti = self._ozet_al(icerik_ozeti, sutun_eslemesi)
+        self.aktivite_girdi_ozetleri[aktivite] = icerik_ozeti
+        onbellek_yolu = self._onbellek_yolu(aktivite, icerik_ozeti)
+        
+        df = self._onbellekten_oku(onbellek_yolu)
+        if df is None:
+            df = self._semali_csv_oku(aktivite, dosya_yolu)
+            if sutun_eslemesi:
+                df = df.rename(columns=sutun_eslemesi)
+            df = self._aktivite_verisi_temizle(aktivite, df)
+            self._onbellege_yaz(onbellek_yolu, df)
+        
+        self.temizlenen_aktiviteler.add(aktivite)
+        return df
+    
     def _katsayilari_yeniden_dagit(self):
         """Verisi olmayan aktivitelerin katsayılarını mevcut aktivitelere oransal dağıt"""
         
@@ -554,24 +1681,48 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             if aktivite in mevcut_aktiviteler
         }
     
+    def nufus_dosyasi_bul(self) -> Optional[Path]:
+        """Veri klasöründeki nüfus dosyasının yolu (bilinen adlardan ilki, yoksa None)"""
+        for dosya_adi in self.NUFUS_DOSYA_ADLARI:
+            nufus_dosyasi = self.veri_klasoru / dosya_adi
+            if nufus_dosyasi.exists():
+                return nufus_dosyasi
+        return None
+    
     def _nufus_verileri_yukle(self):
-        """Nüfus verilerini yükle"""
+        """Nüfus verilerini yükle (süreç genelinde paylaşılan il referans tablosundan)"""
         if self.nufus_bilgileri is not None:
             return self.nufus_bilgileri
         
+        nufus_dosyasi = self.nufus_dosyasi_bul()
         try:
-            nufus_df = pd.read_csv('data/il_ilçe_nüfus.csv', encoding='utf-8')
-            self.nufus_bilgileri = dict(zip(nufus_df['İL'], nufus_df['NÜFUS']))
+            if nufus_dosyasi is None:
+                raise FileNotFoundError(
+                    f"{self.veri_klasoru} içinde {' / '.join(self.NUFUS_DOSYA_ADLARI)} yok"
+                )
+            self.il_referans = il_referans_tablosu_al(
+                nufus_dosyasi,
+                (self.MEGA_IL_ESIK, self.BUYUK_IL_ESIK, self.ORTA_IL_ESIK),
+                self.KATEGORI_KATSAYILARI,
+                self.VARSAYILAN_NUFUS
+            )
+            self.nufus_bilgileri = self.il_referans.nufus
+            self.nufus_ozeti = self.il_referans.ozet
         except Exception as e:
-            print(f"⚠️ il_ilçe_nüfus.csv bulunamadı: {e}")
+            print(f"⚠️ Nüfus dosyası bulunamadı: {e}")
             print("Varsayılan nüfus değerleri kullanılıyor")
-            self.nufus_bilgileri = {}
+            self.il_referans = IlReferansTablosu(
+                {}, 'yok', (self.MEGA_IL_ESIK, self.BUYUK_IL_ESIK, self.ORTA_IL_ESIK),
+                self.KATEGORI_KATSAYILARI, self.VARSAYILAN_NUFUS
+            )
+            self.nufus_bilgileri = self.il_referans.nufus
+            self.nufus_ozeti = 'yok'
         
         return self.nufus_bilgileri
     
     def il_kategorileri_belirle(self):
-        """İl kategorilerini belirle (mevcut sistemden)"""
-        nufus_dict = self._nufus_verileri_yukle()
+        """İl kategorilerini belirle (kategoriler paylaşılan il referans tablosunda hazırdır)"""
+        self._nufus_verileri_yukle()
         
         # İl listesi için herhangi bir veriyi kullan
         il_listesi = []
@@ -584,55 +1735,37 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             print("❌ İl listesi bulunamadı")
             return
         
+        # İl listesi ve nüfus verisi değişmediyse kategoriler yeniden kurulmaz
+        kategori_anahtari = self._ozet_al(
+            sorted(map(str, il_listesi)), self.nufus_ozeti, self.VARSAYILAN_NUFUS,
+            [self.MEGA_IL_ESIK, self.BUYUK_IL_ESIK, self.ORTA_IL_ESIK], self.KATEGORI_KATSAYILARI
+        )
+        if kategori_anahtari == self.kategori_anahtari:
+            print("✅ İl kategorileri değişmedi (önbellekten)")
+            return
+        
+        self.il_kategorileri = {}
+        self.kategori_katsayilar = {}
         for il in il_listesi:
-            nufus = nufus_dict.get(il, self.VARSAYILAN_NUFUS)
-            
-            if nufus >= self.MEGA_IL_ESIK:
-                kategori = "Mega İl"
-            elif nufus >= self.BUYUK_IL_ESIK:
-                kategori = "Büyük İl"
-            elif nufus >= self.ORTA_IL_ESIK:
-                kategori = "Orta İl"
-            else:
-                kategori = "Küçük İl"
+            kayit = self.il_referans.kayit(il)
             
             self.il_kategorileri[il] = {
-                'kategori': kategori,
-                'nufus': nufus
+                'kategori': kayit['kategori'],
+                'nufus': kayit['nufus']
             }
             
             self.kategori_katsayilar[il] = {
-                'grup': kategori,
-                'katsayi': self.KATEGORI_KATSAYILARI.get(kategori, 1.15)
+                'grup': kayit['kategori'],
+                'katsayi': kayit['katsayi']
             }
         
+        self.kategori_anahtari = kategori_anahtari
         print("✅ İl kategorileri belirlendi")
     
     # Mevcut hesaplama metodları (puanlama_sistemi.py'den uyarlanmış)
     def _danisma_puan_hesapla_base(self, ortalama, max_puan=1.0):
-        """Danışma meclisi puan hesaplama (10'luk sisteme uyarlanmış)"""
-        if ortalama >= 0.95:
-            return max_puan
-        elif ortalama >= 0.90:
-            return max_puan * 0.9
-        elif ortalama >= 0.80:
-            return max_puan * 0.8
-        elif ortalama >= 0.70:
-            return max_puan * 0.7
-        elif ortalama >= 0.60:
-            return max_puan * 0.6
-        elif ortalama >= 0.50:
-            return max_puan * 0.5
-        elif ortalama >= 0.40:
-            return max_puan * 0.4
-        elif ortalama >= 0.30:
-            return max_puan * 0.3
-        elif ortalama >= 0.20:
-            return max_puan * 0.2
-        elif ortalama >= 0.10:
-            return max_puan * 0.1
-        else:
-            return 0
+        """Danışma meclisi puan hesaplama (10'luk sisteme uyarlanmış, 'danisma' eşik tablosu)"""
+        return max_puan * self._esik_carpani('danisma', ortalama)
     
     def _uyelik_puani_hesapla(self):
         """Üyelik puanı hesaplama (10'luk sisteme uyarlanmış)"""
@@ -642,6 +1775,9 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         if 'uyelik' not in self.veriler:
             return puanlar
         
+        if self.vektorel_hesaplama:
+            return self._uyelik_puani_hesapla_vektorel()
+        
         for _, row in self.veriler['uyelik'].iterrows():
             il = row['İL']
             hedefe_ulasma = row.get('HEDEFE ULAŞMA ORANI', 0)
@@ -650,60 +1786,17 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             
             # Temel başarı puanı (27/40 oranı korundu)
             temel_oran = 27/40
-            if hedefe_ulasma >= 100:
-                temel_puan = max_puan * temel_oran
-            elif hedefe_ulasma >= 90:
-                temel_puan = max_puan * temel_oran * (25/27)
-            elif hedefe_ulasma >= 80:
-                temel_puan = max_puan * temel_oran * (23/27)
-            elif hedefe_ulasma >= 70:
-                temel_puan = max_puan * temel_oran * (21/27)
-            elif hedefe_ulasma >= 60:
-                temel_puan = max_puan * temel_oran * (19/27)
-            elif hedefe_ulasma >= 50:
-                temel_puan = max_puan * temel_oran * (17/27)
-            elif hedefe_ulasma >= 40:
-                temel_puan = max_puan * temel_oran * (15/27)
-            elif hedefe_ulasma >= 30:
-                temel_puan = max_puan * temel_oran * (12/27)
-            elif hedefe_ulasma >= 20:
-                temel_puan = max_puan * temel_oran * (9/27)
-            elif hedefe_ulasma >= 15:
-                temel_puan = max_puan * temel_oran * (6/27)
-            elif hedefe_ulasma >= 10:
-                temel_puan = max_puan * temel_oran * (3/27)
-            else:
-                temel_puan = 0
+            temel_puan = max_puan * temel_oran * self._esik_carpani('uyelik_temel', hedefe_ulasma)
             
             # Mükemmellik ödülü (8/40 oranı korundu)
             mukemmellik_oran = 8/40
-            if hedefe_ulasma >= 200:
-                mukemmellik_puan = max_puan * mukemmellik_oran
-            elif hedefe_ulasma >= 150:
-                mukemmellik_puan = max_puan * mukemmellik_oran * (6/8)
-            elif hedefe_ulasma >= 120:
-                mukemmellik_puan = max_puan * mukemmellik_oran * (4/8)
-            elif hedefe_ulasma >= 100:
-                mukemmellik_puan = max_puan * mukemmellik_oran * (2/8)
-            else:
-                mukemmellik_puan = 0
+            mukemmellik_puan = max_puan * mukemmellik_oran * self._esik_carpani('uyelik_mukemmellik', hedefe_ulasma)
             
             # Yönetim kurulu performansı (5/40 oranı korundu)
             yk_oran = 5/40
             if yk_hedef > 0:
                 yk_basari_orani = (yk_gerceklesen / yk_hedef) * 100
-                if yk_basari_orani >= 100:
-                    yk_puan = max_puan * yk_oran
-                elif yk_basari_orani >= 80:
-                    yk_puan = max_puan * yk_oran * (4/5)
-                elif yk_basari_orani >= 60:
-                    yk_puan = max_puan * yk_oran * (3/5)
-                elif yk_basari_orani >= 40:
-                    yk_puan = max_puan * yk_oran * (2/5)
-                elif yk_basari_orani >= 20:
-                    yk_puan = max_puan * yk_oran * (1/5)
-                else:
-                    yk_puan = 0
+                yk_puan = max_puan * yk_oran * self._esik_carpani('uyelik_yk', yk_basari_orani)
             else:
                 yk_basari_orani = 0
                 yk_puan = 0
@@ -721,6 +1814,51 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         
         return puanlar
     
+    @staticmethod
+    def _esik_carpanlari(degerler, esikler, carpanlar) -> np.ndarray:
+        """Eşik tablosunu bir sütunun tamamına tek seferde uygula (if/elif merdiveninin karşılığı)"""
+        degerler = np.asarray(degerler, dtype=float)
+        # NaN hiçbir eşiği geçemez (merdivendeki >= karşılaştırmalarıyla aynı)
+        degerler = np.where(np.isnan(degerler), -np.inf, degerler)
+        indeksler = np.searchsorted(np.asarray(esikler, dtype=float), degerler, side='right')
+        return np.asarray(carpanlar, dtype=float)[indeksler]
+    
+    def _uyelik_puani_hesapla_vektorel(self):
+        """Üyelik puanı hesaplama - NumPy ile sütunsal (satır döngüsü yok)"""
+        df = self.veriler['uyelik']
+        max_puan = self.aktivite_katsayilari.get('uyelik', 4.0) * 10
+        satir_sayisi = len(df)
+        
+        def sutun(ad):
+            if ad in df.columns:
+                return pd.to_numeric(df[ad], errors='coerce').to_numpy(dtype=float)
+            return np.zeros(satir_sayisi)
+        
+        hedefe_ulasma = sutun('HEDEFE ULAŞMA ORANI')
+        yk_hedef = sutun('YÖNETİM KURULU YAPMASI GEREKEN ÜYE SAYISI')
+        yk_gerceklesen = sutun('YÖNETİM KURULU ÜYELERİ TARAFINDAN REFERANS OLUNAN YENİ ÜYE SAYISI')
+        
+        # Temel başarı (27/40), mükemmellik (8/40) ve yönetim kurulu (5/40) puanları
+        temel_puan = max_puan * (27/40) * self._esik_carpani('uyelik_temel', hedefe_ulasma)
+        mukemmellik_puan = max_puan * (8/40) * self._esik_carpani('uyelik_mukemmellik', hedefe_ulasma)
+        
+        yk_var = yk_hedef > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            yk_basari_orani = np.where(yk_var, (yk_gerceklesen / np.where(yk_var, yk_hedef, 1)) * 100, 0.0)
+        yk_puan = np.where(yk_var, max_puan * (5/40) * self._esik_carpani('uyelik_yk', yk_basari_orani), 0.0)
+        
+        toplam_uyelik = temel_puan + mukemmellik_puan + yk_puan
+        
+        # Aynı il birden fazla satırda geçerse döngüdeki gibi son satır geçerli olur
+        return AktivitePuanlari.dizilerden(self._il_boyutu_al(), 'uyelik', df['İL'].to_numpy(), self._il_konumlari(df), {
+            'temel_puan': temel_puan,
+            'mukemmellik_puan': mukemmellik_puan,
+            'yk_puan': yk_puan,
+            'yk_basari_orani': yk_basari_orani,
+            'hedefe_ulasma_orani': hedefe_ulasma,
+            'toplam_uyelik': toplam_uyelik
+        })
+    
     def _danisma_puani_hesapla(self):
         """Danışma meclisi puanı hesaplama (10'luk sisteme uyarlanmış)"""
         puanlar = {}
@@ -729,6 +1867,13 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         if 'danisma' not in self.veriler:
             return puanlar
         
+        if self.vektorel_hesaplama:
+            return self._danisma_puani_hesapla_vektorel()
+        
+        # Ay sütunları vektörel yoldaki gibi başlıktan bulunur (en son ayda PLANLANDI = 0.7)
+        aylar = self._danisma_ay_sutunlari(self.veriler['danisma'].columns)
+        ay_sayisi = max(len(aylar), 1)
+        
         # İl listesi al
         il_listesi = []
         for veri in self.veriler.values():
@@ -751,11 +1896,14 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             il_puan_oran = 15/30
             if len(il_baskanligi) > 0:
                 il_row = il_baskanligi.iloc[0]
-                il_haziran = 1 if il_row.get('HAZİRAN') == 'YAPILDI' else 0
-                il_temmuz = 1 if il_row.get('TEMMUZ') == 'YAPILDI' else 0
-                il_agustos = 1 if il_row.get('AĞUSTOS') == 'YAPILDI' else (0.7 if il_row.get('AĞUSTOS') == 'PLANLANDI' else 0)
+                il_toplam = 0
+                for i, ay in enumerate(aylar):
+                    if il_row.get(ay) == 'YAPILDI':
+                        il_toplam += 1
+                    elif i == len(aylar) - 1 and il_row.get(ay) == 'PLANLANDI':
+                        il_toplam += 0.7
                 
-                il_ortalama = (il_haziran + il_temmuz + il_agustos) / 3
+                il_ortalama = il_toplam / ay_sayisi
                 il_puan = self._danisma_puan_hesapla_base(il_ortalama, max_puan * il_puan_oran)
             else:
                 il_ortalama = 0
@@ -764,13 +1912,14 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             # İlçe performansı (15/30 oranı)
             ilce_puan_oran = 15/30
             if len(ilceler) > 0:
-                ilce_haziran_oran = len(ilceler[ilceler['HAZİRAN'] == 'YAPILDI']) / len(ilceler)
-                ilce_temmuz_oran = len(ilceler[ilceler['TEMMUZ'] == 'YAPILDI']) / len(ilceler)
-                ilce_agustos_yapilan = len(ilceler[ilceler['AĞUSTOS'] == 'YAPILDI'])
-                ilce_agustos_planlanan = len(ilceler[ilceler['AĞUSTOS'] == 'PLANLANDI'])
-                ilce_agustos_oran = (ilce_agustos_yapilan + ilce_agustos_planlanan * 0.7) / len(ilceler)
+                ilce_oran_toplam = 0
+                for i, ay in enumerate(aylar):
+                    ilce_yapilan = len(ilceler[ilceler[ay] == 'YAPILDI'])
+                    if i == len(aylar) - 1:
+                        ilce_yapilan += len(ilceler[ilceler[ay] == 'PLANLANDI']) * 0.7
+                    ilce_oran_toplam += ilce_yapilan / len(ilceler)
                 
-                ilce_ortalama = (ilce_haziran_oran + ilce_temmuz_oran + ilce_agustos_oran) / 3
+                ilce_ortalama = ilce_oran_toplam / ay_sayisi
                 ilce_puan = self._danisma_puan_hesapla_base(ilce_ortalama, max_puan * ilce_puan_oran)
                 
                 # Kategori katsayısı bonusu
@@ -806,6 +1955,216 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         
         return puanlar
     
+    def _il_boyutu_al(self) -> IlBoyutu:
+        """Puanların hizalandığı il boyutu - plaka kodlu 81 il
+        
+        Standartlaştırma modülü yoksa boyut verideki illerden (ilk görülme sırasıyla) kurulur.
+        """
+        if PLAKA_IL_BOYUTU is not None:
+            return PLAKA_IL_BOYUTU
+        iller = dict.fromkeys(
+            il for veri in self.veriler.values() if 'İL' in veri.columns
+            for il in veri['İL'].tolist() if not pd.isna(il)
+        )
+        if self.il_boyutu is None or list(self.il_boyutu.adlar) != list(iller):
+            self.il_boyutu = IlBoyutu(list(iller))
+        return self.il_boyutu
+    
+    def _il_konumlari(self, df: pd.DataFrame) -> np.ndarray:
+        """DataFrame satırlarının il boyutundaki konumları (plaka kodu varsa kodla)"""
+        il_kodlari = df[self.IL_KODU_SUTUNU].to_numpy() if self.IL_KODU_SUTUNU in df.columns else None
+        return self._il_boyutu_al().konumlar(df['İL'].to_numpy(), il_kodlari)
+    
+    def _il_listesi_al(self):
+        """Puanlanacak il listesini ilk İL sütunlu veriden al"""
+        for veri in self.veriler.values():
+            if 'İL' in veri.columns:
+                return veri['İL'].unique()
+        return []
+    
+    @classmethod
+    def aktiviteyi_basliktan_bul(cls, sutunlar) -> Optional[str]:
+        """CSV başlık satırından bilinen aktiviteyi tespit et (bulunamazsa None)"""
+        sutunlar = [str(sutun).strip() for sutun in sutunlar]
+        for aktivite, imza in cls.AKTIVITE_BASLIK_IMZALARI.items():
+            if all(sutun in sutunlar for sutun in imza):
+                return aktivite
+        if 'İLÇE' in sutunlar and cls._danisma_ay_sutunlari(sutunlar):
+            return 'danisma'
+        return None
+    
+    @classmethod
+    def _danisma_ay_sutunlari(cls, sutunlar) -> List[str]:
+        """Danışma dosyasındaki ay sütunlarını dosya sırasıyla bul (her ayı bir TARİH sütunu izler)"""
+        sutunlar = [str(sutun) for sutun in sutunlar]
+        aylar = []
+        for i, sutun in enumerate(sutunlar):
+            temel = sutun.split('.')[0].strip()
+            if temel in ('İL', 'İLÇE', 'TARİH') or not temel:
+                continue
+            sonraki_tarih = i + 1 < len(sutunlar) and sutunlar[i + 1].split('.')[0].strip() == 'TARİH'
+            if temel.split()[0] in cls.AY_ADLARI or sonraki_tarih:
+                aylar.append(sutun)
+        return aylar
+    
+    def _danisma_durum_sayimi(self, df: pd.DataFrame, aylar: List[str]) -> pd.DataFrame:
+        """Bir Danışma parçasındaki YAPILDI/PLANLANDI durumlarını il bazında say
+        
+        Sonuç parçalar arasında _danisma_sayimlarini_birlestir ile toplanabilir:
+        il başkanlığı için ilk İL satırı, ilçeler için durum sayıları tutulur.
+        """
+        il_mi = (df['İLÇE'] == 'İL').to_numpy()
+        gostergeler = pd.DataFrame({'İL': df['İL'].to_numpy()})
+        for ay in aylar:
+            durum = df[ay].to_numpy()
+            gostergeler[f'{ay}_YAPILDI'] = (durum == 'YAPILDI').astype(int)
+            gostergeler[f'{ay}_PLANLANDI'] = (durum == 'PLANLANDI').astype(int)
+        
+        il_gruplari = gostergeler[il_mi].groupby('İL', sort=False)
+        ilce_gruplari = gostergeler[~il_mi].groupby('İL', sort=False)
+        
+        il_ilk = il_gruplari.first().add_prefix('IL_')
+        il_ilk['IL_SAYISI'] = il_gruplari.size()
+        ilce_toplam = ilce_gruplari.sum().add_prefix('ILCE_')
+        ilce_toplam['ILCE_SAYISI'] = ilce_gruplari.size()
+        
+        return pd.concat([il_ilk, ilce_toplam], axis=1).fillna(0)
+    
+    @staticmethod
+    def _danisma_sayimlarini_birlestir(onceki: Optional[pd.DataFrame], yeni: pd.DataFrame) -> pd.DataFrame:
+        """İki parça sayımını birleştir (ilçe sayıları toplanır, il başkanlığında ilk satır korunur)"""
+        if onceki is None:
+            return yeni
+        
+        il_sutunlari = [sutun for sutun in yeni.columns if sutun.startswith('IL_') and sutun != 'IL_SAYISI']
+        toplam_sutunlari = [sutun for sutun in yeni.columns if sutun not in il_sutunlari]
+        
+        birlesik = onceki[toplam_sutunlari].add(yeni[toplam_sutunlari], fill_value=0)
+        
+        # İl başkanlığı satırı daha önce görülmediyse yeni parçadakini al
+        il_durumlari = onceki[il_sutunlari].where(onceki['IL_SAYISI'] > 0)
+        il_durumlari = il_durumlari.combine_first(yeni[il_sutunlari].where(yeni['IL_SAYISI'] > 0))
+        
+        return pd.concat([il_durumlari.reindex(birlesik.index), birlesik], axis=1).fillna(0)
+    
+    def _danisma_dosyasini_akisla_oku(self, dosya_yolu, parca_boyutu: Optional[int] = None,
+                                      icerik_ozeti: Optional[str] = None) -> bool:
+        """Danışma dosyasını parça parça okuyup il bazında durum sayılarını biriktir
+        
+        Sayımlar self.danisma_sayimi'na (aylar, sayım tablosu) yazılır; self.veriler['danisma']
+        diğer aktivitelerde olduğu gibi il isimleri standartlaştırılmış ham satırlardır.
+        Sayımlar ve satırlar aynı geçişte elde edilir, dosya bir kez ayrıştırılır.
+        """
+        try:
+            icerik_ozeti = icerik_ozeti or self._dosya_ozeti(dosya_yolu)
+            self.aktivite_girdi_ozetleri['danisma'] = icerik_ozeti
+            onbellek_yolu = self._onbellek_yolu('danisma_sayim', icerik_ozeti)
+            onbellek = self._onbellekten_oku(onbellek_yolu)
+            if onbellek is not None:
+                aylar, sayim, satirlar = onbellek
+                self.danisma_sayimi = (aylar, sayim)
+                self.veriler['danisma'] = satirlar
+                self.temizlenen_aktiviteler.add('danisma')
+                return True
+            
+            baslik = pd.read_csv(dosya_yolu, encoding='utf-8', nrows=0)
+            aylar = self._danisma_ay_sutunlari(baslik.columns)
+            
+            sayim = None
+            parcalar = []
+            for parca in pd.read_csv(dosya_yolu, encoding='utf-8', dtype=str,
+                                     chunksize=parca_boyutu or self.DANISMA_PARCA_BOYUTU):
+                parca = self._aktivite_verisi_temizle('danisma', parca)
+                sayim = self._danisma_sayimlarini_birlestir(sayim, self._danisma_durum_sayimi(parca, aylar))
+                parcalar.append(parca)
+            
+            if sayim is None:
+                sayim = self._danisma_durum_sayimi(baslik.reindex(columns=['İL', 'İLÇE'] + aylar), aylar)
+            satirlar = pd.concat(parcalar, ignore_index=True) if parcalar else self._aktivite_verisi_temizle('danisma', baslik)
+            
+            self.danisma_sayimi = (aylar, sayim)
+            self.veriler['danisma'] = satirlar
+            self.temizlenen_aktiviteler.add('danisma')
+            self._onbellege_yaz(onbellek_yolu, (aylar, sayim, satirlar))
+            return True
+            
+        except Exception as e:
+            print(f"❌ Danışma verisi okunamadı: {e}")
+            return False
+    
+    def _danisma_puani_hesapla_vektorel(self):
+        """Danışma meclisi puanı - il bazında durum sayımlarından tüm iller birlikte"""
+        max_puan = self.aktivite_katsayilari.get('danisma', 3.0) * 10
+        
+        if self.danisma_sayimi is not None:
+            aylar, sayim = self.danisma_sayimi
+        else:
+            df = self.veriler['danisma']
+            aylar = self._danisma_ay_sutunlari(df.columns)
+            sayim = self._danisma_durum_sayimi(df, aylar)
+        
+        il_listesi = self._il_listesi_al()
+        sayim = sayim.reindex(il_listesi, fill_value=0)
+        il_sayisi = sayim['IL_SAYISI'].to_numpy()
+        ilce_sayisi = sayim['ILCE_SAYISI'].to_numpy()
+        
+        # Aylık oranlar: YAPILDI = 1, en son ayda PLANLANDI = 0.7
+        il_toplam = np.zeros(len(il_listesi))
+        ilce_oran_toplam = np.zeros(len(il_listesi))
+        bolen = np.where(ilce_sayisi > 0, ilce_sayisi, 1)
+        for i, ay in enumerate(aylar):
+            son_ay = i == len(aylar) - 1
+            il_yapildi = sayim[f'IL_{ay}_YAPILDI'].to_numpy()
+            ilce_yapildi = sayim[f'ILCE_{ay}_YAPILDI'].to_numpy()
+            if son_ay:
+                il_planlandi = sayim[f'IL_{ay}_PLANLANDI'].to_numpy()
+                il_toplam = il_toplam + np.where(il_yapildi > 0, 1, np.where(il_planlandi > 0, 0.7, 0))
+                ilce_oran_toplam = ilce_oran_toplam + (ilce_yapildi + sayim[f'ILCE_{ay}_PLANLANDI'].to_numpy() * 0.7) / bolen
+            else:
+                il_toplam = il_toplam + il_yapildi
+                ilce_oran_toplam = ilce_oran_toplam + ilce_yapildi / bolen
+        
+        ay_sayisi = max(len(aylar), 1)
+        
+        il_var = il_sayisi > 0
+        ilce_var = ilce_sayisi > 0
+        il_ortalama = np.where(il_var, il_toplam / ay_sayisi, 0.0)
+        ilce_ortalama = np.where(ilce_var, ilce_oran_toplam / ay_sayisi, 0.0)
+        
+        # İl başkanlığı (15/30) ve ilçe (15/30) puanları
+        il_max = max_puan * (15/30)
+        ilce_max = max_puan * (15/30)
+        il_puan = np.where(il_var, self._danisma_puan_hesapla_base(il_ortalama, il_max), 0.0)
+        ilce_puan = np.where(ilce_var, self._danisma_puan_hesapla_base(ilce_ortalama, ilce_max), 0.0)
+        
+        # Kategori katsayısı bonusu
+        kategori_katsayi = np.array([self.kategori_katsayilar.get(il, {}).get('katsayi', 1.0) for il in il_listesi], dtype=float)
+        bonus_var = ilce_var & (kategori_katsayi > 1.0) & (ilce_ortalama >= 0.5)
+        ilce_bonus = np.where(bonus_var, np.minimum(max_puan * (4/30), (kategori_katsayi - 1.0) * max_puan * (16/30)), 0.0)
+        ilce_final_puan = np.where(bonus_var, np.minimum(ilce_max, ilce_puan + ilce_bonus), ilce_puan)
+        
+        final_puan = il_puan + ilce_final_puan
+        genel_ortalama = (il_ortalama + ilce_ortalama) / 2
+        toplam_birim = il_sayisi + ilce_sayisi
+        
+        # Hiç birimi olmayan illerde detay sadece toplam puandır (0)
+        birim_var = toplam_birim > 0
+        il_adlari = np.asarray(il_listesi, dtype=object)
+        return AktivitePuanlari.dizilerden(self._il_boyutu_al(), 'danisma', il_adlari, self._il_boyutu_al().konumlar(il_adlari), {
+            'il_ortalama': il_ortalama.astype(float),
+            'ilce_ortalama': ilce_ortalama.astype(float),
+            'genel_ortalama': genel_ortalama.astype(float),
+            'il_puan': il_puan.astype(float),
+            'ilce_puan': ilce_puan.astype(float),
+            'il_final_puan': il_puan.astype(float),
+            'ilce_final_puan': ilce_final_puan.astype(float),
+            'ilce_bonus': ilce_bonus.astype(float),
+            'toplam_danisma': np.where(birim_var, final_puan, 0.0).astype(float),
+            'il_sayisi': il_sayisi.astype(np.int64),
+            'ilce_sayisi': ilce_sayisi.astype(np.int64),
+            'toplam_birim': toplam_birim.astype(np.int64)
+        }, detay_var=birim_var)
+    
     def _ramazan_puani_hesapla(self):
         """Ramazan puanı hesaplama (10'luk sisteme uyarlanmış)"""
         puanlar = {}
@@ -814,6 +2173,9 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         if 'ramazan' not in self.veriler:
             return puanlar
         
+        if self.vektorel_hesaplama:
+            return self._ramazan_puani_hesapla_vektorel()
+        
         nufus_bilgileri = self._nufus_verileri_yukle()
         
         # Nüfus erişim oranları
@@ -864,18 +2226,7 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
                 if sutun in row and pd.notna(row[sutun]) and row[sutun] != '' and row[sutun] != 0:
                     aktivite_sayisi += 1
             
-            if aktivite_sayisi >= 8:
-                aktivite_puan = max_puan * aktivite_oran
-            elif aktivite_sayisi >= 6:
-                aktivite_puan = max_puan * aktivite_oran * (4/5)
-            elif aktivite_sayisi >= 4:
-                aktivite_puan = max_puan * aktivite_oran * (3/5)
-            elif aktivite_sayisi >= 2:
-                aktivite_puan = max_puan * aktivite_oran * (2/5)
-            elif aktivite_sayisi >= 1:
-                aktivite_puan = max_puan * aktivite_oran * (1/5)
-            else:
-                aktivite_puan = 0
+            aktivite_puan = max_puan * aktivite_oran * self._esik_carpani('ramazan_aktivite', aktivite_sayisi)
             
             toplam_ramazan = erisim_puan + aktivite_puan
             
@@ -900,6 +2251,9 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         if 'bayrak' not in self.veriler:
             return puanlar
         
+        if self.vektorel_hesaplama:
+            return self._bayrak_puani_hesapla_vektorel()
+        
         nufus_bilgileri = self._nufus_verileri_yukle()
         
         # Nüfus bayrak oranları
@@ -935,12 +2289,7 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
             bonus_oran = 2/10
             calisma_turu_temiz = str(calisma_turu).strip().upper()
             
-            if calisma_turu_temiz == 'TOPLANTI':
-                tur_bonus = max_puan * bonus_oran
-            elif calisma_turu_temiz == 'DUYURU':
-                tur_bonus = max_puan * bonus_oran * (1/2)
-            else:
-                tur_bonus = 0
+            tur_bonus = max_puan * bonus_oran * self.calisma_turu_carpanlari.get(calisma_turu_temiz, 0)
             
             toplam_bayrak = erisim_puan + tur_bonus
             
@@ -957,95 +2306,207 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         
         return puanlar
     
+    def _satir_nufuslari(self, df: pd.DataFrame) -> np.ndarray:
+        """DataFrame satırlarının il nüfusları"""
+        nufus_bilgileri = self._nufus_verileri_yukle()
+        
+        # Plaka kodu varsa nüfus tamsayı anahtarla (dizi erişimi) eşleştirilir
+        if self.IL_KODU_SUTUNU in df.columns and self.il_referans is not None:
+            return self.il_referans.nufus_dizisi_al(df[self.IL_KODU_SUTUNU].to_numpy(), df['İL'].to_numpy())
+        return df['İL'].map(nufus_bilgileri).fillna(self.VARSAYILAN_NUFUS).to_numpy(dtype=float)
+    
+    def _nufus_orani_hesapla(self, df: pd.DataFrame, sutun: str, carpan: float):
+        """Nüfusu bir kez eşleştirip (sayı / nüfus) * çarpan oranını ve min-max normalizasyonunu hesapla"""
+        nufus = self._satir_nufuslari(df)
+        if sutun in df.columns:
+            sayilar = pd.to_numeric(df[sutun], errors='coerce').to_numpy(dtype=float)
+        else:
+            sayilar = np.zeros(len(df))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            oranlar = np.where(nufus > 0, (sayilar / np.where(nufus > 0, nufus, 1)) * carpan, 0.0)
+        
+        if len(oranlar) > 0 and np.nanmax(oranlar) > np.nanmin(oranlar):
+            min_oran = np.nanmin(oranlar)
+            normalize = (oranlar - min_oran) / (np.nanmax(oranlar) - min_oran)
+        else:
+            normalize = np.ones(len(oranlar))
+        
+        return sayilar, nufus, oranlar, normalize
+    
+    def _ramazan_puani_hesapla_vektorel(self):
+        """Ramazan puanı - nüfus tek seferde eşleştirilir, satır döngüsü yok"""
+        df = self.veriler['ramazan']
+        df = df[df['İL'] != 'TOPLAM']
+        max_puan = self.aktivite_katsayilari.get('ramazan', 2.0) * 10
+        
+        toplam_kisi, nufus, erisim_oranlari, normalize = self._nufus_orani_hesapla(df, 'TOPLAM ULAŞILAN KİŞİ', 100)
+        
+        # Nüfus erişim puanı (15/20) ve aktivite çeşitliliği (5/20)
+        erisim_puan = normalize * max_puan * (15/20)
+        
+        sutunlar = [sutun for sutun in self.RAMAZAN_AKTIVITE_SUTUNLARI if sutun in df.columns]
+        aktivite_sayisi = df[sutunlar].replace(['', 0], np.nan).notna().sum(axis=1).to_numpy()
+        aktivite_puan = max_puan * (5/20) * self._esik_carpani('ramazan_aktivite', aktivite_sayisi)
+        
+        toplam_ramazan = erisim_puan + aktivite_puan
+        
+        return AktivitePuanlari.dizilerden(self._il_boyutu_al(), 'ramazan', df['İL'].to_numpy(), self._il_konumlari(df), {
+            'erişim_puan': erisim_puan,
+            'aktivite_puan': aktivite_puan,
+            'aktivite_sayisi': aktivite_sayisi,
+            'toplam_ulaşilan': toplam_kisi,
+            'nufus': nufus,
+            'nufus_erisim_orani': erisim_oranlari,
+            'normalize_oran': normalize,
+            'toplam_ramazan': toplam_ramazan
+        })
+    
+    def _bayrak_puani_hesapla_vektorel(self):
+        """Bayrak puanı - nüfus tek seferde eşleştirilir, satır döngüsü yok"""
+        df = self.veriler['bayrak']
+        max_puan = self.aktivite_katsayilari.get('bayrak', 1.0) * 10
+        
+        bayrak_sayisi, nufus, bayrak_oranlari, normalize = self._nufus_orani_hesapla(df, 'BAYRAK ADEDİ', 1000)
+        
+        # Nüfus erişim puanı (8/10) ve çalışma türü bonusu (2/10)
+        erisim_puan = normalize * max_puan * (8/10)
+        
+        if 'YAPILAN ÇALIŞMA' in df.columns:
+            calisma_turu = df['YAPILAN ÇALIŞMA'].astype(str).str.strip().str.upper()
+        else:
+            calisma_turu = pd.Series([''] * len(df), index=df.index)
+        tur_bonus = max_puan * (2/10) * calisma_turu.map(self.calisma_turu_carpanlari).fillna(0).to_numpy(dtype=float)
+        
+        toplam_bayrak = erisim_puan + tur_bonus
+        
+        return AktivitePuanlari.dizilerden(self._il_boyutu_al(), 'bayrak', df['İL'].to_numpy(), self._il_konumlari(df), {
+            'erisim_puan': erisim_puan,
+            'tur_bonus': tur_bonus,
+            'bayrak_sayisi': bayrak_sayisi,
+            'nufus': nufus,
+            'nufus_bayrak_orani': bayrak_oranlari,
+            'normalize_oran': normalize,
+            'calisma_turu': calisma_turu.to_numpy(dtype=object),
+            'toplam_bayrak': toplam_bayrak
+        })
+    
+    @staticmethod
+    def _ozet_al(*parcalar) -> str:
+        """JSON'a çevrilebilir parçaların SHA-256 özeti (bağımlılık anahtarları için)"""
+        metin = json.dumps(parcalar, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(metin.encode('utf-8')).hexdigest()
+    
+    def _aktivite_girdi_ozeti(self, aktivite: str) -> str:
+        """Aktivitenin girdi özeti - dosyadan yüklenmediyse DataFrame içeriğinden hesaplanır"""
+        if aktivite not in self.aktivite_girdi_ozetleri:
+            df = self.veriler[aktivite]
+            satir_ozetleri = pd.util.hash_pandas_object(df, index=True).to_numpy()
+            ozet = hashlib.sha256(satir_ozetleri.tobytes())
+            ozet.update(json.dumps(list(map(str, df.columns)), ensure_ascii=False).encode('utf-8'))
+            self.aktivite_girdi_ozetleri[aktivite] = ozet.hexdigest()
+        return self.aktivite_girdi_ozetleri[aktivite]
+    
+    def _aktivite_bagimlilik_anahtari(self, aktivite: str) -> str:
+        """Aktivite puanlarını belirleyen tüm girdilerin özeti
+        
+        Girdi dosyası, il kategorileri/nüfus, eşik tabloları ve puanlama sürümü
+        değişmedikçe anahtar aynı kalır. Katsayı anahtara girmez: puanlar katsayıyla
+        doğrusal olduğundan PuanSonuclari.olustur tarafından ölçeklenir. Sadece
+        sıfır katsayı (tüm puanlar 0, ölçeklenemez) ayrı tutulur.
+        """
+        return self._ozet_al(
+            aktivite,
+            self._aktivite_girdi_ozeti(aktivite),
+            self.aktivite_katsayilari.get(aktivite, 1.0) > 0,
+            self.kategori_anahtari,
+            self.nufus_ozeti,
+            self.esik_tablolari,
+            self.calisma_turu_carpanlari,
+            self.vektorel_hesaplama,
+            self._il_boyutu_al().ozet,
+            self.VERI_TEMIZLEME_SURUMU,
+            self.PUANLAMA_SURUMU
+        )
+    
+    def _kalici_onbellege_uygun(self, aktivite: str) -> bool:
+        """Sadece sınıfta tanımlı (çekirdek) hesaplama metodlarının puanları diske yazılır
+        
+        Dinamik metodların kaynak kodu anahtara girmediği için bellekte tutulur.
+        """
+        metod = self.hesaplama_metodlari.get(aktivite)
+        return (getattr(metod, '__self__', None) is self and
+                hasattr(type(self), getattr(metod, '__name__', '')))
+    
+    def _aktivite_puanlarini_onbellekten_al(self, aktivite: str, anahtar: str) -> Optional[AktivitePuanlari]:
+        """Anahtarı eşleşen önbellekteki aktivite puanlarını döndür (yoksa None)"""
+        onceki = self.aktivite_puan_onbellegi.get(aktivite)
+        if onceki is not None and onceki[0] == anahtar:
+            return onceki[1]
+        
+        if not self._kalici_onbellege_uygun(aktivite):
+            return None
+        
+        puanlar = self._onbellekten_oku(self._onbellek_yolu(f'puan_{aktivite}', anahtar))
+        if puanlar is not None:
+            self.aktivite_puan_onbellegi[aktivite] = (anahtar, puanlar)
+        return puanlar
+    
+    def _aktivite_puanlarini_onbellege_al(self, aktivite: str, anahtar: str, puanlar: AktivitePuanlari):
+        """Hesaplanan aktivite puanlarını bellek (ve uygunsa disk) önbelleğine yaz"""
+        self.aktivite_puan_onbellegi[aktivite] = (anahtar, puanlar)
+        if self._kalici_onbellege_uygun(aktivite):
+            self._onbellege_yaz(self._onbellek_yolu(f'puan_{aktivite}', anahtar), puanlar)
+    
     def genel_puanlama_hesapla(self):
         """Tüm aktiviteler için genel puanlamayı hesapla - Yüzdelik Ağırlık Sistemi"""
         print("🧮 Dinamik puanlama hesaplamaları başlıyor...")
         
         # Tüm aktiviteler için puanları hesapla (sadece verisi olanlar)
+        # Girdisi, katsayısı veya bağımlılıkları değişmeyen aktiviteler önbellekten gelir
         aktivite_puanlari = {}
         for aktivite, hesaplama_metodu in self.hesaplama_metodlari.items():
             # Verisi olmayan aktiviteleri pas geç
             if aktivite not in self.veriler:
                 print(f"⏭️ {aktivite.title()} aktivitesi pas geçildi (veri yok)")
                 continue
+            
+            anahtar = self._aktivite_bagimlilik_anahtari(aktivite)
+            onbellek = self._aktivite_puanlarini_onbellekten_al(aktivite, anahtar)
+            if onbellek is not None:
+                aktivite_puanlari[aktivite] = onbellek
+                print(f"♻️ {aktivite.title()} aktivitesi değişmedi (önbellekten)")
+                continue
                 
             try:
-                aktivite_puanlari[aktivite] = hesaplama_metodu()
+                puanlar = hesaplama_metodu()
+                # Sözlük döndüren (döngüsel/dinamik) metodların sonucu il boyutuna hizalanır
+                if not isinstance(puanlar, AktivitePuanlari):
+                    puanlar = AktivitePuanlari.sozlukten(self._il_boyutu_al(), aktivite, puanlar)
+                puanlar.katsayi = self.aktivite_katsayilari.get(aktivite, 1.0)
+                aktivite_puanlari[aktivite] = puanlar
+                self._aktivite_puanlarini_onbellege_al(aktivite, anahtar, puanlar)
                 print(f"✅ {aktivite.title()} aktivitesi hesaplandı")
             except Exception as e:
                 print(f"❌ {aktivite.title()} aktivitesi hesaplanamadı: {e}")
-                aktivite_puanlari[aktivite] = {}
+                aktivite_puanlari[aktivite] = AktivitePuanlari.sozlukten(self._il_boyutu_al(), aktivite, {})
+        
+        self.aktivite_puanlari = aktivite_puanlari
         
         # Toplam katsayıyı hesapla
         toplam_katsayi = sum(self.aktivite_katsayilari.values())
         print(f"📊 Toplam katsayı: {toplam_katsayi}")
         
-        # Her aktivitenin yüzdelik ağırlığını hesapla
-        aktivite_agirlikları = {}
+        # Her aktivitenin yüzdelik ağırlığını göster
         for aktivite, katsayi in self.aktivite_katsayilari.items():
-            agirlik = (katsayi / toplam_katsayi) * 100
-            aktivite_agirlikları[aktivite] = agirlik
+            agirlik = (katsayi / toplam_katsayi) * 100 if toplam_katsayi > 0 else 0
             print(f"🎯 {aktivite.title()}: {katsayi} katsayı = %{agirlik:.2f} ağırlık")
         
-        # İl listesi al
-        il_listesi = set()
-        for puanlar in aktivite_puanlari.values():
-            il_listesi.update(puanlar.keys())
-        
-        genel_sonuclar = {}
-        
-        for il in il_listesi:
-            # Her aktiviteden ağırlıklı puanları hesapla
-            toplam_puan = 0
-            aktivite_detaylari = {}
-            
-            for aktivite, puanlar in aktivite_puanlari.items():
-                if il in puanlar:
-                    # Ham aktivite puanını al
-                    ham_aktivite_puan = puanlar[il].get(f'toplam_{aktivite}', 0)
-                    
-                    # Aktivite katsayısına göre maksimum puanı hesapla
-                    aktivite_katsayi = self.aktivite_katsayilari.get(aktivite, 1.0)
-                    max_aktivite_puan = aktivite_katsayi * 10
-                    
-                    # Ham puanı 0-1 arasında normalize et
-                    if max_aktivite_puan > 0:
-                        normalize_puan = min(ham_aktivite_puan / max_aktivite_puan, 1.0)
-                    else:
-                        normalize_puan = 0
-                    
-                    # Yüzdelik ağırlığa göre final puanı hesapla
-                    aktivite_agirlik = aktivite_agirlikları.get(aktivite, 0)
-                    final_aktivite_puan = normalize_puan * aktivite_agirlik
-                    
-                    toplam_puan += final_aktivite_puan
-                    aktivite_detaylari[f'{aktivite}_ham_puan'] = ham_aktivite_puan
-                    aktivite_detaylari[f'{aktivite}_normalize_puan'] = normalize_puan
-                    aktivite_detaylari[f'{aktivite}_agirlik'] = aktivite_agirlik
-                    aktivite_detaylari[f'{aktivite}_final_puan'] = final_aktivite_puan
-                    aktivite_detaylari[f'{aktivite}_detay'] = puanlar[il]
-                else:
-                    aktivite_agirlik = aktivite_agirlikları.get(aktivite, 0)
-                    aktivite_detaylari[f'{aktivite}_ham_puan'] = 0
-                    aktivite_detaylari[f'{aktivite}_normalize_puan'] = 0
-                    aktivite_detaylari[f'{aktivite}_agirlik'] = aktivite_agirlik
-                    aktivite_detaylari[f'{aktivite}_final_puan'] = 0
-                    aktivite_detaylari[f'{aktivite}_detay'] = {}
-            
-            # İl bilgileri
-            il_kategori = self.il_kategorileri.get(il, {})
-            kategori_katsayi = self.kategori_katsayilar.get(il, {})
-            
-            genel_sonuclar[il] = {
-                'il_adi': il,
-                'il_kategorisi': il_kategori.get('kategori', 'Bilinmiyor'),
-                'kategori_grup': kategori_katsayi.get('grup', 'Orta İl'),
-                'kategori_katsayi': kategori_katsayi.get('katsayi', 1.0),
-                'nufus': il_kategori.get('nufus', 0),
-                'toplam_puan': toplam_puan,  # Bu artık 100 üzerinden
-                'toplam_katsayi': toplam_katsayi,
-                **aktivite_detaylari
-            }
+        # İl × aktivite matrisi: normalize, ağırlık ve final puanlar dizilerle hesaplanır
+        genel_sonuclar = PuanSonuclari.olustur(
+            aktivite_puanlari, self.aktivite_katsayilari,
+            self.il_kategorileri, self.kategori_katsayilar
+        )
         
         self.sonuclar = genel_sonuclar
         print("✅ Yüzdelik ağırlık sistemiyle dinamik genel puanlama hesaplandı")
@@ -1058,54 +2519,11 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         # Toplam katsayıyı hesapla
         toplam_katsayi = sum(self.aktivite_katsayilari.values())
         
-        # Ana rapor verilerini hazırla
-        rapor_data = []
-        for il, veri in self.sonuclar.items():
-            rapor_row = {
-                'İL': il,
-                'İL_KATEGORİSİ': veri['il_kategorisi'],
-                'KATEGORİ_GRUP': veri['kategori_grup'],
-                'KATEGORİ_KATSAYI': veri['kategori_katsayi'],
-                'NÜFUS': veri.get('nufus', 0),
-                'TOPLAM_PUAN': round(veri['toplam_puan'], 2),  # 100 üzerinden
-                'TOPLAM_KATSAYI': veri.get('toplam_katsayi', toplam_katsayi)
-            }
-            
-            # Her aktivite için detaylı puanları ekle
-            for aktivite in self.hesaplama_metodlari.keys():
-                ham_key = f'{aktivite}_ham_puan'
-                final_key = f'{aktivite}_final_puan'
-                agirlik_key = f'{aktivite}_agirlik'
-                
-                # Ham puan
-                if ham_key in veri:
-                    rapor_row[f'{aktivite.upper()}_HAM_PUAN'] = round(veri[ham_key], 1)
-                else:
-                    rapor_row[f'{aktivite.upper()}_HAM_PUAN'] = 0
-                
-                # Final puan (ağırlıklı)
-                if final_key in veri:
-                    rapor_row[f'{aktivite.upper()}_FINAL_PUAN'] = round(veri[final_key], 2)
-                else:
-                    rapor_row[f'{aktivite.upper()}_FINAL_PUAN'] = 0
-                
-                # Ağırlık yüzdesi
-                if agirlik_key in veri:
-                    rapor_row[f'{aktivite.upper()}_AGIRLIK'] = round(veri[agirlik_key], 2)
-                else:
-                    katsayi = self.aktivite_katsayilari.get(aktivite, 0)
-                    agirlik = (katsayi / toplam_katsayi) * 100 if toplam_katsayi > 0 else 0
-                    rapor_row[f'{aktivite.upper()}_AGIRLIK'] = round(agirlik, 2)
-            
-            rapor_data.append(rapor_row)
-        
-        # DataFrame oluştur ve sırala
-        df_rapor = pd.DataFrame(rapor_data)
-        df_rapor = df_rapor.sort_values('TOPLAM_PUAN', ascending=False)
-        df_rapor['GENEL_SIRALAMA'] = range(1, len(df_rapor) + 1)
+        # Ana rapor tablosu (il × aktivite dizilerinden)
+        df_rapor = self.sonuclar.rapor_tablosu(list(self.hesaplama_metodlari.keys()))
         
         # Ana raporu kaydet
-        df_rapor.to_csv('output_csv/Dinamik_Genel_Performans_Raporu.csv', 
+        df_rapor.to_csv(self.cikti_klasoru / 'Dinamik_Genel_Performans_Raporu.csv', 
                        index=False, encoding='utf-8-sig')
         
         # Aktivite katsayıları ve ağırlıkları raporunu oluştur
@@ -1133,7 +2551,7 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         }
         katsayi_df = pd.concat([katsayi_df, pd.DataFrame([toplam_row])], ignore_index=True)
         
-        katsayi_df.to_csv('output_csv/Aktivite_Katsayi_Agirlik_Raporu.csv', 
+        katsayi_df.to_csv(self.cikti_klasoru / 'Aktivite_Katsayi_Agirlik_Raporu.csv', 
                          index=False, encoding='utf-8-sig')
         
         print("✅ Yüzdelik ağırlık sistemiyle dinamik raporlar oluşturuldu")
@@ -1162,6 +2580,7 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         print("  - output_csv/Aktivite_Katsayi_Agirlik_Raporu.csv (Ağırlık analizi)")
         print("🔧 KONFİGÜRASYON DOSYALARI:")
         print("  - dynamic_configs/ (Yeni aktivite konfigürasyonları)")
+        print("  - dynamic_configs/inceleme_kuyrugu.json (Manifestoda olmayan, incelemedeki dosyalar)")
         print("  - dynamic_methods/ (Dinamik hesaplama metodları)")
         
         # Toplam katsayı ve ağırlık bilgilerini göster
@@ -1170,7 +2589,7 @@ Sadece Python fonksiyonunu döndür, açıklama yazma:
         print(f"📊 Toplam Katsayı: {toplam_katsayi}")
         print(f"🎯 Aktivite Ağırlıkları:")
         for aktivite, katsayi in sorted(self.aktivite_katsayilari.items(), key=lambda x: x[1], reverse=True):
-            agirlik = (katsayi / toplam_katsayi) * 100
+            agirlik = (katsayi / toplam_katsayi) * 100 if toplam_katsayi > 0 else 0
             print(f"   - {aktivite.title()}: {katsayi} katsayı = %{agirlik:.2f}")
         print(f"📈 Toplam {len(self.aktivite_katsayilari)} aktivite analiz edildi")
         
@@ -6,9 +6,16 @@ Bu script, data klasöründeki tüm CSV dosyalarındaki il isimlerini standartla
 """
 
 import os
+import json
+import hashlib
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
 import glob
-from typing import Dict, List, Optional
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # Logging ayarları
@@ -235,6 +242,59 @@ STANDARD_PROVINCES = {
     'KILIS': 'KİLİS',
 }
 
+# Standart 81 il listesi (kanonik isimler)
+CANONICAL_PROVINCES = (
+    'ADANA', 'ADIYAMAN', 'AFYONKARAHİSAR', 'AĞRI', 'AKSARAY', 'AMASYA', 'ANKARA', 'ANTALYA',
+    'ARDAHAN', 'ARTVİN', 'AYDIN', 'BALIKESİR', 'BARTIN', 'BATMAN', 'BAYBURT', 'BİLECİK',
+    'BİNGÖL', 'BİTLİS', 'BOLU', 'BURDUR', 'BURSA', 'ÇANAKKALE', 'ÇANKIRI', 'ÇORUM', 'DENİZLİ',
+    'DİYARBAKIR', 'DÜZCE', 'EDİRNE', 'ELAZIĞ', 'ERZİNCAN', 'ERZURUM', 'ESKİŞEHİR',
+    'GAZİANTEP', 'GİRESUN', 'GÜMÜŞHANE', 'HAKKARİ', 'HATAY', 'IĞDIR', 'ISPARTA', 'İSTANBUL',
+    'İZMİR', 'KAHRAMANMARAŞ', 'KARABÜK', 'KARAMAN', 'KARS', 'KASTAMONU', 'KAYSERİ',
+    'KIRIKKALE', 'KIRKLARELİ', 'KIRŞEHİR', 'KOCAELİ', 'KONYA', 'KÜTAHYA', 'MALATYA',
+    'MANİSA', 'MARDİN', 'MERSİN', 'MUĞLA', 'MUŞ', 'NEVŞEHİR', 'NİĞDE', 'ORDU', 'OSMANİYE',
+    'RİZE', 'SAKARYA', 'SAMSUN', 'SİİRT', 'SİNOP', 'SİVAS', 'ŞANLIURFA', 'ŞIRNAK', 'TEKİRDAĞ',
+    'TOKAT', 'TRABZON', 'TUNCELİ', 'UŞAK', 'VAN', 'YALOVA', 'YOZGAT', 'ZONGULDAK', 'KİLİS'
+)
+
+# Plaka kodları (1-81) - il bazlı birleştirmelerde tamsayı anahtar olarak kullanılır
+PROVINCE_PLATE_CODES = {
+    'ADANA': 1, 'ADIYAMAN': 2, 'AFYONKARAHİSAR': 3, 'AĞRI': 4, 'AMASYA': 5, 'ANKARA': 6,
+    'ANTALYA': 7, 'ARTVİN': 8, 'AYDIN': 9, 'BALIKESİR': 10, 'BİLECİK': 11, 'BİNGÖL': 12,
+    'BİTLİS': 13, 'BOLU': 14, 'BURDUR': 15, 'BURSA': 16, 'ÇANAKKALE': 17, 'ÇANKIRI': 18,
+    'ÇORUM': 19, 'DENİZLİ': 20, 'DİYARBAKIR': 21, 'EDİRNE': 22, 'ELAZIĞ': 23, 'ERZİNCAN': 24,
+    'ERZURUM': 25, 'ESKİŞEHİR': 26, 'GAZİANTEP': 27, 'GİRESUN': 28, 'GÜMÜŞHANE': 29, 'HAKKARİ': 30,
+    'HATAY': 31, 'ISPARTA': 32, 'MERSİN': 33, 'İSTANBUL': 34, 'İZMİR': 35, 'KARS': 36,
+    'KASTAMONU': 37, 'KAYSERİ': 38, 'KIRKLARELİ': 39, 'KIRŞEHİR': 40, 'KOCAELİ': 41, 'KONYA': 42,
+    'KÜTAHYA': 43, 'MALATYA': 44, 'MANİSA': 45, 'KAHRAMANMARAŞ': 46, 'MARDİN': 47, 'MUĞLA': 48,
+    'MUŞ': 49, 'NEVŞEHİR': 50, 'NİĞDE': 51, 'ORDU': 52, 'RİZE': 53, 'SAKARYA': 54,
+    'SAMSUN': 55, 'SİİRT': 56, 'SİNOP': 57, 'SİVAS': 58, 'TEKİRDAĞ': 59, 'TOKAT': 60,
+    'TRABZON': 61, 'TUNCELİ': 62, 'ŞANLIURFA': 63, 'UŞAK': 64, 'VAN': 65, 'YOZGAT': 66,
+    'ZONGULDAK': 67, 'AKSARAY': 68, 'BAYBURT': 69, 'KARAMAN': 70, 'KIRIKKALE': 71, 'BATMAN': 72,
+    'ŞIRNAK': 73, 'BARTIN': 74, 'ARDAHAN': 75, 'IĞDIR': 76, 'YALOVA': 77, 'KARABÜK': 78,
+    'KİLİS': 79, 'OSMANİYE': 80, 'DÜZCE': 81
+}
+
+# Özel durumlar ve kısaltmalar
+SPECIAL_CASES = {
+    'AFYON': 'AFYONKARAHİSAR',
+    'afyon': 'AFYONKARAHİSAR',
+    'Afyon': 'AFYONKARAHİSAR',
+    'K.MARAS': 'KAHRAMANMARAŞ',
+    'k.maras': 'KAHRAMANMARAŞ',
+    'TOPLAM': 'TOPLAM',  # Özel durum
+    'toplam': 'TOPLAM',
+    'Toplam': 'TOPLAM'
+}
+
+# Kalıcı varyant indeksi (ilk çalıştırmada üretilir, sonra diskten yüklenir)
+PROVINCE_INDEX_VERSION = 1
+PROVINCE_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'veri_cache', 'il_varyant_indeksi.json'
+)
+
+# Bulanık eşleştirme ayarları
+FUZZY_MIN_CONFIDENCE = 0.75
+
 def detect_province_column(df: pd.DataFrame) -> Optional[str]:
     """
     DataFrame'de il sütununu otomatik tespit eder.
@@ -263,40 +323,39 @@ def detect_province_column(df: pd.DataFrame) -> Optional[str]:
     
     return None
 
+# Kapsamlı Türkçe karakter dönüşüm tablosu
+TURKISH_CHAR_MAP = {
+    # I/İ dönüşümleri
+    'I': 'I', 'İ': 'İ', 'i': 'İ', 'ı': 'I',
+    
+    # G/Ğ dönüşümleri  
+    'G': 'G', 'Ğ': 'Ğ', 'g': 'G', 'ğ': 'Ğ',
+    
+    # U/Ü dönüşümleri
+    'U': 'U', 'Ü': 'Ü', 'u': 'U', 'ü': 'Ü',
+    
+    # S/Ş dönüşümleri
+    'S': 'S', 'Ş': 'Ş', 's': 'S', 'ş': 'Ş',
+    
+    # O/Ö dönüşümleri
+    'O': 'O', 'Ö': 'Ö', 'o': 'O', 'ö': 'Ö',
+    
+    # C/Ç dönüşümleri
+    'C': 'C', 'Ç': 'Ç', 'c': 'C', 'ç': 'Ç'
+}
+
+# Önceden derlenmiş dönüşüm tablosu (tek geçişte str.translate)
+TURKISH_TRANSLATE_TABLE = str.maketrans(
+    {old_char: new_char for old_char, new_char in TURKISH_CHAR_MAP.items() if old_char != new_char}
+)
+
 def normalize_turkish_text(text: str) -> str:
     """
     Türkçe karakterleri kapsamlı normalize eder.
     Tüm olası karakter varyasyonlarını standart forma dönüştürür.
     """
-    # Önce büyük harfe çevir
-    result = text.upper()
-    
-    # Kapsamlı Türkçe karakter dönüşüm tablosu
-    turkish_char_map = {
-        # I/İ dönüşümleri
-        'I': 'I', 'İ': 'İ', 'i': 'İ', 'ı': 'I',
-        
-        # G/Ğ dönüşümleri  
-        'G': 'G', 'Ğ': 'Ğ', 'g': 'G', 'ğ': 'Ğ',
-        
-        # U/Ü dönüşümleri
-        'U': 'U', 'Ü': 'Ü', 'u': 'U', 'ü': 'Ü',
-        
-        # S/Ş dönüşümleri
-        'S': 'S', 'Ş': 'Ş', 's': 'S', 'ş': 'Ş',
-        
-        # O/Ö dönüşümleri
-        'O': 'O', 'Ö': 'Ö', 'o': 'O', 'ö': 'Ö',
-        
-        # C/Ç dönüşümleri
-        'C': 'C', 'Ç': 'Ç', 'c': 'C', 'ç': 'Ç'
-    }
-    
-    # Karakter dönüşümlerini uygula
-    for old_char, new_char in turkish_char_map.items():
-        result = result.replace(old_char, new_char)
-    
-    return result
+    # Önce büyük harfe çevir, sonra karakter dönüşümlerini tek geçişte uygula
+    return text.upper().translate(TURKISH_TRANSLATE_TABLE)
 
 def generate_province_variants(province_name: str) -> List[str]:
     """
@@ -354,43 +413,205 @@ def build_comprehensive_province_dict() -> Dict[str, str]:
     Returns:
         Tüm varyantları içeren sözlük
     """
-    # Standart 81 il listesi
-    standard_provinces = [
-        'ADANA', 'ADIYAMAN', 'AFYONKARAHİSAR', 'AĞRI', 'AKSARAY', 'AMASYA', 'ANKARA', 'ANTALYA',
-        'ARDAHAN', 'ARTVİN', 'AYDIN', 'BALIKESİR', 'BARTIN', 'BATMAN', 'BAYBURT', 'BİLECİK',
-        'BİNGÖL', 'BİTLİS', 'BOLU', 'BURDUR', 'BURSA', 'ÇANAKKALE', 'ÇANKIRI', 'ÇORUM', 'DENİZLİ',
-        'DİYARBAKIR', 'DÜZCE', 'EDİRNE', 'ELAZIĞ', 'ERZİNCAN', 'ERZURUM', 'ESKİŞEHİR',
-        'GAZİANTEP', 'GİRESUN', 'GÜMÜŞHANE', 'HAKKARİ', 'HATAY', 'IĞDIR', 'ISPARTA', 'İSTANBUL',
-        'İZMİR', 'KAHRAMANMARAŞ', 'KARABÜK', 'KARAMAN', 'KARS', 'KASTAMONU', 'KAYSERİ',
-        'KIRIKKALE', 'KIRKLARELİ', 'KIRŞEHİR', 'KOCAELİ', 'KONYA', 'KÜTAHYA', 'MALATYA',
-        'MANİSA', 'MARDİN', 'MERSİN', 'MUĞLA', 'MUŞ', 'NEVŞEHİR', 'NİĞDE', 'ORDU', 'OSMANİYE',
-        'RİZE', 'SAKARYA', 'SAMSUN', 'SİİRT', 'SİNOP', 'SİVAS', 'ŞANLIURFA', 'ŞIRNAK', 'TEKİRDAĞ',
-        'TOKAT', 'TRABZON', 'TUNCELİ', 'UŞAK', 'VAN', 'YALOVA', 'YOZGAT', 'ZONGULDAK', 'KİLİS'
-    ]
-    
     comprehensive_dict = {}
     
-    # Her il için varyantları üret
-    for province in standard_provinces:
-        variants = generate_province_variants(province)
+    # Her il için varyantları üret (sıralı: indeks dosyası her seferinde aynı üretilsin)
+    for province in CANONICAL_PROVINCES:
+        variants = sorted(generate_province_variants(province))
         for variant in variants:
             comprehensive_dict[variant] = province
     
     # Özel durumlar ve kısaltmalar ekle
-    special_cases = {
-        'AFYON': 'AFYONKARAHİSAR',
-        'afyon': 'AFYONKARAHİSAR',
-        'Afyon': 'AFYONKARAHİSAR',
-        'K.MARAS': 'KAHRAMANMARAŞ',
-        'k.maras': 'KAHRAMANMARAŞ',
-        'TOPLAM': 'TOPLAM',  # Özel durum
-        'toplam': 'TOPLAM',
-        'Toplam': 'TOPLAM'
+    comprehensive_dict.update(SPECIAL_CASES)
+    
+    return comprehensive_dict
+
+# Bulanık eşleştirme için ASCII katlama tablosu (Türkçe büyük harfler -> ASCII)
+FUZZY_FOLD_TABLE = str.maketrans({'İ': 'I', 'Ğ': 'G', 'Ü': 'U', 'Ş': 'S', 'Ö': 'O', 'Ç': 'C'})
+
+def fuzzy_key(text: str) -> str:
+    """
+    Bulanık eşleştirme anahtarı üretir: normalize eder, ASCII'ye katlar,
+    harf olmayan karakterleri (boşluk, nokta, tire) atar.
+    """
+    folded = normalize_turkish_text(text).translate(FUZZY_FOLD_TABLE)
+    return ''.join(ch for ch in folded if ch.isalpha())
+
+def edit_distance(a: str, b: str) -> int:
+    """İki metin arasındaki Levenshtein mesafesini hesaplar."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+class ProvinceBKTree:
+    """
+    81 kanonik il ismi üzerinde düzenleme mesafesi BK-ağacı.
+    Düğümler [anahtar, il, {mesafe: alt_düğüm}] listeleridir; bu sayede
+    ağaç JSON olarak indeks dosyasına yazılıp aynen geri yüklenebilir.
+    """
+    
+    def __init__(self, root: Optional[list] = None):
+        self.root = root
+    
+    @classmethod
+    def build(cls, provinces) -> 'ProvinceBKTree':
+        tree = cls()
+        for province in provinces:
+            tree.add(fuzzy_key(province), province)
+        return tree
+    
+    def add(self, key: str, province: str):
+        if self.root is None:
+            self.root = [key, province, {}]
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(key, node[0])
+            if distance == 0:
+                return
+            child = node[2].get(str(distance))
+            if child is None:
+                node[2][str(distance)] = [key, province, {}]
+                return
+            node = child
+    
+    def search(self, key: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Anahtara en fazla max_distance uzaklıktaki (mesafe, il) çiftlerini döndürür."""
+        if self.root is None:
+            return []
+        matches = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = edit_distance(key, node[0])
+            if distance <= max_distance:
+                matches.append((distance, node[1]))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in node[2].items():
+                if low <= int(child_distance) <= high:
+                    stack.append(child)
+        return sorted(matches)
+    
+    def to_json(self) -> Optional[list]:
+        return self.root
+
+def _province_index_signature() -> str:
+    """İndeksi üreten girdilerin imzası; değişirse indeks yeniden üretilir."""
+    payload = json.dumps(
+        [PROVINCE_INDEX_VERSION, list(CANONICAL_PROVINCES), SPECIAL_CASES],
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def build_province_index() -> Dict:
+    """Varyant sözlüğü ve BK-ağacından oluşan seri hale getirilebilir indeksi üretir."""
+    return {
+        'version': PROVINCE_INDEX_VERSION,
+        'signature': _province_index_signature(),
+        'variants': build_comprehensive_province_dict(),
+        'bktree': ProvinceBKTree.build(CANONICAL_PROVINCES).to_json()
     }
+
+def load_province_index(index_path: Optional[str] = None) -> Dict:
+    """
+    Kalıcı varyant indeksini yükler. Dosya yoksa veya imzası güncel değilse
+    indeksi üretip atomik olarak diske yazar (geçici dosya + os.replace).
+    """
+    index_path = index_path or PROVINCE_INDEX_PATH
+    signature = _province_index_signature()
     
-    comprehensive_dict.update(special_cases)
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('signature') == signature:
+            return index
+        logger.info("İl varyant indeksi güncel değil, yeniden oluşturuluyor...")
+    except FileNotFoundError:
+        logger.info("İl varyant indeksi oluşturuluyor...")
+    except (OSError, ValueError) as e:
+        logger.warning(f"İl varyant indeksi okunamadı, yeniden oluşturuluyor: {e}")
     
-    return comprehensive_dict
+    index = build_province_index()
+    
+    try:
+        index_dir = os.path.dirname(index_path)
+        os.makedirs(index_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(temp_path, index_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.info(f"Toplam {len(index['variants'])} varyant indekse yazıldı: {index_path}")
+    except OSError as e:
+        logger.warning(f"İl varyant indeksi diske yazılamadı (bellekte kullanılacak): {e}")
+    
+    return index
+
+_province_index = None
+_province_bktree = None
+_province_index_lock = threading.Lock()
+
+def get_province_index() -> Dict[str, str]:
+    """Süreç içinde bir kez yüklenen varyant sözlüğünü döndürür."""
+    global _province_index, _province_bktree
+    if _province_index is None:
+        with _province_index_lock:
+            if _province_index is None:
+                index = load_province_index()
+                _province_bktree = ProvinceBKTree(index['bktree'])
+                _province_index = index['variants']
+    return _province_index
+
+def fuzzy_match_province(province_name: str,
+                         min_confidence: float = FUZZY_MIN_CONFIDENCE) -> Optional[Tuple[str, float]]:
+    """
+    Yanlış yazılmış il ismini BK-ağacı ile en yakın kanonik ile eşler.
+    
+    Args:
+        province_name: Ham il ismi
+        min_confidence: Kabul için gereken en düşük güven skoru (0-1)
+        
+    Returns:
+        (il, güven) çifti veya eşleşme yoksa / belirsizse None
+    """
+    key = fuzzy_key(str(province_name))
+    if not key:
+        return None
+    
+    get_province_index()
+    
+    # Kısa isimlerde (VAN, MUŞ, KARS...) sadece ASCII katlama ile birebir eşleşme
+    if len(key) <= 4:
+        max_distance = 0
+    elif len(key) <= 8:
+        max_distance = 1
+    else:
+        max_distance = 2
+    
+    matches = _province_bktree.search(key, max_distance)
+    if not matches:
+        return None
+    
+    best_distance, best_province = matches[0]
+    # Aynı mesafede birden fazla aday varsa belirsiz - tahmin etme
+    if len(matches) > 1 and matches[1][0] == best_distance:
+        return None
+    
+    confidence = 1.0 - best_distance / max(len(key), len(fuzzy_key(best_province)))
+    if confidence < min_confidence:
+        return None
+    
+    return best_province, round(confidence, 3)
 
 def standardize_province_name(province_name: str) -> str:
     """
@@ -412,13 +633,8 @@ def standardize_province_name(province_name: str) -> str:
     if not clean_name:
         return province_name
     
-    # Kapsamlı varyant sözlüğünü kullan (cache için global değişken)
-    if not hasattr(standardize_province_name, '_comprehensive_dict'):
-        logger.info("İl varyant sözlüğü oluşturuluyor...")
-        standardize_province_name._comprehensive_dict = build_comprehensive_province_dict()
-        logger.info(f"Toplam {len(standardize_province_name._comprehensive_dict)} varyant yüklendi")
-    
-    comprehensive_dict = standardize_province_name._comprehensive_dict
+    # Kalıcı varyant indeksini kullan (süreç başına bir kez diskten yüklenir)
+    comprehensive_dict = get_province_index()
     
     # 1. Direkt eşleşme kontrolü
     if clean_name in comprehensive_dict:
@@ -466,102 +682,260 @@ def standardize_province_name(province_name: str) -> str:
     if upper_name in manual_special_cases:
         return manual_special_cases[upper_name]
     
+    # 7. Bulanık eşleştirme (yazım hataları için BK-ağacı)
+    fuzzy_match = fuzzy_match_province(clean_name)
+    if fuzzy_match is not None:
+        matched_province, confidence = fuzzy_match
+        logger.info(f"Bulanık eşleşme: '{province_name}' -> '{matched_province}' (güven: {confidence:.2f})")
+        return matched_province
+    
     # Bulunamadıysa uyarı ver ve orijinal değeri döndür
     if clean_name.upper() != 'TOPLAM':  # TOPLAM satırı için uyarı verme
         logger.warning(f"Bilinmeyen il ismi: '{province_name}' -> Standartlaştırılamadı")
     
     return province_name
 
-def process_csv_file(file_path: str, backup: bool = False) -> bool:
+def standardize_province_series(values: pd.Series) -> pd.Series:
     """
-    Tek bir CSV dosyasını işler.
+    Bir il sütununu toplu olarak standartlaştırır.
+    Her farklı değer sadece bir kez standartlaştırılır, sonuç satırlara
+    kod dizisiyle (take) geri dağıtılır. İlçe bazlı dosyalarda aynı il
+    ismi onlarca kez tekrarlandığı için satır satır apply'dan çok daha hızlıdır.
+    
+    Args:
+        values: Ham il isimlerini içeren sütun
+        
+    Returns:
+        Aynı index ile standartlaştırılmış sütun (boş değerler korunur)
+    """
+    codes, uniques = pd.factorize(values)
+    
+    standardized = np.empty(len(uniques) + 1, dtype=object)
+    standardized[:-1] = [standardize_province_name(value) for value in uniques]
+    
+    # -1 kodu (boş değer) son elemana düşer; orijinal boş değer geri yazılır
+    result = standardized.take(codes)
+    missing = codes == -1
+    if missing.any():
+        result[missing] = values.to_numpy(dtype=object)[missing]
+    
+    return pd.Series(result, index=values.index, name=values.name)
+
+def atomic_write_csv(df: pd.DataFrame, file_path: str):
+    """
+    DataFrame'i geçici dosyaya yazıp os.replace ile hedefin üzerine taşır.
+    Yazma yarıda kesilirse orijinal dosya bozulmadan kalır.
+    """
+    target_dir = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix='.', suffix='.csv.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            df.to_csv(f, index=False)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def standardize_province_codes(values: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """
+    İl sütununu standartlaştırır ve her satırın plaka kodunu döndürür.
+    Dosyaları yeniden yazmadan, yükleme sırasında bellekte kullanılır.
+    
+    Args:
+        values: Ham il isimlerini içeren sütun
+        
+    Returns:
+        (standartlaştırılmış sütun, plaka kodu dizisi) - il olmayan değerler
+        (TOPLAM, boş, bilinmeyen) için kod 0
+    """
+    standardized = standardize_province_series(values)
+    codes = standardized.map(PROVINCE_PLATE_CODES).fillna(0).to_numpy(dtype=np.int64)
+    return standardized, codes
+
+def process_csv_file_report(file_path: str, backup: bool = False, dry_run: bool = False) -> Dict:
+    """
+    Tek bir CSV dosyasını işler ve dosya bazlı sonuç raporu döndürür.
     
     Args:
         file_path: CSV dosya yolu
         backup: Yedekleme yapılsın mı
+        dry_run: True ise dosyaya yazılmaz, sadece yapılacak değişiklikler raporlanır
         
     Returns:
-        İşlem başarılı mı
+        Rapor sözlüğü: success, province_column, rows, changes, examples, written, error
     """
+    report = {
+        'file': file_path,
+        'success': False,
+        'dry_run': dry_run,
+        'province_column': None,
+        'rows': 0,
+        'changes': 0,
+        'examples': [],
+        'written': False,
+        'error': None
+    }
+    
     try:
         logger.info(f"İşleniyor: {file_path}")
         
         # Dosyayı oku
         df = pd.read_csv(file_path, encoding='utf-8')
+        report['rows'] = len(df)
         
         # İl sütununu tespit et
         province_col = detect_province_column(df)
         if not province_col:
             logger.warning(f"'{file_path}' dosyasında il sütunu bulunamadı - atlanıyor")
-            return False
+            report['error'] = 'İl sütunu bulunamadı'
+            return report
         
+        report['province_column'] = province_col
         logger.info(f"İl sütunu tespit edildi: '{province_col}'")
         
+        # İl isimlerini standartlaştır
+        original_values = df[province_col]
+        standardized = standardize_province_series(original_values)
+        
+        # Değişiklikleri say (boş -> boş değişiklik sayılmaz)
+        changed = (original_values != standardized) & ~(original_values.isna() & standardized.isna())
+        report['changes'] = int(changed.sum())
+        report['examples'] = [
+            (old, new) for old, new in
+            pd.DataFrame({'old': original_values[changed], 'new': standardized[changed]})
+            .drop_duplicates().head(10).itertuples(index=False, name=None)
+        ]
+        
+        if dry_run:
+            logger.info(f"[Deneme] '{file_path}' dosyasında {report['changes']} il ismi değişecekti")
+            report['success'] = True
+            return report
+        
+        logger.info(f"'{file_path}' dosyasında {report['changes']} il ismi standartlaştırıldı")
+        
+        if report['changes'] == 0:
+            logger.info("Değişiklik yok - dosya yeniden yazılmadı")
+            report['success'] = True
+            return report
+        
         # Yedekleme yap
         if backup:
             backup_path = file_path.replace('.csv', '_backup.csv')
-            df.to_csv(backup_path, index=False, encoding='utf-8')
+            atomic_write_csv(df, backup_path)
             logger.info(f"Yedek oluşturuldu: {backup_path}")
         else:
             logger.info("Yedekleme atlandı - direkt ana dosyada işlem yapılıyor")
         
-        # İl isimlerini standartlaştır
-        original_values = df[province_col].copy()
-        df[province_col] = df[province_col].apply(standardize_province_name)
-        
-        # Değişiklikleri say
-        changes = sum(original_values != df[province_col])
-        logger.info(f"'{file_path}' dosyasında {changes} il ismi standartlaştırıldı")
-        
-        # Dosyayı kaydet
-        df.to_csv(file_path, index=False, encoding='utf-8')
-        
-        return True
+        # Dosyayı atomik olarak kaydet
+        df[province_col] = standardized
+        atomic_write_csv(df, file_path)
+        report['written'] = True
+        report['success'] = True
         
     except Exception as e:
         logger.error(f"'{file_path}' dosyası işlenirken hata: {str(e)}")
-        return False
+        report['error'] = str(e)
+    
+    return report
 
-def standardize_all_provinces(data_folder: str = 'data', backup: bool = False) -> Dict[str, bool]:
+def process_csv_file(file_path: str, backup: bool = False, dry_run: bool = False) -> bool:
     """
-    Data klasöründeki tüm CSV dosyalarının il isimlerini standartlaştırır.
+    Tek bir CSV dosyasını işler.
+    
+    Args:
+        file_path: CSV dosya yolu
+        backup: Yedekleme yapılsın mı
+        dry_run: True ise dosyaya yazılmaz
+        
+    Returns:
+        İşlem başarılı mı
+    """
+    return process_csv_file_report(file_path, backup, dry_run)['success']
+
+def standardize_all_provinces_report(data_folder: str = 'data', backup: bool = False,
+                                     max_workers: int = 1, dry_run: bool = False) -> Dict[str, Dict]:
+    """
+    Data klasöründeki tüm CSV dosyalarını işler, dosya başına rapor döndürür.
     
     Args:
         data_folder: Data klasörü yolu
         backup: Yedekleme yapılsın mı
+        max_workers: Aynı anda işlenecek en fazla dosya sayısı
+                     (1: sıralı, >1: süreç havuzu, 0: CPU sayısı kadar)
+        dry_run: True ise hiçbir dosyaya yazılmaz
         
     Returns:
-        Dosya başına işlem sonuçları
+        Dosya yolu -> rapor sözlüğü (dosya adına göre sıralı)
     """
-    results = {}
+    reports = {}
     
     if not os.path.exists(data_folder):
         logger.error(f"Data klasörü bulunamadı: {data_folder}")
-        return results
+        return reports
     
-    # CSV dosyalarını bul
-    csv_files = glob.glob(os.path.join(data_folder, '*.csv'))
+    # CSV dosyalarını bul (yedek dosyaları atla)
+    csv_files = sorted(f for f in glob.glob(os.path.join(data_folder, '*.csv')) if '_backup.csv' not in f)
     
     if not csv_files:
         logger.warning(f"'{data_folder}' klasöründe CSV dosyası bulunamadı")
-        return results
+        return reports
     
     logger.info(f"{len(csv_files)} CSV dosyası bulundu")
     
-    # Her dosyayı işle
-    for csv_file in csv_files:
-        # Yedek dosyaları atla
-        if '_backup.csv' in csv_file:
-            continue
-            
-        results[csv_file] = process_csv_file(csv_file, backup)
+    if max_workers == 0:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(csv_files)))
+    
+    if max_workers == 1:
+        # Her dosyayı sırayla işle
+        for csv_file in csv_files:
+            reports[csv_file] = process_csv_file_report(csv_file, backup, dry_run)
+    else:
+        logger.info(f"Süreç havuzu ile işleniyor ({max_workers} işçi)")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_csv_file_report, csv_file, backup, dry_run): csv_file
+                for csv_file in csv_files
+            }
+            for future in as_completed(futures):
+                csv_file = futures[future]
+                try:
+                    reports[csv_file] = future.result()
+                except Exception as e:
+                    logger.error(f"'{csv_file}' işçi sürecinde hata: {str(e)}")
+                    reports[csv_file] = {'file': csv_file, 'success': False, 'dry_run': dry_run,
+                                         'province_column': None, 'rows': 0, 'changes': 0,
+                                         'examples': [], 'written': False, 'error': str(e)}
+                status = "tamamlandı" if reports[csv_file]['success'] else "başarısız"
+                logger.info(f"{os.path.basename(csv_file)} {status} ({reports[csv_file]['changes']} değişiklik)")
+        reports = {csv_file: reports[csv_file] for csv_file in csv_files}
     
     # Özet rapor
-    successful = sum(results.values())
-    total = len(results)
-    logger.info(f"İşlem tamamlandı: {successful}/{total} dosya başarıyla işlendi")
+    successful = sum(1 for r in reports.values() if r['success'])
+    total = len(reports)
+    total_changes = sum(r['changes'] for r in reports.values())
+    mode = "Deneme tamamlandı" if dry_run else "İşlem tamamlandı"
+    logger.info(f"{mode}: {successful}/{total} dosya başarılı, toplam {total_changes} il ismi değişikliği")
     
-    return results
+    return reports
+
+def standardize_all_provinces(data_folder: str = 'data', backup: bool = False,
+                              max_workers: int = 1, dry_run: bool = False) -> Dict[str, bool]:
+    """
+    Data klasöründeki tüm CSV dosyalarının il isimlerini standartlaştırır.
+    
+    Args:
+        data_folder: Data klasörü yolu
+        backup: Yedekleme yapılsın mı
+        max_workers: Aynı anda işlenecek en fazla dosya sayısı
+        dry_run: True ise hiçbir dosyaya yazılmaz
+        
+    Returns:
+        Dosya başına işlem sonuçları
+    """
+    reports = standardize_all_provinces_report(data_folder, backup, max_workers, dry_run)
+    return {file_path: report['success'] for file_path, report in reports.items()}
 
 def test_standardization():
     """Standartlaştırma fonksiyonunu test eder"""
@@ -591,6 +965,9 @@ def test_standardization():
         # Özel durumlar
         'afyon', 'AFYON', 'Afyon', 'k.maras', 'K.MARAS',
         
+        # Yazım hataları (bulanık eşleştirme)
+        'Diyarbakr', 'ISTANBL', 'Eskisehr', 'Kahramanmars',
+        
         # Edge cases
         'TOPLAM', 'toplam', '', '   ', 'BilinmeyenIl'
     ]
@@ -611,7 +988,7 @@ def test_standardization():
             # 1. Sonuç büyük harf olmalı
             # 2. Türkçe karakter içermeli (eğer gerekiyorsa)
             # 3. Bilinen bir il olmalı
-            if result.isupper() and result in ['ŞANLIURFA', 'İSTANBUL', 'DİYARBAKIR', 'MUĞLA', 'ÇANAKKALE', 'ANKARA', 'İZMİR', 'GAZİANTEP', 'BURSA', 'AFYONKARAHİSAR', 'KAHRAMANMARAŞ', 'TOPLAM'] or result == test_input:
+            if result.isupper() and result in ['ŞANLIURFA', 'İSTANBUL', 'DİYARBAKIR', 'MUĞLA', 'ÇANAKKALE', 'ANKARA', 'İZMİR', 'GAZİANTEP', 'BURSA', 'AFYONKARAHİSAR', 'ESKİŞEHİR', 'KAHRAMANMARAŞ', 'TOPLAM'] or result == test_input:
                 success_count += 1
                 
         except Exception as e:
@@ -622,6 +999,15 @@ def test_standardization():
 
 def main():
     """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="İl ismi standartlaştırma aracı")
+    parser.add_argument('--data-folder', default='data', help="CSV dosyalarının bulunduğu klasör")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Paralel işlenecek dosya sayısı (1: sıralı, 0: CPU sayısı)")
+    parser.add_argument('--dry-run', action='store_true', help="Dosyalara yazmadan değişiklikleri raporla")
+    parser.add_argument('--backup', action='store_true', help="Yazmadan önce _backup.csv yedeği al")
+    parser.add_argument('--skip-test', action='store_true', help="Başlangıç testini atla")
+    args = parser.parse_args()
+    
     print("🏛️  AK Parti Teşkilat Başkanlığı - İyileştirilmiş İl İsmi Standartlaştırma Aracı")
     print("=" * 70)
     print("🚀 Özellikler:")
@@ -629,26 +1015,37 @@ def main():
     print("   • Türkçe karakter normalleştirme")  
     print("   • Case-insensitive eşleştirme")
     print("   • Otomatik varyant üretimi")
+    print("   • Kalıcı varyant indeksi + bulanık eşleştirme (BK-ağacı)")
+    print("   • Paralel dosya işleme, atomik yazma ve deneme (dry-run) modu")
     print("=" * 70)
     
     # Önce test yap
-    test_standardization()
+    if not args.skip_test:
+        test_standardization()
     
     # Standartlaştırmayı başlat
-    results = standardize_all_provinces(data_folder='data', backup=False)
+    reports = standardize_all_provinces_report(
+        data_folder=args.data_folder, backup=args.backup,
+        max_workers=args.workers, dry_run=args.dry_run
+    )
     
-    if results:
-        print("\n📊 İşlem Sonuçları:")
+    if reports:
+        print("\n📊 İşlem Sonuçları" + (" (deneme - dosyalar değiştirilmedi)" if args.dry_run else "") + ":")
         print("-" * 30)
-        for file_path, success in results.items():
-            status = "✅ Başarılı" if success else "❌ Hatalı"
+        for file_path, report in reports.items():
+            if report['success']:
+                status = f"✅ {report['changes']} değişiklik" + (" (yazıldı)" if report['written'] else "")
+            else:
+                status = f"❌ Hatalı: {report['error']}"
             print(f"{os.path.basename(file_path)}: {status}")
+            for old, new in report['examples']:
+                print(f"      '{old}' → '{new}'")
         
-        successful = sum(results.values())
-        total = len(results)
+        successful = sum(1 for r in reports.values() if r['success'])
+        total = len(reports)
         print(f"\n🎯 Toplam: {successful}/{total} dosya başarıyla işlendi")
         
-        if successful > 0:
+        if successful > 0 and not args.dry_run:
             print("\n💡 Not: İl isimleri direkt ana CSV dosyalarında standartlaştırıldı")
             print("💡 Artık tüm il isimleri: BÜYÜK HARF + TÜRKÇE KARAKTER formatında")
     else:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testler için ortak ayarlar: proje kökü ve web klasörü import yoluna eklenir,
+analizler depodaki data/ kopyasıyla geçici bir çalışma alanında çalışır.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+
+for yol in (KOK_KLASOR / 'web', KOK_KLASOR):
+    if str(yol) not in sys.path:
+        sys.path.insert(0, str(yol))
+
+
+@pytest.fixture
+def calisma_alani(tmp_path):
+    """data/ klasörünün kopyasını içeren geçici çalışma klasörü"""
+    shutil.copytree(KOK_KLASOR / 'data', tmp_path / 'data')
+    return tmp_path
+
+
+@pytest.fixture
+def sistem(calisma_alani):
+    """Geçici çalışma alanında vektörel hesaplamalı puanlama sistemi"""
+    from sistem import DinamikPuanlamaSistemi
+    return DinamikPuanlamaSistemi(calisma_klasoru=str(calisma_alani))
+
+
+@pytest.fixture
+def web_uygulamasi(tmp_path, monkeypatch):
+    """web/app.py modülü: uploads geçici klasörde, uygulama klasörü web/data kopyası,
+    session deposu her test için boş bellek deposu"""
+    import app as web_app
+    from session_store import MemorySessionStore
+
+    uygulama_klasoru = tmp_path / 'uygulama'
+    shutil.copytree(KOK_KLASOR / 'web' / 'data', uygulama_klasoru / 'data')
+    monkeypatch.setattr(web_app, 'UYGULAMA_KLASORU', str(uygulama_klasoru))
+    monkeypatch.setattr(web_app, 'session_store', MemorySessionStore(on_evict=web_app.upload_klasorunu_sil))
+    return web_app
+
+
+@pytest.fixture
+def yuklu_sistem(sistem):
+    """Paket verisi yüklenmiş ve il kategorileri belirlenmiş sistem"""
+    assert sistem.dinamik_veri_yukle()
+    sistem.il_kategorileri_belirle()
+    return sistem
+
+
+@pytest.fixture
+def genclik_dosyasi(yuklu_sistem):
+    """Yeni aktivite dosyası: üyelik verisindeki her il için etkinlik sayısı (data/ dışında)"""
+    iller = yuklu_sistem.veriler['uyelik']['İL'].unique()
+    yol = yuklu_sistem.calisma_klasoru / 'Gençlik.csv'
+    pd.DataFrame({
+        'İL': iller,
+        'ETKİNLİK SAYISI': np.arange(len(iller)) % 7 * 3
+    }).to_csv(yol, index=False, encoding='utf-8')
+    return yol
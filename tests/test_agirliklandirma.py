@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Normalize puan matrisinden yeniden hesaplamasız ağırlıklandırma testleri"""
+
+import numpy as np
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+
+
+def analiz_et(klasor, katsayilar=None):
+    sistem = DinamikPuanlamaSistemi(calisma_klasoru=str(klasor))
+    assert sistem.dinamik_veri_yukle()
+    sistem.aktivite_katsayilari.update(katsayilar or {})
+    sistem.il_kategorileri_belirle()
+    return sistem.genel_puanlama_hesapla()
+
+
+def test_normalize_matris_katsayidan_bagimsiz(calisma_alani):
+    varsayilan = analiz_et(calisma_alani)
+    degisik = analiz_et(calisma_alani, {'uyelik': 1.0, 'bayrak': 6.0})
+
+    assert varsayilan.iller == degisik.iller
+    assert varsayilan.aktiviteler == degisik.aktiviteler
+    assert varsayilan.normalize == pytest.approx(degisik.normalize, abs=1e-12)
+    assert ((varsayilan.normalize >= 0) & (varsayilan.normalize <= 1)).all()
+
+
+def test_mevcut_katsayilarla_toplam_puan_ayni(calisma_alani):
+    sonuclar = analiz_et(calisma_alani)
+    assert sonuclar.agirlikli_toplamlar() == pytest.approx(sonuclar.toplam_puan)
+
+
+@pytest.mark.parametrize('katsayilar', [
+    {'bayrak': 5.0},
+    {'uyelik': 0.5, 'danisma': 8.0},
+    {'ramazan': 0.0},
+])
+def test_yeni_katsayilar_tam_hesaplama_ile_ayni(calisma_alani, katsayilar):
+    toplamlar = analiz_et(calisma_alani).agirlikli_toplamlar(katsayilar)
+    assert toplamlar == pytest.approx(analiz_et(calisma_alani, katsayilar).toplam_puan, abs=1e-9)
+
+
+def test_toplam_katsayi_sifirsa_puanlar_sifir(calisma_alani):
+    sonuclar = analiz_et(calisma_alani)
+    sifir = {aktivite: 0.0 for aktivite in sonuclar.katsayilar}
+    assert np.array_equal(sonuclar.agirlikli_toplamlar(sifir), np.zeros(len(sonuclar)))
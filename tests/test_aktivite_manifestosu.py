@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Manifestodan yeni aktivite alma ve inceleme kuyruğu testleri"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+
+
+def manifesto_yaz(sistem, aktiviteler):
+    sistem.config_klasoru.mkdir(parents=True, exist_ok=True)
+    yol = sistem.config_klasoru / DinamikPuanlamaSistemi.AKTIVITE_MANIFESTO_DOSYASI
+    yol.write_text(json.dumps({'aktiviteler': aktiviteler}, ensure_ascii=False), encoding='utf-8')
+
+
+def kuyrugu_oku(sistem):
+    yol = sistem.config_klasoru / DinamikPuanlamaSistemi.INCELEME_KUYRUGU_DOSYASI
+    return json.loads(yol.read_text(encoding='utf-8')) if yol.exists() else {}
+
+
+@pytest.fixture
+def gonullu_dosyasi(sistem):
+    """data/ içinde bilinmeyen aktivite dosyası; il sütunu farklı adla"""
+    iller = pd.read_csv(sistem.veri_klasoru / 'Üyelik.csv', encoding='utf-8')['İL'].unique()
+    yol = sistem.veri_klasoru / 'Gönüllü.csv'
+    pd.DataFrame({
+        'Il Adi': iller,
+        'GÖNÜLLÜ SAYISI': np.arange(len(iller)) % 5 * 2
+    }).to_csv(yol, index=False, encoding='utf-8')
+    return yol
+
+
+def test_gecersiz_manifesto_kayitlari_atlanir(sistem):
+    manifesto_yaz(sistem, {
+        'gecerli': {'katsayi': 2, 'yontem': 'varsayilan', 'sutun_eslemesi': {'Il Adi': 'İL'}},
+        'katsayisiz': {'yontem': 'llm'},
+        'negatif': {'katsayi': -1},
+        'bilinmeyen_yontem': {'katsayi': 1, 'yontem': 'elle'},
+    })
+
+    manifesto = sistem._aktivite_manifestosunu_yukle()
+
+    assert list(manifesto) == ['gecerli']
+    assert manifesto['gecerli']['katsayi'] == 2.0
+    assert manifesto['gecerli']['sutun_eslemesi'] == {'Il Adi': 'İL'}
+
+
+def test_manifestoda_olmayan_dosya_incelemeye_alinir(sistem, gonullu_dosyasi):
+    assert sistem.dinamik_veri_yukle()
+
+    assert 'gonullu' not in sistem.veriler
+    assert 'gonullu' not in sistem.hesaplama_metodlari
+    kayit = kuyrugu_oku(sistem)['gonullu']
+    assert kayit['dosya'] == 'Gönüllü.csv'
+    assert kayit['sutunlar'] == ['Il Adi', 'GÖNÜLLÜ SAYISI']
+    assert kayit['onerilen_manifest_kaydi']['katsayi'] is None
+
+    # Tekrar görülen dosyanın ilk görülme zamanı korunur
+    ilk_gorulme = kayit['ilk_gorulme']
+    ikinci = DinamikPuanlamaSistemi(calisma_klasoru=str(sistem.calisma_klasoru))
+    assert ikinci.dinamik_veri_yukle()
+    assert kuyrugu_oku(ikinci)['gonullu']['ilk_gorulme'] == ilk_gorulme
+
+
+def test_manifestoya_eklenen_dosya_alinir_ve_kuyruktan_cikar(sistem, gonullu_dosyasi):
+    assert sistem.dinamik_veri_yukle()
+    assert 'gonullu' in kuyrugu_oku(sistem)
+
+    manifesto_yaz(sistem, {'gonullu_calismasi': {
+        'dosya': 'Gönüllü.csv', 'katsayi': 1.5, 'yontem': 'varsayilan',
+        'sutun_eslemesi': {'Il Adi': 'İL'}
+    }})
+    ikinci = DinamikPuanlamaSistemi(calisma_klasoru=str(sistem.calisma_klasoru))
+    assert ikinci.dinamik_veri_yukle()
+
+    # Manifestoda farklı adla tanımlanan aktivite de kuyruktan çıkarılır
+    assert kuyrugu_oku(ikinci) == {}
+    assert ikinci.aktivite_katsayilari['gonullu_calismasi'] == 1.5
+    assert 'İL' in ikinci.veriler['gonullu_calismasi'].columns
+    assert 'gonullu_calismasi' in ikinci.hesaplama_metodlari
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Danışma Meclisi il bazında gruplama ve durum sayımı testleri"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+
+AYLAR = ['HAZİRAN', 'TEMMUZ', 'AĞUSTOS']
+
+
+def ornek_danisma():
+    return pd.DataFrame([
+        ['ADANA', 'İL', 'YAPILDI', 'YAPILMADI', 'PLANLANDI'],
+        ['ADANA', 'ALADAĞ', 'YAPILDI', 'YAPILDI', 'YAPILDI'],
+        ['ADANA', 'CEYHAN', 'YAPILMADI', 'YAPILDI', 'PLANLANDI'],
+        ['ADANA', 'FEKE', 'PLANLANDI', None, 'PLANLANDI'],
+        ['BURSA', 'NİLÜFER', 'YAPILDI', 'YAPILDI', 'YAPILMADI'],
+        ['ÇORUM', 'İL', 'YAPILDI', 'YAPILDI', 'YAPILDI'],
+        ['ÇORUM', 'İL', 'YAPILMADI', 'YAPILMADI', 'YAPILMADI'],
+    ], columns=['İL', 'İLÇE'] + AYLAR)
+
+
+def danisma_puanlari(sistem, vektorel_hesaplama):
+    sistem.vektorel_hesaplama = vektorel_hesaplama
+    return sistem._danisma_puani_hesapla()
+
+
+def puanlari_karsilastir(vektorel, dongu):
+    assert sorted(vektorel) == sorted(dongu)
+    for il, beklenen in dongu.items():
+        assert vektorel[il] == pytest.approx(beklenen, abs=1e-9), il
+
+
+def test_ornek_veride_gruplama_filtreleme_ile_ayni(sistem):
+    # İl listesi ilk İL sütunlu veriden (üyelik) alınır
+    sistem.veriler['uyelik'] = pd.DataFrame({'İL': ['ADANA', 'BURSA', 'ÇORUM', 'DÜZCE']})
+    sistem.veriler['danisma'] = ornek_danisma()
+    sistem.kategori_katsayilar = {'ADANA': {'katsayi': 1.2}}
+
+    vektorel = danisma_puanlari(sistem, True)
+    puanlari_karsilastir(vektorel, danisma_puanlari(sistem, False))
+
+    assert vektorel['ADANA']['il_sayisi'] == 1
+    assert vektorel['ADANA']['ilce_sayisi'] == 3
+    # İl başkanlığı satırı olmayan il: sadece ilçe puanı
+    assert vektorel['BURSA']['il_sayisi'] == 0
+    assert vektorel['BURSA']['il_puan'] == 0
+    # Birden fazla İL satırında ilk satır kullanılır, sayı yine de tutulur
+    assert vektorel['ÇORUM']['il_sayisi'] == 2
+    assert vektorel['ÇORUM']['il_ortalama'] == 1
+    # Danışma verisinde olmayan il
+    assert vektorel['DÜZCE'] == {'toplam_danisma': 0}
+
+
+def test_paket_verisinde_gruplama_filtreleme_ile_ayni(calisma_alani):
+    from sistem import DinamikPuanlamaSistemi
+
+    puanlar = []
+    for vektorel_hesaplama in (True, False):
+        sistem = DinamikPuanlamaSistemi(vektorel_hesaplama=vektorel_hesaplama,
+                                        calisma_klasoru=str(calisma_alani))
+        assert sistem.dinamik_veri_yukle()
+        sistem.il_kategorileri_belirle()
+        puanlar.append(sistem._danisma_puani_hesapla())
+    puanlari_karsilastir(*puanlar)
+
+
+def test_durum_sayimi_il_ve_ilce_sayilari(sistem):
+    sayim = sistem._danisma_durum_sayimi(ornek_danisma(), AYLAR)
+
+    assert list(sayim.index) == ['ADANA', 'ÇORUM', 'BURSA']
+    assert sayim.loc['ADANA', 'IL_SAYISI'] == 1
+    assert sayim.loc['ADANA', 'ILCE_SAYISI'] == 3
+    assert sayim.loc['ADANA', 'ILCE_HAZİRAN_YAPILDI'] == 1
+    assert sayim.loc['ADANA', 'ILCE_HAZİRAN_PLANLANDI'] == 1
+    assert sayim.loc['ADANA', 'ILCE_TEMMUZ_YAPILDI'] == 2
+    assert sayim.loc['ADANA', 'ILCE_AĞUSTOS_PLANLANDI'] == 2
+    assert sayim.loc['ADANA', 'IL_HAZİRAN_YAPILDI'] == 1
+    assert sayim.loc['ADANA', 'IL_AĞUSTOS_PLANLANDI'] == 1
+
+    # İl başkanlığı satırı olmayan il: il sütunları 0
+    assert sayim.loc['BURSA', 'IL_SAYISI'] == 0
+    assert sayim.loc['BURSA', 'IL_HAZİRAN_YAPILDI'] == 0
+    assert sayim.loc['BURSA', 'ILCE_SAYISI'] == 1
+
+    # Birden fazla İL satırında ilk satır kullanılır, sayı yine de tutulur
+    assert sayim.loc['ÇORUM', 'IL_SAYISI'] == 2
+    assert sayim.loc['ÇORUM', 'IL_TEMMUZ_YAPILDI'] == 1
+    assert sayim.loc['ÇORUM', 'ILCE_SAYISI'] == 0
+
+
+def test_sayim_il_bazinda_filtreleme_ile_ayni(sistem):
+    df = pd.read_csv(KOK_KLASOR / 'data' / 'Danışma_Meclisi.csv', encoding='utf-8', dtype=str)
+    aylar = sistem._danisma_ay_sutunlari(df.columns)
+    sayim = sistem._danisma_durum_sayimi(df, aylar)
+
+    assert set(sayim.index) == set(df['İL'].unique())
+    for il in df['İL'].unique():
+        il_danisma = df[df['İL'] == il]
+        il_baskanligi = il_danisma[il_danisma['İLÇE'] == 'İL']
+        ilceler = il_danisma[il_danisma['İLÇE'] != 'İL']
+
+        assert sayim.loc[il, 'IL_SAYISI'] == len(il_baskanligi)
+        assert sayim.loc[il, 'ILCE_SAYISI'] == len(ilceler)
+        for ay in aylar:
+            for durum in ('YAPILDI', 'PLANLANDI'):
+                assert sayim.loc[il, f'ILCE_{ay}_{durum}'] == (ilceler[ay] == durum).sum()
+                if len(il_baskanligi):
+                    assert sayim.loc[il, f'IL_{ay}_{durum}'] == int(il_baskanligi.iloc[0][ay] == durum)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sınırlı alt süreç yürütücüsü testleri: zaman aşımı, CPU/bellek sınırı ve min-max metoda düşme"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dinamik_metodlar
+from dinamik_metodlar import DinamikMetodBaglami, DinamikMetodHatasi, DinamikMetodSinirHatasi, DinamikMetodYurutucusu
+
+POSIX_SINIRLARI = pytest.mark.skipif(dinamik_metodlar.resource is None, reason='resource modülü yok (POSIX değil)')
+
+
+def derle(kaynak):
+    return compile(kaynak, '<test>', 'exec')
+
+
+def baglam_olustur(sayilar=(1, 4, 2)):
+    df = pd.DataFrame({'İL': ['ADANA', 'BURSA', 'İZMİR'][:len(sayilar)], 'SAYI': list(sayilar)})
+    return DinamikMetodBaglami('deneme', df, {'deneme': 2.0}, {}, {}, {})
+
+
+def test_sonuc_dizi_olarak_doner():
+    kod = derle('''
+def _deneme_puani_hesapla(self):
+    df = self.veriler['deneme']
+    katsayi = self.aktivite_katsayilari['deneme']
+    return {il: {'toplam_deneme': sayi * katsayi, 'sayi': sayi} for il, sayi in zip(df['İL'], df['SAYI'])}
+''')
+    sonuc = DinamikMetodYurutucusu(zaman_asimi=30).calistir(kod, 'deneme', baglam_olustur())
+
+    assert sonuc['iller'] == ['ADANA', 'BURSA', 'İZMİR']
+    np.testing.assert_array_equal(sonuc['sutunlar']['toplam_deneme'], [2.0, 8.0, 4.0])
+    np.testing.assert_array_equal(sonuc['sutunlar']['sayi'], [1, 4, 2])
+
+
+def test_sonsuz_dongu_zaman_asimina_ugrar():
+    kod = derle('def _deneme_puani_hesapla(self):\n    while True:\n        pass\n')
+    with pytest.raises(TimeoutError):
+        DinamikMetodYurutucusu(zaman_asimi=1, cpu_siniri=0).calistir(kod, 'deneme', baglam_olustur())
+
+
+@POSIX_SINIRLARI
+def test_cpu_siniri_asilinca_surec_sonlandirilir():
+    kod = derle('def _deneme_puani_hesapla(self):\n    while True:\n        pass\n')
+    with pytest.raises(DinamikMetodSinirHatasi, match='alt süreç sonlandı'):
+        DinamikMetodYurutucusu(zaman_asimi=30, cpu_siniri=1).calistir(kod, 'deneme', baglam_olustur())
+
+
+@POSIX_SINIRLARI
+def test_bellek_siniri_asilinca_hata_verir():
+    kod = derle('''
+def _deneme_puani_hesapla(self):
+    buyuk = np.ones(4 * 1024 ** 3, dtype=np.uint8)
+    return {'ADANA': {'toplam_deneme': float(buyuk.sum())}}
+''')
+    with pytest.raises(DinamikMetodSinirHatasi, match='MemoryError'):
+        DinamikMetodYurutucusu(zaman_asimi=30, bellek_siniri_mb=1024).calistir(kod, 'deneme', baglam_olustur())
+
+
+@pytest.mark.parametrize('kaynak, hata', [
+    ('def hesapla(self):\n    return {}\n', 'NameError'),
+    ("def _deneme_puani_hesapla(self):\n    raise KeyError('SUTUN')\n", 'KeyError'),
+    ("def _deneme_puani_hesapla(self):\n    return {'ADANA': {'puan': 1}}\n", 'ValueError'),
+])
+def test_metod_hatasi_runtime_error_olarak_iletilir(kaynak, hata):
+    with pytest.raises(DinamikMetodHatasi, match=hata):
+        DinamikMetodYurutucusu(zaman_asimi=30).calistir(derle(kaynak), 'deneme', baglam_olustur())
+
+
+def test_zaman_asiminda_min_max_metoda_dusulur(yuklu_sistem, genclik_dosyasi):
+    # Örnek satırlarla doğrulamayı geçer, tam veride hiç bitmez
+    kaynak = '''
+def _genclik_puani_hesapla(self):
+    df = self.veriler['genclik']
+    while len(df) > 20:
+        pass
+    return {il: {'toplam_genclik': float(sayi)} for il, sayi in zip(df['İL'], df['ETKİNLİK SAYISI'])}
+'''
+    yuklu_sistem.DINAMIK_METOD_ZAMAN_ASIMI = 3
+    kayit_defteri = yuklu_sistem._dinamik_metod_kaydi_al()
+    kayit_defteri.kaydet('genclik', kaynak, 2.0)
+
+    assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'izole_hesaplama_metodu'
+
+    puanlar = yuklu_sistem.hesaplama_metodlari['genclik']()
+
+    # Metod varsayılan min-max metodla değiştirilir; sonuç onunla aynıdır
+    varsayilan = yuklu_sistem.hesaplama_metodlari['genclik']
+    assert varsayilan.__name__ == 'dynamic_calculation_method'
+    beklenen = varsayilan()
+    np.testing.assert_allclose(puanlar.puan, beklenen.puan)
+    np.testing.assert_array_equal(puanlar.mevcut, beklenen.mevcut)
+    assert puanlar.puan.max() == pytest.approx(20.0)
+
+
+def surec_baslatilamaz(*args):
+    raise OSError('alt süreç başlatılamadı')
+
+
+def eksik_sonuc(*args):
+    return {'sutunlar': {}}
+
+
+@pytest.mark.parametrize('calistir', [surec_baslatilamaz, eksik_sonuc])
+def test_beklenmeyen_hatada_min_max_metoda_dusulur(yuklu_sistem, genclik_dosyasi, monkeypatch, calistir):
+    kayit_defteri = yuklu_sistem._dinamik_metod_kaydi_al()
+    kayit_defteri.kaydet('genclik', '''
+def _genclik_puani_hesapla(self):
+    df = self.veriler['genclik']
+    return {il: {'toplam_genclik': float(sayi)} for il, sayi in zip(df['İL'], df['ETKİNLİK SAYISI'])}
+''', 2.0)
+    assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+
+    # Doğrulamadan sonra çalıştırma sırasında OSError / eksik alan
+    monkeypatch.setattr(DinamikMetodYurutucusu, 'calistir', calistir)
+    puanlar = yuklu_sistem.hesaplama_metodlari['genclik']()
+
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'dynamic_calculation_method'
+    assert puanlar.puan.max() == pytest.approx(20.0)
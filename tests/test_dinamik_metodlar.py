@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Üretilmiş hesaplama metodu kaydı testleri: kayıt, derleme önbelleği, doğrulama ve reddetme"""
+
+import numpy as np
+import pytest
+
+import dinamik_metodlar
+from dinamik_metodlar import DinamikMetodKaydi, DinamikMetodSinirHatasi, DinamikMetodYurutucusu, sonucu_dizilere_cevir
+
+GECERLI_METOD = '''
+def _genclik_puani_hesapla(self):
+    df = self.veriler['genclik']
+    max_puan = self.aktivite_katsayilari.get('genclik', 1.0) * 10
+    en_yuksek = max(df['ETKİNLİK SAYISI'].max(), 1)
+    return {
+        il: {'toplam_genclik': float(sayi) / en_yuksek * max_puan, 'etkinlik': int(sayi)}
+        for il, sayi in zip(df['İL'], df['ETKİNLİK SAYISI'])
+    }
+'''
+
+HATALI_METODLAR = {
+    'sozdizimi': 'def _genclik_puani_hesapla(self)\n    return {}\n',
+    'liste_dondurur': 'def _genclik_puani_hesapla(self):\n    return [1, 2, 3]\n',
+    'toplam_yok': "def _genclik_puani_hesapla(self):\n    return {'ADANA': {'puan': 1}}\n",
+    'hata_firlatir': "def _genclik_puani_hesapla(self):\n    return self.veriler['genclik']['YOK'].sum()\n",
+    'fonksiyon_yok': 'def hesapla(self):\n    return {}\n',
+}
+
+
+@pytest.fixture
+def kayit_defteri(tmp_path):
+    return DinamikMetodKaydi(tmp_path / 'dynamic_methods', tmp_path / 'veri_cache')
+
+
+def test_kaydedilen_metod_katsayisiyla_listelenir(kayit_defteri):
+    kayit = kayit_defteri.kaydet('genclik', GECERLI_METOD, 2.5)
+
+    assert kayit['dosya'].name == 'genclik_method.py'
+    assert kayit['katsayi'] == 2.5
+    assert kayit['ozet'] == DinamikMetodKaydi.kaynak_ozeti(kayit['dosya'].read_text(encoding='utf-8'))
+
+    kayitlar = kayit_defteri.kayitli_metodlar()
+    assert list(kayitlar) == ['genclik']
+    assert kayitlar['genclik']['ozet'] == kayit['ozet']
+    assert kayit_defteri.kayitli_metod('yok') is None
+
+
+def test_derlenmis_kod_diskten_yuklenir(kayit_defteri, tmp_path, monkeypatch):
+    kayit = kayit_defteri.kaydet('genclik', GECERLI_METOD, 1.0)
+    ilk = kayit_defteri.derle(kayit)
+
+    # Yeni süreç: bellek önbelleği boş, compile çağrılmamalı (marshal dosyasından okunur)
+    monkeypatch.setattr(dinamik_metodlar, '_derlenmis_kodlar', {})
+
+    def derleme_yok(*args, **kwargs):
+        raise AssertionError('kod yeniden derlendi')
+
+    monkeypatch.setattr(dinamik_metodlar, 'compile', derleme_yok, raising=False)
+    yeni_defter = DinamikMetodKaydi(tmp_path / 'dynamic_methods', tmp_path / 'veri_cache')
+    assert yeni_defter.derle(yeni_defter.kayitli_metod('genclik')).co_code == ilk.co_code
+
+    # Kaynak değişince özet değişir ve yeniden derlenir
+    degisen = yeni_defter.kaydet('genclik', GECERLI_METOD + '\n# değişti\n', 1.0)
+    with pytest.raises(AssertionError):
+        yeni_defter.derle(degisen)
+
+
+def test_dogrulama_sonucu_kalici(kayit_defteri, tmp_path):
+    kayit_defteri.dogrulama_kaydet('genclik', 'kaynak', 'sema', 'RuntimeError: bozuk')
+    kayit_defteri.dogrulama_kaydet('genclik', 'kaynak2', 'sema', None)
+
+    yeni_defter = DinamikMetodKaydi(tmp_path / 'dynamic_methods', tmp_path / 'veri_cache')
+    assert yeni_defter.dogrulama_sonucu('kaynak', 'sema')['gecerli'] is False
+    assert yeni_defter.dogrulama_sonucu('kaynak', 'sema')['hata'] == 'RuntimeError: bozuk'
+    assert yeni_defter.dogrulama_sonucu('kaynak2', 'sema')['gecerli'] is True
+    assert yeni_defter.dogrulama_sonucu('kaynak', 'baska_sema') is None
+
+
+def test_sonuc_dizilere_cevrilir():
+    diziler = sonucu_dizilere_cevir('genclik', {
+        'ADANA': {'toplam_genclik': 3, 'seviye': 'iyi'},
+        'BURSA': {'toplam_genclik': 1.5, 'etkinlik': 4},
+    })
+    assert diziler['iller'] == ['ADANA', 'BURSA']
+    assert diziler['sutunlar']['toplam_genclik'].dtype == np.float64
+    assert diziler['sutunlar']['seviye'].tolist() == ['iyi', None]
+    assert np.isnan(diziler['sutunlar']['etkinlik'][0])
+
+
+@pytest.mark.parametrize('sonuc', [
+    [1, 2],
+    {'ADANA': 5},
+    {'ADANA': {'puan': 1}},
+    {'ADANA': {'toplam_genclik': 'yüksek'}},
+])
+def test_beklenmeyen_sonuc_bicimi_reddedilir(sonuc):
+    with pytest.raises(ValueError):
+        sonucu_dizilere_cevir('genclik', sonuc)
+
+
+def test_gecerli_metod_kayittan_yuklenir(yuklu_sistem, genclik_dosyasi):
+    kayit_defteri = yuklu_sistem._dinamik_metod_kaydi_al()
+    kayit_defteri.kaydet('genclik', GECERLI_METOD, 2.5)
+
+    assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'izole_hesaplama_metodu'
+    assert yuklu_sistem.aktivite_katsayilari['genclik'] == 2.5
+
+    puanlar = yuklu_sistem.hesaplama_metodlari['genclik']()
+    assert puanlar.puan.max() == pytest.approx(25.0)
+    assert 'genclik' in yuklu_sistem.genel_puanlama_hesapla().aktiviteler
+
+
+@pytest.mark.parametrize('hata_turu', sorted(HATALI_METODLAR))
+def test_hatali_uretilmis_kod_reddedilir(yuklu_sistem, genclik_dosyasi, hata_turu, monkeypatch):
+    kayit_defteri = yuklu_sistem._dinamik_metod_kaydi_al()
+    kayit = kayit_defteri.kaydet('genclik', HATALI_METODLAR[hata_turu], 2.0)
+
+    # Reddedilen metodun yerine varsayılan min-max metod kurulur
+    assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'dynamic_calculation_method'
+    assert yuklu_sistem.hesaplama_metodlari['genclik']().puan.max() == pytest.approx(20.0)
+
+    if hata_turu != 'sozdizimi':
+        sema_kayitlari = kayit_defteri._dogrulamalari_yukle()
+        assert [d['gecerli'] for d in sema_kayitlari.values()] == [False]
+        assert all(anahtar.startswith(kayit['ozet']) for anahtar in sema_kayitlari)
+
+    # Aynı kaynak + şema için doğrulama tekrar çalıştırılmaz
+    def calistirilmamali(*args, **kwargs):
+        raise AssertionError('reddedilmiş metod tekrar çalıştırıldı')
+
+    monkeypatch.setattr(DinamikMetodYurutucusu, 'calistir', calistirilmamali)
+    from sistem import DinamikPuanlamaSistemi
+    ikinci = DinamikPuanlamaSistemi(calisma_klasoru=str(yuklu_sistem.calisma_klasoru))
+    assert ikinci.dinamik_veri_yukle()
+    ikinci.il_kategorileri_belirle()
+    assert ikinci._kayitli_aktiviteyi_yukle(
+        genclik_dosyasi, 'genclik', ikinci._dinamik_metod_kaydi_al().kayitli_metodlar()
+    )
+    assert ikinci.hesaplama_metodlari['genclik'].__name__ == 'dynamic_calculation_method'
+
+
+@pytest.mark.parametrize('hata', [TimeoutError('60 sn içinde tamamlanmadı'),
+                                  DinamikMetodSinirHatasi('MemoryError: ')])
+def test_sinir_asimi_dogrulama_kaydina_yazilmaz(yuklu_sistem, genclik_dosyasi, monkeypatch, hata):
+    kayit_defteri = yuklu_sistem._dinamik_metod_kaydi_al()
+    kayit_defteri.kaydet('genclik', GECERLI_METOD, 2.5)
+
+    def sinir_asar(*args, **kwargs):
+        raise hata
+
+    # Yük altında sınırı aşan doğrulama bu çalıştırmada metodu devre dışı bırakır ama kaydedilmez
+    with monkeypatch.context() as yama:
+        yama.setattr(DinamikMetodYurutucusu, 'calistir', sinir_asar)
+        assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'dynamic_calculation_method'
+    assert kayit_defteri._dogrulamalari_yukle() == {}
+
+    # Sonraki çalıştırmada tekrar doğrulanır ve geçer
+    assert yuklu_sistem._kayitli_aktiviteyi_yukle(genclik_dosyasi, 'genclik', kayit_defteri.kayitli_metodlar())
+    assert yuklu_sistem.hesaplama_metodlari['genclik'].__name__ == 'izole_hesaplama_metodu'
+    assert [d['gecerli'] for d in kayit_defteri._dogrulamalari_yukle().values()] == [True]
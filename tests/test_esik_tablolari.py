@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Eşik tablosu testleri: merdiven karşılığı, JSON'dan yükleme ve tablo bazında doğrulama"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+
+
+def tablolari_yaz(klasor, icerik):
+    yol = klasor / 'esik_tablolari.json'
+    yol.write_text(json.dumps(icerik) if not isinstance(icerik, str) else icerik, encoding='utf-8')
+    return str(yol)
+
+
+def test_esik_uzerindeki_deger_ust_carpani_alir():
+    esikler, carpanlar = [10, 20], [0, 0.5, 1.0]
+    carpan = DinamikPuanlamaSistemi._esik_carpanlari([9.99, 10, 15, 20, 25, np.nan], esikler, carpanlar)
+    assert carpan.tolist() == [0, 0.5, 0.5, 1.0, 1.0, 0]
+
+
+def test_tekil_deger_ve_sutun_ayni_sonucu_verir(sistem):
+    degerler = np.array([0, 12, 55, 100, 140])
+    sutun = sistem._esik_carpani('uyelik_temel', degerler)
+    assert [sistem._esik_carpani('uyelik_temel', deger) for deger in degerler] == sutun.tolist()
+    assert isinstance(sistem._esik_carpani('uyelik_temel', 55), float)
+
+
+def test_paketteki_json_varsayilan_tablolarla_ayni(sistem):
+    sistem._esik_tablolarini_yukle(str(KOK_KLASOR / 'dynamic_configs' / 'esik_tablolari.json'))
+    for ad, tablo in DinamikPuanlamaSistemi.VARSAYILAN_ESIK_TABLOLARI.items():
+        assert sistem.esik_tablolari[ad]['esikler'] == pytest.approx(tablo['esikler'])
+        assert sistem.esik_tablolari[ad]['carpanlar'] == pytest.approx(tablo['carpanlar'])
+    assert sistem.calisma_turu_carpanlari == pytest.approx(DinamikPuanlamaSistemi.VARSAYILAN_CALISMA_TURU_CARPANLARI)
+
+
+def test_hatali_tablo_yalnizca_kendi_varsayilanina_doner(sistem, tmp_path):
+    varsayilan = DinamikPuanlamaSistemi.VARSAYILAN_ESIK_TABLOLARI
+    sistem._esik_tablolarini_yukle(tablolari_yaz(tmp_path, {
+        'esik_tablolari': {
+            'danisma': {'esikler': [0.5], 'carpanlar': [0, 1]},
+            'uyelik_yk': {'esikler': [60, 20], 'carpanlar': [0, 0.5, 1]},
+            'uyelik_temel': {'esikler': ['on'], 'carpanlar': [0, 1]},
+            'ramazan_aktivite': {'esikler': [1, 2], 'carpanlar': [0, 1]},
+            'uyelik_mukemmellik': [100, 200],
+        },
+        'calisma_turu_carpanlari': {' miting ': 0.25, 'DUYURU': 'yarım'},
+    }))
+
+    assert sistem.esik_tablolari['danisma'] == {'esikler': [0.5], 'carpanlar': [0.0, 1.0]}
+    for ad in ('uyelik_yk', 'uyelik_temel', 'ramazan_aktivite', 'uyelik_mukemmellik'):
+        assert sistem.esik_tablolari[ad] == varsayilan[ad], ad
+    # Geçerli çarpan eklenir, geçersiz olan varsayılanda kalır
+    assert sistem.calisma_turu_carpanlari == {'TOPLANTI': 1.0, 'DUYURU': 0.5, 'MITING': 0.25}
+
+
+@pytest.mark.parametrize('icerik', [
+    '{bozuk json',
+    '[1, 2, 3]',
+    {'esik_tablolari': [1, 2], 'calisma_turu_carpanlari': 'TOPLANTI'},
+])
+def test_gecersiz_dosyada_varsayilanlar_kullanilir(sistem, tmp_path, icerik):
+    sistem._esik_tablolarini_yukle(tablolari_yaz(tmp_path, icerik))
+    assert sistem.esik_tablolari == DinamikPuanlamaSistemi.VARSAYILAN_ESIK_TABLOLARI
+    assert sistem.calisma_turu_carpanlari == DinamikPuanlamaSistemi.VARSAYILAN_CALISMA_TURU_CARPANLARI
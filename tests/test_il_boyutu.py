@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Plaka kodlu il boyutu ve boyuta hizalı aktivite puanları testleri"""
+
+import numpy as np
+import pytest
+
+from sistem import PLAKA_IL_BOYUTU, AktivitePuanlari, IlBoyutu
+
+
+def test_plaka_boyutu_kod_sirasinda():
+    assert len(PLAKA_IL_BOYUTU) == 81
+    assert PLAKA_IL_BOYUTU.kodlar.tolist() == list(range(1, 82))
+    assert PLAKA_IL_BOYUTU.adlar[0] == 'ADANA'
+    assert PLAKA_IL_BOYUTU.konum('İSTANBUL') == 33
+    assert PLAKA_IL_BOYUTU.konum('TOPLAM') == -1
+
+
+def test_konumlar_once_koddan_sonra_addan():
+    konumlar = PLAKA_IL_BOYUTU.konumlar(['yanlış ad', 'ANKARA', 'YOK İL', 'İZMİR'], [34, 0, 0, 99])
+    assert konumlar.tolist() == [33, 5, -1, 34]
+
+
+def test_dizilerden_hizalama_ve_maske():
+    boyut = IlBoyutu(['A', 'B', 'C'])
+    puanlar = AktivitePuanlari.dizilerden(
+        boyut, 'deneme', ['C', 'A', 'X', 'C'], boyut.konumlar(['C', 'A', 'X', 'C']),
+        {'toplam_deneme': np.array([1.0, 2.0, 3.0, 4.0]), 'sayi': np.array([10, 20, 30, 40])}
+    )
+
+    # Aynı il birden fazla satırda geçerse son satır geçerli; B'nin verisi yok
+    assert puanlar.puan.tolist() == [2.0, 0.0, 4.0]
+    assert puanlar.mevcut.tolist() == [True, False, True]
+    assert list(puanlar) == ['A', 'C']
+    assert puanlar['C'] == {'toplam_deneme': 4.0, 'sayi': 40}
+    assert 'B' not in puanlar
+    assert puanlar.get('B', {}) == {}
+
+
+def test_sozlukten_hizalama():
+    puanlar = AktivitePuanlari.sozlukten(PLAKA_IL_BOYUTU, 'deneme', {
+        'ANKARA': {'toplam_deneme': 5, 'x': 1},
+        'BİLİNMEYEN': {'toplam_deneme': 9},
+    })
+
+    assert puanlar.puan[5] == 5
+    assert puanlar.puan.sum() == 5
+    assert puanlar.mevcut.sum() == 1
+    assert puanlar['ANKARA'] == {'toplam_deneme': 5, 'x': 1}
+
+
+@pytest.fixture
+def eski_sistem(calisma_alani, monkeypatch):
+    """puanlama_sistemi.py dosyaları çalışma dizinine göre okur"""
+    from puanlama_sistemi import AKPartiPuanlamaSistemi
+
+    monkeypatch.chdir(calisma_alani)
+    sistem = AKPartiPuanlamaSistemi()
+    assert sistem.veri_yukle()
+    sistem.il_kategorileri_belirle()
+    return sistem
+
+
+def test_eski_sistem_puanlari_plaka_boyutuna_hizali(eski_sistem):
+    for hesapla in (eski_sistem.uyelik_puani_hesapla, eski_sistem.danisma_puani_hesapla,
+                    eski_sistem.ramazan_puani_hesapla, eski_sistem.bayrak_puani_hesapla):
+        puanlar = hesapla()
+        assert isinstance(puanlar, AktivitePuanlari)
+        assert puanlar.boyut is PLAKA_IL_BOYUTU
+        assert puanlar.mevcut.all()
+
+
+def test_eski_sistem_genel_puan_matristen(eski_sistem):
+    sonuclar = eski_sistem.genel_puanlama_hesapla()
+
+    assert eski_sistem.puan_matrisi.shape == (81, 4)
+    assert eski_sistem.puan_maskesi.all()
+    for il, sonuc in sonuclar.items():
+        satir = eski_sistem.puan_matrisi[PLAKA_IL_BOYUTU.konum(il)]
+        assert satir.tolist() == pytest.approx([
+            sonuc['uyelik_puan'], sonuc['danisma_puan'], sonuc['ramazan_puan'], sonuc['bayrak_puan']
+        ])
+        assert sonuc['ham_toplam'] == pytest.approx(satir.sum())
+        assert sonuc['final_puan'] == min(eski_sistem.MAX_TOPLAM_PUAN, sonuc['ham_toplam'])
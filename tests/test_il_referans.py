@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Süreç genelinde paylaşılan il referans tablosu ve plaka kodu (İL_KODU) testleri"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+from standardize_provinces import PROVINCE_PLATE_CODES
+
+
+def yeni_sistem(klasor):
+    sistem = DinamikPuanlamaSistemi(calisma_klasoru=str(klasor))
+    sistem._nufus_verileri_yukle()
+    return sistem
+
+
+def test_ornekler_ayni_tabloyu_paylasir(calisma_alani):
+    birinci = yeni_sistem(calisma_alani)
+    ikinci = yeni_sistem(calisma_alani)
+
+    assert birinci.il_referans is ikinci.il_referans
+    assert birinci.nufus_bilgileri['ANKARA'] > DinamikPuanlamaSistemi.MEGA_IL_ESIK
+    assert birinci.il_referans.kayit('ANKARA')['kategori'] == 'Mega İl'
+
+
+def test_tablo_degistirilemez(calisma_alani):
+    tablo = yeni_sistem(calisma_alani).il_referans
+
+    with pytest.raises(TypeError):
+        tablo.nufus['ANKARA'] = 1
+    with pytest.raises(TypeError):
+        tablo.kayit('ANKARA')['katsayi'] = 2.0
+
+
+def test_dosya_degisince_yeniden_yuklenir(calisma_alani):
+    ilk = yeni_sistem(calisma_alani).il_referans
+
+    with open(calisma_alani / 'data' / 'il_ilçe_nüfus.csv', 'a', encoding='utf-8') as f:
+        f.write('DENEME,1,1000\n')
+
+    yeni = yeni_sistem(calisma_alani).il_referans
+    assert yeni is not ilk
+    assert yeni.nufus['DENEME'] == 1000
+    assert 'DENEME' not in ilk.nufus
+
+
+def test_tabloda_olmayan_il_varsayilan_nufusla_gelir(calisma_alani):
+    kayit = yeni_sistem(calisma_alani).il_referans.kayit('YOK İL')
+
+    assert kayit['nufus'] == DinamikPuanlamaSistemi.VARSAYILAN_NUFUS
+    assert kayit['kategori'] == 'Orta İl'
+
+
+def test_yuklemede_il_isimleri_ve_plaka_kodlari_eklenir(calisma_alani):
+    yol = calisma_alani / 'data' / 'Bayrak_Çalışması.csv'
+    df = pd.read_csv(yol, encoding='utf-8', dtype=str)
+    iller = df['İL'].tolist()
+    df.loc[0, 'İL'] = df.loc[0, 'İL'].lower()
+    # Bir harfi eksik yazım (bulanık eşleşme)
+    df.loc[1, 'İL'] = iller[1][:3] + iller[1][4:]
+    df.to_csv(yol, index=False, encoding='utf-8')
+    icerik = yol.read_bytes()
+
+    sistem = yeni_sistem(calisma_alani)
+    assert sistem.dinamik_veri_yukle()
+    bayrak = sistem.veriler['bayrak']
+
+    # Dosya değiştirilmez, standartlaştırma bellekte yapılır
+    assert yol.read_bytes() == icerik
+    assert bayrak.loc[1, 'İL_KODU'] == PROVINCE_PLATE_CODES[iller[1]]
+    assert bayrak['İL'].tolist() == iller
+    for aktivite in ('uyelik', 'ramazan', 'bayrak'):
+        df = sistem.veriler[aktivite]
+        assert df['İL_KODU'].between(1, 81).all()
+        assert df['İL_KODU'].groupby(df['İL']).nunique().eq(1).all()
+
+
+def test_nufus_plaka_koduyla_eslesir(calisma_alani):
+    tablo = yeni_sistem(calisma_alani).il_referans
+
+    assert tablo.nufus_dizisi[6] == tablo.nufus['ANKARA']
+    assert tablo.nufus_dizisi[34] == tablo.nufus['İSTANBUL']
+    assert tablo.nufus_dizisi[0] == DinamikPuanlamaSistemi.VARSAYILAN_NUFUS
+    assert not tablo.nufus_dizisi.flags.writeable
+
+    # Kodu 0 olan satır il adıyla aranır
+    nufus = tablo.nufus_dizisi_al([6, 0, 0], ['ANKARA', 'KONYA', 'YOK İL'])
+    assert nufus.tolist() == [tablo.nufus['ANKARA'], tablo.nufus['KONYA'], DinamikPuanlamaSistemi.VARSAYILAN_NUFUS]
+
+
+@pytest.mark.parametrize('aktivite, sutun, carpan', [
+    ('ramazan', 'TOPLAM ULAŞILAN KİŞİ', 100),
+    ('bayrak', 'BAYRAK ADEDİ', 1000),
+])
+def test_plaka_kodlu_nufus_isimle_eslestirme_ile_ayni(calisma_alani, aktivite, sutun, carpan):
+    sistem = yeni_sistem(calisma_alani)
+    assert sistem.dinamik_veri_yukle()
+    df = sistem.veriler[aktivite]
+
+    kodla = sistem._nufus_orani_hesapla(df, sutun, carpan)
+    isimle = sistem._nufus_orani_hesapla(df.drop(columns='İL_KODU'), sutun, carpan)
+    for kodlu, isimli in zip(kodla, isimle):
+        np.testing.assert_allclose(kodlu, isimli)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""LLM istemcisi testleri - openai.ChatCompletion.acreate taklit edilir, ağ kullanılmaz"""
+
+import asyncio
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+import llm_istemcisi
+from llm_istemcisi import LLMIstegi, LLMIstemcisi
+
+GERCEK_UYKU = asyncio.sleep
+
+
+def istek(anahtar, icerik=None):
+    return LLMIstegi(anahtar, [{'role': 'user', 'content': icerik or anahtar}])
+
+
+class SahteAPI:
+    """acreate yerine geçer: mesaja göre hata dizisi, gecikme ve yanıt üretir"""
+
+    def __init__(self):
+        self.cagrilar = []
+        self.hatalar = {}  # içerik -> sırayla fırlatılacak hatalar
+        self.gecikmeler = {}  # içerik -> saniye
+        self.eszamanli = 0
+        self.max_eszamanli = 0
+
+    async def acreate(self, **kwargs):
+        icerik = kwargs['messages'][-1]['content']
+        self.cagrilar.append(kwargs)
+        self.eszamanli += 1
+        self.max_eszamanli = max(self.max_eszamanli, self.eszamanli)
+        try:
+            await GERCEK_UYKU(self.gecikmeler.get(icerik, 0))
+            hatalar = self.hatalar.get(icerik)
+            if hatalar:
+                raise hatalar.pop(0)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f'yanıt: {icerik}'))])
+        finally:
+            self.eszamanli -= 1
+
+
+@pytest.fixture
+def api(monkeypatch):
+    sahte = SahteAPI()
+    monkeypatch.setattr(openai.ChatCompletion, 'acreate', sahte.acreate)
+    return sahte
+
+
+@pytest.fixture
+def beklemeler(monkeypatch):
+    """Tekrar deneme beklemelerini kaydet (gerçekte beklenmez, rastgele çarpan 1)"""
+    kayit = []
+
+    async def sahte_uyku(sure):
+        kayit.append(sure)
+        await GERCEK_UYKU(0)
+
+    monkeypatch.setattr(llm_istemcisi.asyncio, 'sleep', sahte_uyku)
+    monkeypatch.setattr(llm_istemcisi.random, 'uniform', lambda a, b: b)
+    return kayit
+
+
+def istemci_olustur(tmp_path, **ayarlar):
+    return LLMIstemcisi('test-anahtari', tmp_path / 'llm_cache', **ayarlar)
+
+
+def test_onbellek_isabetinde_api_cagrilmaz(tmp_path, api):
+    ilk = istemci_olustur(tmp_path)
+    assert ilk.tamamla(istek('a')) == 'yanıt: a'
+    assert len(api.cagrilar) == 1
+
+    # Yeni istemci (ör. yeniden çalıştırma) aynı anahtarı diskten yanıtlar
+    ikinci = istemci_olustur(tmp_path)
+    assert ikinci.tamamla(istek('a')) == 'yanıt: a'
+    assert len(api.cagrilar) == 1
+    assert ikinci.istatistikler['onbellek_isabeti'] == 1
+    assert ikinci.istatistikler['api_cagrisi'] == 0
+
+    # Model değişince önbellek kullanılmaz
+    istemci_olustur(tmp_path, model='gpt-4o').tamamla(istek('a'))
+    assert len(api.cagrilar) == 2
+
+
+def test_anahtar_yoksa_api_cagrilmaz(tmp_path, api):
+    istemci = LLMIstemcisi(None, tmp_path / 'llm_cache')
+    assert istemci.tamamla(istek('a')) is None
+    assert api.cagrilar == []
+
+
+def test_gecici_hatada_ustel_beklemeyle_tekrar_denenir(tmp_path, api, beklemeler):
+    api.hatalar['a'] = [openai.error.RateLimitError('yavaş'), openai.error.APIConnectionError('bağlantı')]
+    istemci = istemci_olustur(tmp_path, deneme_sayisi=3, temel_bekleme=1.0)
+
+    assert istemci.tamamla(istek('a')) == 'yanıt: a'
+    assert beklemeler == [1.0, 2.0]
+    assert istemci.istatistikler == {'api_cagrisi': 3, 'onbellek_isabeti': 0, 'tekrar_deneme': 2, 'hata': 0}
+
+
+def test_bekleme_ust_siniri_uygulanir(tmp_path, api, beklemeler):
+    api.hatalar['a'] = [openai.error.ServiceUnavailableError('meşgul')] * 3
+    istemci = istemci_olustur(tmp_path, deneme_sayisi=4, temel_bekleme=10.0, max_bekleme=15.0)
+
+    assert istemci.tamamla(istek('a')) == 'yanıt: a'
+    assert beklemeler == [10.0, 15.0, 15.0]
+
+
+def test_tum_tekrar_hakkinda_basarisizsa_none_ve_onbellege_yazilmaz(tmp_path, api, beklemeler):
+    api.hatalar['a'] = [openai.error.Timeout('zaman aşımı')] * 3
+    istemci = istemci_olustur(tmp_path, deneme_sayisi=3)
+
+    assert istemci.tamamla(istek('a')) is None
+    assert len(api.cagrilar) == 3
+    assert istemci.istatistikler['hata'] == 1
+    assert not any((tmp_path / 'llm_cache').glob('*.json'))
+
+
+def test_zaman_asimi_tekrar_denenir(tmp_path, api, beklemeler):
+    api.gecikmeler['a'] = 1.0
+    istemci = istemci_olustur(tmp_path, deneme_sayisi=2, zaman_asimi=0.05)
+
+    assert istemci.tamamla(istek('a')) is None
+    assert len(api.cagrilar) == 2
+    assert istemci.istatistikler['tekrar_deneme'] == 1
+
+
+def test_kalici_hata_tekrar_denenmez(tmp_path, api, beklemeler):
+    api.hatalar['a'] = [openai.error.AuthenticationError('geçersiz anahtar')]
+    istemci = istemci_olustur(tmp_path, deneme_sayisi=3)
+
+    assert istemci.tamamla(istek('a')) is None
+    assert len(api.cagrilar) == 1
+    assert beklemeler == []
+
+
+def test_toplu_sonuclar_istek_sirasinda(tmp_path, api, beklemeler):
+    # Önce gönderilen istekler daha geç biter; sonuçlar yine istek sırasıyla döner
+    anahtarlar = [f'istek{i}' for i in range(6)]
+    for i, anahtar in enumerate(anahtarlar):
+        api.gecikmeler[anahtar] = (len(anahtarlar) - i) * 0.01
+    api.hatalar['istek2'] = [openai.error.AuthenticationError('red')]
+    istemci = istemci_olustur(tmp_path, eszamanli_istek=3)
+
+    sonuclar = asyncio.run(istemci.atoplu_tamamla([istek(a) for a in anahtarlar]))
+
+    assert sonuclar == [None if a == 'istek2' else f'yanıt: {a}' for a in anahtarlar]
+    assert api.max_eszamanli == 3
+
+
+def test_calisan_olay_dongusunden_senkron_cagri(tmp_path, api):
+    istemci = istemci_olustur(tmp_path)
+
+    async def dongu_icinden():
+        return istemci.toplu_tamamla([istek('a'), istek('b')])
+
+    assert asyncio.run(dongu_icinden()) == ['yanıt: a', 'yanıt: b']
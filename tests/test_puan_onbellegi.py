@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Aktivite puanlarının bağımlılık anahtarlı önbellek testleri"""
+
+import functools
+import shutil
+
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+
+HESAPLAMA_METODLARI = {
+    'uyelik': '_uyelik_puani_hesapla',
+    'danisma': '_danisma_puani_hesapla',
+    'ramazan': '_ramazan_puani_hesapla',
+    'bayrak': '_bayrak_puani_hesapla',
+}
+
+
+@pytest.fixture
+def cagrilar(monkeypatch):
+    """Çekirdek puanlama metodlarının hangi aktiviteler için çalıştığını kaydet"""
+    kayit = []
+    for aktivite, ad in HESAPLAMA_METODLARI.items():
+        asil = getattr(DinamikPuanlamaSistemi, ad)
+
+        def sayan(self, _asil=asil, _aktivite=aktivite):
+            kayit.append(_aktivite)
+            return _asil(self)
+
+        monkeypatch.setattr(DinamikPuanlamaSistemi, ad, functools.wraps(asil)(sayan))
+    return kayit
+
+
+def yeni_sistem(klasor):
+    sistem = DinamikPuanlamaSistemi(calisma_klasoru=str(klasor))
+    assert sistem.dinamik_veri_yukle()
+    sistem.il_kategorileri_belirle()
+    return sistem
+
+
+def toplamlar(sonuclar):
+    return {il: sonuclar[il]['toplam_puan'] for il in sonuclar}
+
+
+def test_degismeyen_aktiviteler_yeniden_hesaplanmaz(calisma_alani, cagrilar):
+    sistem = yeni_sistem(calisma_alani)
+    ilk = toplamlar(sistem.genel_puanlama_hesapla())
+    assert sorted(cagrilar) == sorted(HESAPLAMA_METODLARI)
+
+    cagrilar.clear()
+    assert toplamlar(sistem.genel_puanlama_hesapla()) == ilk
+    assert cagrilar == []
+
+
+def test_katsayi_degisince_yeniden_hesaplanmaz_olceklenir(calisma_alani, cagrilar, tmp_path_factory):
+    sistem = yeni_sistem(calisma_alani)
+    sistem.genel_puanlama_hesapla()
+
+    cagrilar.clear()
+    sistem.aktivite_katsayilari['bayrak'] *= 2
+    sonuclar = sistem.genel_puanlama_hesapla()
+    assert cagrilar == []
+
+    # Ölçeklenen ham puanlar ve toplamlar yeni katsayıyla baştan hesaplama ile aynı
+    temiz_klasor = tmp_path_factory.mktemp('temiz')
+    shutil.copytree(calisma_alani / 'data', temiz_klasor / 'data')
+    temiz = yeni_sistem(temiz_klasor)
+    temiz.aktivite_katsayilari['bayrak'] = sistem.aktivite_katsayilari['bayrak']
+    beklenen = temiz.genel_puanlama_hesapla()
+    assert sonuclar.ham == pytest.approx(beklenen.ham)
+    assert toplamlar(sonuclar) == pytest.approx(toplamlar(beklenen))
+
+
+def test_sifir_katsayi_ayri_hesaplanir(calisma_alani, cagrilar):
+    sistem = yeni_sistem(calisma_alani)
+    beklenen = toplamlar(sistem.genel_puanlama_hesapla())
+    katsayi = sistem.aktivite_katsayilari['ramazan']
+
+    # Sıfır katsayıyla hesaplanan puanlar ölçeklenemez, ayrı anahtarla tutulur
+    cagrilar.clear()
+    sistem.aktivite_katsayilari['ramazan'] = 0.0
+    sistem.genel_puanlama_hesapla()
+    assert cagrilar == ['ramazan']
+
+    cagrilar.clear()
+    sistem.aktivite_katsayilari['ramazan'] = katsayi
+    assert toplamlar(sistem.genel_puanlama_hesapla()) == pytest.approx(beklenen)
+    assert cagrilar == []
+
+
+def test_yeni_ornek_degismeyen_dosyalari_diskten_alir(calisma_alani, cagrilar):
+    beklenen = toplamlar(yeni_sistem(calisma_alani).genel_puanlama_hesapla())
+
+    # İçerik özeti değişsin diye dosyaya boş satır eklenir (puanı etkilemez)
+    with open(calisma_alani / 'data' / 'Ramazan_Çalışmaları.csv', 'a', encoding='utf-8') as f:
+        f.write('\n')
+
+    cagrilar.clear()
+    sonuclar = yeni_sistem(calisma_alani).genel_puanlama_hesapla()
+    assert cagrilar == ['ramazan']
+    assert toplamlar(sonuclar) == pytest.approx(beklenen)
+
+
+def test_esik_tablosu_degisince_onbellek_gecersiz(calisma_alani, cagrilar):
+    sistem = yeni_sistem(calisma_alani)
+    sistem.genel_puanlama_hesapla()
+
+    cagrilar.clear()
+    tablo = sistem.esik_tablolari[next(iter(sistem.esik_tablolari))]
+    tablo['carpanlar'] = [carpan * 0.5 for carpan in tablo['carpanlar']]
+    sistem.genel_puanlama_hesapla()
+    assert sorted(cagrilar) == sorted(HESAPLAMA_METODLARI)
+
+
+def test_onbellek_sonucu_onbelleksiz_hesaplama_ile_ayni(calisma_alani, tmp_path_factory):
+    onbellekli = yeni_sistem(calisma_alani)
+    onbellekli.genel_puanlama_hesapla()
+    tekrar = toplamlar(yeni_sistem(calisma_alani).genel_puanlama_hesapla())
+
+    # Boş önbellekli ayrı çalışma alanında baştan hesaplama
+    temiz_klasor = tmp_path_factory.mktemp('temiz')
+    shutil.copytree(calisma_alani / 'data', temiz_klasor / 'data')
+    assert tekrar == pytest.approx(toplamlar(yeni_sistem(temiz_klasor).genel_puanlama_hesapla()))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""İl × aktivite puan matrisi (PuanSonuclari) testleri"""
+
+import json
+
+import numpy as np
+import pytest
+
+from sistem import PuanSonuclari
+
+
+def puan_sonuclari(katsayilar):
+    iller = ['ADANA', 'BURSA']
+    il_bilgileri = {
+        'il_kategorisi': np.array(['Büyük İl', 'Büyük İl'], dtype=object),
+        'kategori_grup': np.array(['Büyük İl', 'Büyük İl'], dtype=object),
+        'kategori_katsayi': np.array([1.08, 1.08]),
+        'nufus': np.array([np.int64(2274106), 3214571], dtype=object)
+    }
+    ham = np.array([[30.0, 5.0], [12.0, 10.0]])
+    aktivite_puanlari = {'uyelik': {'ADANA': {'toplam_uyelik': 30.0, 'mevcut_uye': 1200}}, 'bayrak': {}}
+    return PuanSonuclari(iller, ['uyelik', 'bayrak'], ham, katsayilar, aktivite_puanlari, il_bilgileri)
+
+
+def test_toplam_katsayi_sifirken_puanlar_sifir():
+    sonuclar = puan_sonuclari({'uyelik': 0, 'bayrak': 0})
+
+    assert sonuclar.toplam_katsayi == 0
+    assert np.array_equal(sonuclar.agirlik, [0.0, 0.0])
+    assert np.array_equal(sonuclar.toplam_puan, [0.0, 0.0])
+    assert not np.isnan(sonuclar.rapor_tablosu(['uyelik', 'bayrak'])['TOPLAM_PUAN'].to_numpy()).any()
+
+
+def test_agirliklar_yuzde_olarak_dagitilir():
+    sonuclar = puan_sonuclari({'uyelik': 4.0, 'bayrak': 1.0})
+
+    assert sonuclar.agirlik == pytest.approx([80.0, 20.0])
+    # ADANA: üyelik 30/40, bayrak 5/10
+    assert sonuclar.toplam_puan[0] == pytest.approx(0.75 * 80 + 0.5 * 20)
+
+
+def test_il_sozlugu_eski_bicimde_olusturulur():
+    sonuclar = puan_sonuclari({'uyelik': 4.0, 'bayrak': 1.0})
+
+    assert list(sonuclar) == ['ADANA', 'BURSA']
+    assert 'ADANA' in sonuclar and 'ANKARA' not in sonuclar
+    kayit = sonuclar['BURSA']
+    assert kayit['il_kategorisi'] == 'Büyük İl'
+    assert kayit['uyelik_ham_puan'] == 12.0
+    assert kayit['uyelik_normalize_puan'] == pytest.approx(0.3)
+    assert kayit['bayrak_final_puan'] == pytest.approx(20.0)
+    assert kayit['toplam_puan'] == pytest.approx(0.3 * 80 + 20)
+    assert kayit['bayrak_detay'] == {}
+    assert sonuclar['ADANA']['uyelik_detay'] == {'toplam_uyelik': 30.0, 'mevcut_uye': 1200}
+
+
+def test_esit_puanlarda_siralama_ilk_sirayi_korur():
+    sonuclar = puan_sonuclari({'uyelik': 4.0, 'bayrak': 1.0})
+    sonuclar.ham[:] = [[20.0, 5.0], [20.0, 5.0]]
+    sonuclar._hesapla()
+
+    assert sonuclar.siralama().tolist() == [0, 1]
+    rapor = sonuclar.rapor_tablosu(['uyelik', 'bayrak', 'ramazan'])
+    assert rapor['İL'].tolist() == ['ADANA', 'BURSA']
+    assert rapor['GENEL_SIRALAMA'].tolist() == [1, 2]
+    # Sonuçta olmayan aktivite 0 puanla raporlanır
+    assert rapor['RAMAZAN_HAM_PUAN'].tolist() == [0, 0]
+
+
+def test_duz_veriden_geri_kurulur():
+    sonuclar = puan_sonuclari({'uyelik': 4.0, 'bayrak': 1.0})
+    veri = sonuclar.duz_veri()
+
+    # Sadece JSON'a çevrilebilir yerleşik tipler (session'a sınıf nesnesi girmez)
+    assert json.loads(json.dumps(veri)) == veri
+
+    kurulan = PuanSonuclari.duz_veriden(veri)
+    assert kurulan.iller == sonuclar.iller
+    assert kurulan.normalize == pytest.approx(sonuclar.normalize)
+    assert kurulan.toplam_puan == pytest.approx(sonuclar.toplam_puan)
+    assert kurulan.agirlikli_toplamlar({'bayrak': 3.0}) == pytest.approx(sonuclar.agirlikli_toplamlar({'bayrak': 3.0}))
+    assert kurulan['ADANA']['uyelik_detay'] == {}
+    assert kurulan['BURSA']['kategori_katsayi'] == 1.08
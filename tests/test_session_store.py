@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Session deposu (bellek / SQLite) testleri - iki arka uç aynı davranışı göstermeli"""
+
+from datetime import datetime
+
+import pytest
+
+import session_store as depo_modulu
+from session_store import MemorySessionStore, SQLiteSessionStore, create_session_store
+
+
+class SahteSaat:
+    def __init__(self):
+        self.zaman = 1_000_000.0
+
+    def __call__(self):
+        return self.zaman
+
+
+@pytest.fixture
+def saat(monkeypatch):
+    sahte = SahteSaat()
+    monkeypatch.setattr(depo_modulu.time, 'time', sahte)
+    return sahte
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def depo_olustur(request, tmp_path):
+    """Aynı ayarlarla istenen arka uçta depo oluşturan fabrika; silinenleri kaydeder"""
+    silinenler = []
+
+    def olustur(**ayarlar):
+        ayarlar.setdefault('on_evict', silinenler.append)
+        if request.param == 'sqlite':
+            return SQLiteSessionStore(str(tmp_path / 'sessions.db'), **ayarlar)
+        return MemorySessionStore(**ayarlar)
+
+    olustur.silinenler = silinenler
+    return olustur
+
+
+def test_get_kopya_dondurur(depo_olustur):
+    depo = depo_olustur()
+    depo.set('a', {'dosyalar': ['x.csv']})
+
+    veri = depo.get('a')
+    veri['yeni'] = 1
+    assert depo.get('a') == {'dosyalar': ['x.csv']}
+    assert depo.get('yok') is None
+    assert 'a' in depo and 'yok' not in depo
+
+
+def test_update_olusturur_ve_birlestirir(depo_olustur):
+    depo = depo_olustur()
+    assert depo.update('a', x=1) == {'x': 1}
+    assert depo.update('a', y=2) == {'x': 1, 'y': 2}
+    depo.delete('a')
+    assert depo.get('a') is None
+    assert depo.session_ids() == []
+
+
+def test_suresi_dolan_session_silinir(depo_olustur, saat):
+    depo = depo_olustur(ttl=60)
+    depo.set('eski', {'x': 1})
+    saat.zaman += 30
+    depo.set('yeni', {'x': 2})
+
+    saat.zaman += 45  # eski: 75 sn, yeni: 45 sn
+    assert depo.cleanup() == ['eski']
+    assert depo.session_ids() == ['yeni']
+    assert depo_olustur.silinenler == ['eski']
+
+
+def test_erisim_sureyi_uzatir(depo_olustur, saat):
+    depo = depo_olustur(ttl=60)
+    depo.set('a', {'x': 1})
+    saat.zaman += 50
+    assert depo.get('a') is not None
+    saat.zaman += 50
+    assert depo.get('a') == {'x': 1}
+
+
+def test_sayi_siniri_en_az_kullanilani_siler(depo_olustur, saat):
+    depo = depo_olustur(max_sessions=2)
+    depo.set('a', {})
+    saat.zaman += 1
+    depo.set('b', {})
+    saat.zaman += 1
+    depo.get('a')
+    saat.zaman += 1
+    depo.set('c', {})
+
+    assert sorted(depo.session_ids()) == ['a', 'c']
+    assert depo_olustur.silinenler == ['b']
+    assert depo.stats()['sessions'] == 2
+
+
+def test_boyut_siniri_uygulanir(depo_olustur, saat):
+    buyuk = {'veri': 'x' * 1000}
+    depo = depo_olustur(max_bytes=2500)
+    for session_id in ('a', 'b', 'c'):
+        depo.set(session_id, buyuk)
+        saat.zaman += 1
+
+    assert sorted(depo.session_ids()) == ['b', 'c']
+    assert depo.stats()['bytes'] <= 2500
+    assert depo_olustur.silinenler == ['a']
+
+
+def test_isler_guncellenir_ve_temizlenir(depo_olustur, saat):
+    depo = depo_olustur()
+    depo.set_job('bitti', {'status': 'queued', 'finished_at': None})
+    depo.set_job('suruyor', {'status': 'running', 'finished_at': None})
+
+    bitis = datetime.fromtimestamp(saat.zaman).isoformat()
+    assert depo.update_job('bitti', status='completed', finished_at=bitis)['status'] == 'completed'
+    assert depo.update_job('yok', status='completed') is None
+    assert depo.get_job('yok') is None
+
+    # İşler session sayısına/temizliğine dahil değil
+    assert depo.session_ids() == []
+
+    saat.zaman += 30
+    assert depo.cleanup_jobs(60) == []
+    saat.zaman += 60
+    assert depo.cleanup_jobs(60) == ['bitti']
+    assert depo.get_job('bitti') is None
+    assert depo.get_job('suruyor')['status'] == 'running'
+
+
+def test_zaman_asimindaki_isler_basarisiz_sayilir(depo_olustur, saat):
+    depo = depo_olustur()
+    simdi = datetime.fromtimestamp(saat.zaman).isoformat()
+    depo.set_job('takili', {'status': 'running', 'created_at': simdi, 'started_at': simdi, 'finished_at': None})
+    depo.set_job('sirada', {'status': 'queued', 'created_at': simdi, 'started_at': None, 'finished_at': None})
+
+    saat.zaman += 100
+    depo.set_job('yeni', {'status': 'running', 'started_at': datetime.fromtimestamp(saat.zaman).isoformat(),
+                          'finished_at': None})
+    saat.zaman += 50
+
+    # Başlangıçtan (sıradaysa oluşturulmadan) bu yana 120 sn geçenler başarısız olur, silinmez
+    assert depo.cleanup_jobs(3600, max_runtime=120) == []
+    for job_id in ('takili', 'sirada'):
+        is_kaydi = depo.get_job(job_id)
+        assert is_kaydi['status'] == 'failed'
+        assert 'zaman aşımı' in is_kaydi['message']
+        assert is_kaydi['finished_at'] == datetime.fromtimestamp(saat.zaman).isoformat()
+    assert depo.get_job('yeni')['status'] == 'running'
+
+    # Başarısız işaretlenen işler saklama süresi dolunca silinir
+    saat.zaman += 60
+    assert sorted(depo.cleanup_jobs(30, max_runtime=120)) == ['sirada', 'takili']
+    assert depo.get_job('yeni')['status'] == 'running'
+    saat.zaman += 20
+    assert depo.cleanup_jobs(30, max_runtime=120) == []
+    assert depo.get_job('yeni')['status'] == 'failed'
+
+
+def test_sqlite_deposu_surecler_arasi_paylasilir(tmp_path):
+    db = str(tmp_path / 'sessions.db')
+    birinci = SQLiteSessionStore(db)
+    birinci.update('a', x=1)
+    birinci.set_job('is', {'status': 'running'})
+
+    # Var olan dosyayı açan ikinci depo (başka worker veya yeniden başlatma)
+    ikinci = SQLiteSessionStore(db)
+    assert ikinci.get('a') == {'x': 1}
+    ikinci.update('a', y=2)
+    assert birinci.get('a') == {'x': 1, 'y': 2}
+    ikinci.update_job('is', status='completed')
+    assert birinci.get_job('is') == {'status': 'completed'}
+
+
+def test_ortam_degiskeni_arka_ucu_secer(tmp_path, monkeypatch):
+    monkeypatch.delenv('SESSION_STORE', raising=False)
+    assert isinstance(create_session_store(), MemorySessionStore)
+
+    monkeypatch.setenv('SESSION_STORE', 'sqlite')
+    monkeypatch.setenv('SESSION_DB', str(tmp_path / 'ortam.db'))
+    monkeypatch.setenv('SESSION_TTL', '120')
+    depo = create_session_store()
+    assert isinstance(depo, SQLiteSessionStore)
+    assert depo.ttl == 120
+
+
+def test_arayuz_soyut_sinif():
+    with pytest.raises(TypeError):
+        depo_modulu.SessionStore()
+
+    class EksikDepo(depo_modulu.SessionStore):
+        def get(self, session_id):
+            return None
+
+    # Soyut metodların hepsini uygulamayan alt sınıf da oluşturulamaz
+    with pytest.raises(TypeError, match='abstract'):
+        EksikDepo()
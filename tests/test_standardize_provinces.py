@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""İl ismi standartlaştırma testleri: toplu yol, kalıcı varyant indeksi ve bulanık eşleştirme"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import standardize_provinces as il_modulu
+from standardize_provinces import (
+    CANONICAL_PROVINCES, TURKISH_CHAR_MAP, ProvinceBKTree, edit_distance, fuzzy_key, fuzzy_match_province,
+    load_province_index, normalize_turkish_text, standardize_province_name, standardize_province_series
+)
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def indeks_dosyasi(tmp_path, monkeypatch):
+    """Varyant indeksi depo yerine geçici klasöre yazılır, süreç önbelleği her testte boş"""
+    yol = tmp_path / 'veri_cache' / 'il_varyant_indeksi.json'
+    monkeypatch.setattr(il_modulu, 'PROVINCE_INDEX_PATH', str(yol))
+    monkeypatch.setattr(il_modulu, '_province_index', None)
+    monkeypatch.setattr(il_modulu, '_province_bktree', None)
+    return yol
+
+
+@pytest.mark.parametrize('metin', ['istanbul', 'Şanlıurfa', 'ığdır', 'çanakkale', 'Kırşehir', 'afyon karahisar'])
+def test_translate_tablosu_zincirleme_replace_ile_ayni(metin):
+    beklenen = metin.upper()
+    for eski, yeni in TURKISH_CHAR_MAP.items():
+        beklenen = beklenen.replace(eski, yeni)
+    assert normalize_turkish_text(metin) == beklenen
+
+
+def test_sutun_satir_satir_apply_ile_ayni():
+    degerler = pd.Series(
+        ['istanbul', 'İSTANBUL', ' ankara ', 'Afyon', np.nan, 'sanliurfa', 'istanbul', None, 'BİLİNMEYEN'],
+        index=range(10, 19), name='İL'
+    )
+    sonuc = standardize_province_series(degerler)
+
+    assert sonuc.name == 'İL'
+    assert list(sonuc.index) == list(degerler.index)
+    assert sonuc.isna().tolist() == degerler.isna().tolist()
+    dolu = degerler.notna()
+    assert sonuc[dolu].tolist() == degerler[dolu].apply(standardize_province_name).tolist()
+
+
+def test_paket_verisinde_apply_ile_ayni():
+    df = pd.read_csv(KOK_KLASOR / 'data' / 'Danışma_Meclisi.csv', encoding='utf-8', dtype=str)
+    pd.testing.assert_series_equal(standardize_province_series(df['İL']), df['İL'].apply(standardize_province_name))
+
+
+def test_bk_agaci_aramasi_dogrusal_tarama_ile_ayni():
+    agac = ProvinceBKTree.build(CANONICAL_PROVINCES)
+    for anahtar in ['ISTANBL', 'MARTIN', 'KARAN', 'SANLIURFA', 'XYZ']:
+        for mesafe in (0, 1, 2):
+            beklenen = sorted(
+                (edit_distance(anahtar, fuzzy_key(il)), il) for il in CANONICAL_PROVINCES
+                if edit_distance(anahtar, fuzzy_key(il)) <= mesafe
+            )
+            assert agac.search(anahtar, mesafe) == beklenen, (anahtar, mesafe)
+
+
+@pytest.mark.parametrize('girdi, beklenen', [
+    ('Diyarbakr', 'DİYARBAKIR'),
+    ('ISTANBL', 'İSTANBUL'),
+    ('Eskisehr', 'ESKİŞEHİR'),
+    ('Kahramanmars', 'KAHRAMANMARAŞ'),
+])
+def test_yazim_hatalari_bulanik_eslesir(girdi, beklenen):
+    il, guven = fuzzy_match_province(girdi)
+    assert il == beklenen
+    assert il_modulu.FUZZY_MIN_CONFIDENCE <= guven < 1
+    assert standardize_province_name(girdi) == beklenen
+
+
+def test_esit_uzaklikta_iki_aday_varsa_eslesmez():
+    # MARTIN hem BARTIN hem MARDIN ile 1 uzaklıkta
+    assert fuzzy_match_province('Martin') is None
+    assert standardize_province_name('Martin') == 'Martin'
+
+
+def test_kisa_isimler_sadece_birebir_eslesir():
+    assert fuzzy_match_province('mus') == ('MUŞ', 1.0)
+    assert fuzzy_match_province('Vam') is None
+    assert fuzzy_match_province('Karz') is None
+
+
+def test_indeks_diske_yazilir_ve_tekrar_kullanilir(indeks_dosyasi, monkeypatch):
+    ilk = load_province_index()
+    assert indeks_dosyasi.exists()
+    assert not list(indeks_dosyasi.parent.glob('*.tmp'))
+
+    def uretme(*args, **kwargs):
+        raise AssertionError('İndeks yeniden üretildi')
+
+    monkeypatch.setattr(il_modulu, 'build_province_index', uretme)
+    assert load_province_index() == ilk
+
+
+def test_imza_degisince_indeks_yeniden_uretilir(indeks_dosyasi, monkeypatch):
+    load_province_index()
+    eski_imza = json.loads(indeks_dosyasi.read_text(encoding='utf-8'))['signature']
+
+    monkeypatch.setattr(il_modulu, 'SPECIAL_CASES', dict(il_modulu.SPECIAL_CASES, ANTEP='GAZİANTEP'))
+    indeks = load_province_index()
+
+    assert indeks['signature'] != eski_imza
+    assert indeks['variants']['ANTEP'] == 'GAZİANTEP'
+    assert json.loads(indeks_dosyasi.read_text(encoding='utf-8'))['signature'] == indeks['signature']
+
+
+def test_bozuk_indeks_dosyasi_yeniden_uretilir(indeks_dosyasi):
+    indeks_dosyasi.parent.mkdir(parents=True)
+    indeks_dosyasi.write_text('{bozuk', encoding='utf-8')
+
+    assert load_province_index()['variants']['ISTANBUL'] == 'İSTANBUL'
+    assert json.loads(indeks_dosyasi.read_text(encoding='utf-8'))['version'] == il_modulu.PROVINCE_INDEX_VERSION
+
+
+@pytest.fixture
+def il_klasoru(tmp_path):
+    """Değişecek, zaten standart ve il sütunu olmayan birer CSV içeren klasör"""
+    klasor = tmp_path / 'il_verisi'
+    klasor.mkdir()
+    pd.DataFrame({'İL': ['istanbul', 'Ankara', 'ISTANBL', 'istanbul'], 'SAYI': [1, 2, 3, 4]}).to_csv(
+        klasor / 'a.csv', index=False, encoding='utf-8')
+    pd.DataFrame({'İL': ['İZMİR', 'BURSA'], 'SAYI': [5, 6]}).to_csv(klasor / 'b.csv', index=False, encoding='utf-8')
+    pd.DataFrame({'AD': ['x'], 'SAYI': [7]}).to_csv(klasor / 'c.csv', index=False, encoding='utf-8')
+    return klasor
+
+
+def klasor_icerigi(klasor):
+    return {yol.name: (yol.read_bytes(), yol.stat().st_mtime_ns) for yol in sorted(klasor.iterdir())}
+
+
+def test_deneme_modunda_hicbir_dosya_yazilmaz(il_klasoru):
+    once = klasor_icerigi(il_klasoru)
+    rapor = il_modulu.standardize_all_provinces_report(str(il_klasoru), backup=True, dry_run=True)
+
+    assert klasor_icerigi(il_klasoru) == once
+    a = rapor[str(il_klasoru / 'a.csv')]
+    assert a['success'] and a['dry_run'] and not a['written']
+    assert a['changes'] == 4
+    assert a['examples'] == [('istanbul', 'İSTANBUL'), ('Ankara', 'ANKARA'), ('ISTANBL', 'İSTANBUL')]
+    assert rapor[str(il_klasoru / 'c.csv')]['error'] == 'İl sütunu bulunamadı'
+
+
+def test_degisen_dosya_atomik_yazilir_degismeyen_dokunulmaz(il_klasoru):
+    b_once = klasor_icerigi(il_klasoru)['b.csv']
+    rapor = il_modulu.standardize_all_provinces_report(str(il_klasoru), backup=True)
+
+    assert rapor[str(il_klasoru / 'a.csv')]['written']
+    assert pd.read_csv(il_klasoru / 'a.csv')['İL'].tolist() == ['İSTANBUL', 'ANKARA', 'İSTANBUL', 'İSTANBUL']
+    assert pd.read_csv(il_klasoru / 'a_backup.csv')['İL'].tolist() == ['istanbul', 'Ankara', 'ISTANBL', 'istanbul']
+    assert not rapor[str(il_klasoru / 'b.csv')]['written']
+    assert klasor_icerigi(il_klasoru)['b.csv'] == b_once
+    assert not list(il_klasoru.glob('.*.tmp'))
+
+
+def test_yarida_kalan_yazma_orijinali_bozmaz(il_klasoru, monkeypatch):
+    once = (il_klasoru / 'a.csv').read_bytes()
+
+    def tasima_hatasi(kaynak, hedef):
+        raise OSError('disk dolu')
+
+    monkeypatch.setattr(il_modulu.os, 'replace', tasima_hatasi)
+    rapor = il_modulu.process_csv_file_report(str(il_klasoru / 'a.csv'))
+
+    assert not rapor['success'] and rapor['error'] == 'disk dolu'
+    assert (il_klasoru / 'a.csv').read_bytes() == once
+    assert not list(il_klasoru.glob('.*.tmp'))
+
+
+def test_surec_havuzu_raporu_sirali_islemle_ayni(il_klasoru):
+    sirali = il_modulu.standardize_all_provinces_report(str(il_klasoru), dry_run=True)
+    havuz = il_modulu.standardize_all_provinces_report(str(il_klasoru), max_workers=2, dry_run=True)
+
+    assert list(havuz) == list(sirali) == sorted(str(yol) for yol in il_klasoru.glob('*.csv'))
+    assert havuz == sirali
+    assert il_modulu.standardize_all_provinces(str(il_klasoru), max_workers=2, dry_run=True) == {
+        yol: rapor['success'] for yol, rapor in sirali.items()
+    }
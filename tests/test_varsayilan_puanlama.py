@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Varsayılan (min-max) aktivite puanlaması testleri: sütun seçimi, ağırlıklar ve nüfus normalizasyonu"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sistem import AktivitePuanlari
+
+
+@pytest.fixture
+def deneme_sistemi(yuklu_sistem):
+    """Üyelik illeri için iki sayısal sütunlu 'deneme' aktivitesi"""
+    uyelik = yuklu_sistem.veriler['uyelik'].drop_duplicates('İL')
+    n = len(uyelik)
+    yuklu_sistem.veriler['deneme'] = pd.DataFrame({
+        'İL': uyelik['İL'].to_numpy(),
+        'İL_KODU': uyelik['İL_KODU'].to_numpy(),
+        'A': np.arange(n) % 9 * 1.0,
+        'B': (np.arange(n) * 7) % 11 * 1.0,
+        'NOT': ['x'] * n,
+    })
+    return yuklu_sistem
+
+
+def puanla(sistem, **config):
+    return sistem._varsayilan_puanlari_hesapla('deneme', dict({'importance_coefficient': 2.0}, **config))
+
+
+def eski_min_max(sistem, sutun, max_puan):
+    """Önceki satır satır uygulama (tek sütun, kategori katsayısız)"""
+    df = sistem.veriler['deneme']
+    degerler = pd.to_numeric(df[sutun], errors='coerce').fillna(0)
+    normalize = (degerler - degerler.min()) / (degerler.max() - degerler.min())
+    return {row['İL']: min(max_puan, normalize.iloc[idx] * max_puan) for idx, row in df.iterrows()}
+
+
+def test_tek_sutunda_satir_satir_uygulama_ile_ayni(deneme_sistemi):
+    puanlar = puanla(deneme_sistemi, key_columns=['A'])
+
+    assert isinstance(puanlar, AktivitePuanlari)
+    beklenen = eski_min_max(deneme_sistemi, 'A', 20.0)
+    assert {il: detay['toplam_deneme'] for il, detay in puanlar.items()} == pytest.approx(beklenen)
+    assert puanlar.puan.max() == pytest.approx(20.0)
+
+
+def test_il_sutunlari_ve_metin_sutunlari_atlanir(deneme_sistemi):
+    sadece_a = puanla(deneme_sistemi, key_columns=['A'])
+    il_ile = puanla(deneme_sistemi, key_columns=['İL', 'İL_KODU', 'NOT', 'A'])
+    np.testing.assert_allclose(il_ile.puan, sadece_a.puan)
+
+    # Uygun sütun kalmazsa tüm sayısal sütunlar (İL_KODU hariç) kullanılır
+    assert deneme_sistemi._varsayilan_puan_sutunlari(deneme_sistemi.veriler['deneme'], {'key_columns': ['İL']}) == ['A', 'B']
+
+
+def test_sutun_agirliklari(deneme_sistemi):
+    df = deneme_sistemi.veriler['deneme']
+    puanlar = puanla(deneme_sistemi, key_columns=['A', 'B'], column_weights={'A': 3, 'B': 1})
+
+    a = df['A'] / df['A'].max()
+    b = df['B'] / df['B'].max()
+    beklenen = dict(zip(df['İL'], (0.75 * a + 0.25 * b) * 20.0))
+    assert {il: detay['toplam_deneme'] for il, detay in puanlar.items()} == pytest.approx(beklenen)
+
+    # Ağırlık verilmezse sütunlar eşit ağırlıklıdır
+    esit = puanla(deneme_sistemi, key_columns=['A', 'B'])
+    beklenen = dict(zip(df['İL'], (0.5 * a + 0.5 * b) * 20.0))
+    assert {il: detay['toplam_deneme'] for il, detay in esit.items()} == pytest.approx(beklenen)
+
+
+def test_nufus_normalizasyonu_yuz_bin_kisi_basina(deneme_sistemi):
+    df = deneme_sistemi.veriler['deneme']
+    puanlar = puanla(deneme_sistemi, key_columns=['A'], population_normalization=True)
+
+    nufus = df['İL'].map(deneme_sistemi.il_referans.nufus).to_numpy(dtype=float)
+    oran = df['A'].to_numpy() / nufus * 100000
+    normalize = (oran - oran.min()) / (oran.max() - oran.min())
+    for il, beklenen_oran, beklenen_puan in zip(df['İL'], oran, normalize * 20.0):
+        assert puanlar[il]['main_metric_100k'] == pytest.approx(beklenen_oran)
+        assert puanlar[il]['toplam_deneme'] == pytest.approx(beklenen_puan)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Vektörel ve döngülü hesaplama yollarının aynı sonucu verdiği testleri"""
+
+import pandas as pd
+import pytest
+
+from sistem import DinamikPuanlamaSistemi
+
+
+def analiz_et(klasor, vektorel_hesaplama):
+    sistem = DinamikPuanlamaSistemi(vektorel_hesaplama=vektorel_hesaplama, calisma_klasoru=str(klasor))
+    assert sistem.dinamik_veri_yukle()
+    sistem.il_kategorileri_belirle()
+    return sistem.genel_puanlama_hesapla()
+
+
+def sonuclari_karsilastir(vektorel, dongu):
+    assert set(vektorel) == set(dongu)
+    for il in vektorel:
+        beklenen, gercek = dongu[il], vektorel[il]
+        assert gercek['toplam_puan'] == pytest.approx(beklenen['toplam_puan'], abs=1e-9), il
+        for aktivite in ('uyelik', 'danisma', 'ramazan', 'bayrak'):
+            anahtar = f'{aktivite}_ham_puan'
+            assert gercek[anahtar] == pytest.approx(beklenen[anahtar], abs=1e-9), (il, aktivite)
+
+
+def danisma_aylarini_degistir(klasor, yeni_aylar):
+    """Danışma dosyasının ay sütunlarını yeniden adlandır (fazlalar TARİH çiftiyle atılır)"""
+    yol = klasor / 'data' / 'Danışma_Meclisi.csv'
+    df = pd.read_csv(yol, encoding='utf-8', dtype=str)
+    sutunlar = ['İL', 'İLÇE']
+    for i, ay in enumerate(['HAZİRAN', 'TEMMUZ', 'AĞUSTOS'][:len(yeni_aylar)]):
+        tarih = 'TARİH' if i == 0 else f'TARİH.{i}'
+        df = df.rename(columns={ay: yeni_aylar[i]})
+        sutunlar += [yeni_aylar[i], tarih]
+    df[sutunlar].to_csv(yol, index=False, encoding='utf-8')
+
+
+def test_paket_verisinde_yollar_ayni(calisma_alani):
+    sonuclari_karsilastir(analiz_et(calisma_alani, True), analiz_et(calisma_alani, False))
+
+
+@pytest.mark.parametrize('aktivite', ['uyelik', 'ramazan', 'bayrak'])
+def test_aktivite_detaylari_ayni(sistem, aktivite):
+    assert sistem.dinamik_veri_yukle()
+    sistem.il_kategorileri_belirle()
+    hesapla = getattr(sistem, f'_{aktivite}_puani_hesapla')
+    vektorel = hesapla()
+    sistem.vektorel_hesaplama = False
+    dongu = hesapla()
+
+    assert sorted(vektorel) == sorted(dongu)
+    for il, beklenen in dongu.items():
+        assert vektorel[il] == pytest.approx(beklenen, abs=1e-9), il
+
+
+@pytest.mark.parametrize('aylar', [
+    ['EYLÜL', 'EKİM', 'KASIM'],
+    ['MART', 'NİSAN'],
+])
+def test_farkli_ay_sutunlarinda_yollar_ayni(calisma_alani, aylar):
+    danisma_aylarini_degistir(calisma_alani, aylar)
+    vektorel = analiz_et(calisma_alani, True)
+    dongu = analiz_et(calisma_alani, False)
+    sonuclari_karsilastir(vektorel, dongu)
+
+    # Ay adları değişince puanlar sıfıra düşmemeli
+    assert max(vektorel[il]['danisma_ham_puan'] for il in vektorel) > 0
+
+
+def test_danisma_parcali_okuma_tek_seferlik_sayimla_ayni(sistem, calisma_alani):
+    yol = calisma_alani / 'data' / 'Danışma_Meclisi.csv'
+    df = pd.read_csv(yol, encoding='utf-8', dtype=str)
+    aylar = sistem._danisma_ay_sutunlari(df.columns)
+    beklenen = sistem._danisma_durum_sayimi(df, aylar)
+
+    assert sistem._danisma_dosyasini_akisla_oku(yol, parca_boyutu=7)
+    parca_aylari, sayim = sistem.danisma_sayimi
+
+    assert parca_aylari == aylar
+    pd.testing.assert_frame_equal(
+        sayim.sort_index()[beklenen.columns].astype(float),
+        beklenen.sort_index().astype(float),
+        check_names=False
+    )
+
+
+def test_danisma_verisi_ham_satirlari_tutar(sistem, calisma_alani):
+    yol = calisma_alani / 'data' / 'Danışma_Meclisi.csv'
+    df = pd.read_csv(yol, encoding='utf-8', dtype=str)
+
+    assert sistem._danisma_dosyasini_akisla_oku(yol, parca_boyutu=7)
+    danisma = sistem.veriler['danisma']
+
+    # Sayımlar sadece danisma_sayimi'nda; veriler diğer aktiviteler gibi satır tablosu
+    assert len(danisma) == len(df)
+    assert set(df.columns) | {'İL_KODU'} == set(danisma.columns)
+    assert danisma['İL_KODU'].between(1, 81).all()
+
+    # Önbellekten gelen de aynı satırlar
+    ikinci = DinamikPuanlamaSistemi(calisma_klasoru=str(calisma_alani))
+    assert ikinci._danisma_dosyasini_akisla_oku(yol)
+    pd.testing.assert_frame_equal(ikinci.veriler['danisma'], danisma)
+    assert ikinci.danisma_sayimi[0] == sistem.danisma_sayimi[0]
+
+
+def test_ay_sutunlari_basliktan_bulunur(sistem):
+    assert sistem._danisma_ay_sutunlari(
+        ['İL', 'İLÇE', 'HAZİRAN', 'TARİH', 'TEMMUZ', 'TARİH.1', 'AĞUSTOS', 'TARİH.2']
+    ) == ['HAZİRAN', 'TEMMUZ', 'AĞUSTOS']
+    # Ay adı olmayan ama ardından TARİH gelen sütun da ay sayılır
+    assert sistem._danisma_ay_sutunlari(
+        ['İL', 'İLÇE', '1. TOPLANTI', 'TARİH', 'EKİM', 'TARİH.1', 'NOT']
+    ) == ['1. TOPLANTI', 'EKİM']
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Temizlenmiş veri önbelleği testleri: içerik özetiyle anahtarlama ve atomik yazma"""
+
+import pandas as pd
+
+import sistem as sistem_modulu
+from sistem import DinamikPuanlamaSistemi
+
+
+def yukle(klasor):
+    sistem = DinamikPuanlamaSistemi(calisma_klasoru=str(klasor))
+    assert sistem.dinamik_veri_yukle()
+    return sistem
+
+
+def test_degismeyen_dosya_ayristirilmadan_yuklenir(calisma_alani, monkeypatch):
+    ilk = yukle(calisma_alani)
+    onbellek = calisma_alani / DinamikPuanlamaSistemi.VERI_ONBELLEK_KLASORU
+    assert len(list(onbellek.glob('*.pkl'))) == 4
+    assert not list(onbellek.glob('*.tmp'))
+
+    def okuma_yok(*args, **kwargs):
+        raise AssertionError('CSV yeniden ayrıştırıldı')
+
+    monkeypatch.setattr(sistem_modulu.pd, 'read_csv', okuma_yok)
+    ikinci = yukle(calisma_alani)
+
+    assert set(ikinci.veriler) == set(ilk.veriler)
+    for aktivite, df in ilk.veriler.items():
+        pd.testing.assert_frame_equal(ikinci.veriler[aktivite], df)
+    assert ikinci.danisma_sayimi[0] == ilk.danisma_sayimi[0]
+
+
+def test_icerik_degisince_yeniden_temizlenir(calisma_alani):
+    ilk = yukle(calisma_alani)
+    yol = calisma_alani / 'data' / 'Bayrak_Çalışması.csv'
+    satirlar = yol.read_text(encoding='utf-8').rstrip('\n').split('\n')
+    yol.write_text('\n'.join(satirlar[:-1]) + '\n', encoding='utf-8')
+
+    ikinci = yukle(calisma_alani)
+    assert len(ikinci.veriler['bayrak']) == len(ilk.veriler['bayrak']) - 1
+    assert len(list((calisma_alani / DinamikPuanlamaSistemi.VERI_ONBELLEK_KLASORU).glob('bayrak_*.pkl'))) == 2
+
+
+def test_bozuk_onbellek_dosyasi_yok_sayilir(calisma_alani):
+    ilk = yukle(calisma_alani)
+    for yol in (calisma_alani / DinamikPuanlamaSistemi.VERI_ONBELLEK_KLASORU).glob('uyelik_*.pkl'):
+        yol.write_bytes(b'bozuk')
+
+    # Okunamayan önbellek dosyası yerine CSV yeniden ayrıştırılıp temizlenir
+    pd.testing.assert_frame_equal(yukle(calisma_alani).veriler['uyelik'], ilk.veriler['uyelik'])
+
+
+def test_temizleme_surumu_anahtarin_parcasi(sistem, monkeypatch):
+    yol = sistem._onbellek_yolu('uyelik', 'a' * 64)
+    monkeypatch.setattr(DinamikPuanlamaSistemi, 'VERI_TEMIZLEME_SURUMU', DinamikPuanlamaSistemi.VERI_TEMIZLEME_SURUMU + 1)
+    assert sistem._onbellek_yolu('uyelik', 'a' * 64) != yol
+    assert sistem._onbellek_yolu('uyelik', 'b' * 64) != yol
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Şemalı CSV okuma testleri: binlik ayraç ve yüzde sütunları okuma sırasında tiplenir"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def csv_yaz(klasor, satirlar):
+    yol = klasor / 'uyelik.csv'
+    yol.write_text('\n'.join(satirlar) + '\n', encoding='utf-8')
+    return yol
+
+
+def test_binlik_ayrac_ve_yuzde_okurken_cevrilir(sistem, tmp_path):
+    yol = csv_yaz(tmp_path, [
+        'İL,MEVCUT ÜYE,YAPILAN YENİ ÜYE SAYISI,HEDEFE ULAŞMA ORANI',
+        'ADANA,"1,234,567",12,19%',
+        'BURSA,"98,000",,105%',
+    ])
+    df = sistem._semali_csv_oku('uyelik', yol)
+
+    assert df['MEVCUT ÜYE'].dtype == np.float64
+    assert df['MEVCUT ÜYE'].tolist() == [1234567.0, 98000.0]
+    assert df['HEDEFE ULAŞMA ORANI'].tolist() == [19.0, 105.0]
+
+    temiz = sistem._aktivite_verisi_temizle('uyelik', df)
+    assert temiz['YAPILAN YENİ ÜYE SAYISI'].tolist() == [12.0, 0.0]
+
+
+def test_tipli_okunamayan_dosya_metin_olarak_temizlenir(sistem, tmp_path):
+    yol = csv_yaz(tmp_path, [
+        'İL,MEVCUT ÜYE,HEDEFE ULAŞMA ORANI',
+        'ADANA,"1,234",19%',
+        'BURSA,bilinmiyor,20%',
+    ])
+    df = sistem._aktivite_verisi_temizle('uyelik', sistem._semali_csv_oku('uyelik', yol))
+
+    assert df['MEVCUT ÜYE'].tolist() == [1234.0, 0.0]
+    assert df['HEDEFE ULAŞMA ORANI'].tolist() == [19.0, 20.0]
+
+
+@pytest.mark.parametrize('aktivite, dosya', [
+    ('uyelik', 'Üyelik.csv'),
+    ('bayrak', 'Bayrak_Çalışması.csv'),
+])
+def test_paket_verisinde_metin_temizleme_ile_ayni(sistem, calisma_alani, aktivite, dosya):
+    yol = calisma_alani / 'data' / dosya
+    tipli = sistem._aktivite_verisi_temizle(aktivite, sistem._semali_csv_oku(aktivite, yol))
+    metin = sistem._aktivite_verisi_temizle(aktivite, pd.read_csv(yol, encoding='utf-8'))
+
+    for col in sistem.VERI_SEMALARI[aktivite]['sayisal'] + sistem.VERI_SEMALARI[aktivite]['yuzde']:
+        if col in metin.columns:
+            np.testing.assert_allclose(tipli[col].to_numpy(float), metin[col].to_numpy(float), err_msg=col)
+
+
+def test_ramazan_aktivite_sutunlari_sayisal(sistem, calisma_alani):
+    df = sistem._semali_csv_oku('ramazan', calisma_alani / 'data' / 'Ramazan_Çalışmaları.csv')
+    for col in sistem.RAMAZAN_AKTIVITE_SUTUNLARI:
+        if col in df.columns:
+            assert pd.api.types.is_numeric_dtype(df[col]), col
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Web API testleri: yükleme -> analiz işi -> sonuç -> yeniden ağırlıklandırma -> rapor"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+AKTIVITE_DOSYALARI = ['Üyelik.csv', 'Danışma_Meclisi.csv', 'Ramazan_Çalışmaları.csv', 'Bayrak_Çalışması.csv']
+
+
+def dosyalari_yukle(istemci, dosya_adlari=AKTIVITE_DOSYALARI):
+    veri = {'prime_cache': '0'}
+    for i, ad in enumerate(dosya_adlari):
+        veri[f'file{i}'] = (open(KOK_KLASOR / 'data' / ad, 'rb'), ad)
+    yanit = istemci.post('/api/upload', data=veri, content_type='multipart/form-data')
+    assert yanit.status_code == 200, yanit.json
+    return yanit.json
+
+
+def isi_bekle(istemci, job_id, sure=60):
+    bitis = time.time() + sure
+    while time.time() < bitis:
+        durum = istemci.get(f'/api/jobs/{job_id}').json
+        if durum['status'] not in ('queued', 'running'):
+            return durum
+        time.sleep(0.05)
+    pytest.fail(f'{job_id} işi {sure} saniyede bitmedi')
+
+
+def analiz_et(istemci):
+    dosyalari_yukle(istemci)
+    yanit = istemci.post('/api/analyze', json={})
+    assert yanit.status_code == 202
+    job_id = yanit.json['job_id']
+    durum = isi_bekle(istemci, job_id)
+    assert durum['status'] == 'completed', durum['message']
+    return job_id
+
+
+def test_nufus_dosyasi_bulunur(web_uygulamasi):
+    assert web_uygulamasi.NUFUS_DOSYASI is not None
+    assert web_uygulamasi.app.test_client().get('/api/status').json['population_data'] is True
+
+
+def test_upload_yollari_calisma_dizininden_bagimsiz(web_uygulamasi, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    kok = Path(web_uygulamasi.UYGULAMA_KLASORU) / 'uploads'
+
+    assert Path(web_uygulamasi.upload_klasoru()) == kok
+    istemci = web_uygulamasi.app.test_client()
+    dosyalari_yukle(istemci, ['Bayrak_Çalışması.csv'])
+    assert (kok / istemci.get('/api/session-info').json['session_id']).is_dir()
+    assert Path(web_uygulamasi.WebDinamikPuanlamaSistemi().data_folder) == kok
+    assert not (tmp_path / 'uploads').exists()
+
+
+def test_analiz_isi_sonucu_nufus_verisiyle(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    job_id = analiz_et(istemci)
+
+    yanit = istemci.get(f'/api/jobs/{job_id}/result')
+    assert yanit.status_code == 200
+    sonuc = yanit.json['result']
+    assert sonuc['success']
+    assert sonuc['summary']['total_activities'] == 4
+    assert sonuc['summary']['total_provinces'] == 81
+    puanlar = [il['total_score'] for il in sonuc['top_provinces']]
+    assert len(puanlar) == 10
+    assert puanlar == sorted(puanlar, reverse=True)
+
+    # Nüfus dosyası okunmazsa tüm iller 500000 nüfuslu "Orta İl" olur
+    iller = sonuc['top_provinces']
+    assert len({il['category'] for il in iller}) > 1
+    assert all(il['population'] != web_uygulamasi.DinamikPuanlamaSistemi.VARSAYILAN_NUFUS for il in iller)
+
+    assert istemci.get('/api/session-info').json['analysis_completed'] is True
+
+    # Session'da sınıf nesnesi değil, yeniden ağırlıklandırma için düz puan matrisi tutulur
+    session_id = istemci.get('/api/session-info').json['session_id']
+    puan_matrisi = web_uygulamasi.session_store.get(session_id)['puan_matrisi']
+    assert json.loads(json.dumps(puan_matrisi)) == puan_matrisi
+    assert len(puan_matrisi['iller']) == 81
+
+
+def test_yeniden_agirliklandirma(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    assert istemci.post('/api/reweight', json={'coefficients': {}}).status_code == 400
+
+    analiz_et(istemci)
+    yanit = istemci.post('/api/reweight', json={'coefficients': {'bayrak': 5}, 'limit': 81})
+    assert yanit.status_code == 200
+    veri = yanit.json
+    assert veri['activity_weights']['bayrak']['coefficient'] == 5
+    assert sum(a['weight_percentage'] for a in veri['activity_weights'].values()) == pytest.approx(100, abs=0.05)
+
+    puanlar = [il['total_score'] for il in veri['top_provinces']]
+    assert len(puanlar) == 81
+    assert puanlar == sorted(puanlar, reverse=True)
+
+
+def test_yeni_aktivite_katsayisi_sonuclara_uygulanir(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    analiz_et(istemci)
+
+    yanit = istemci.post('/api/new-activity', json={'activity_name': 'bayrak', 'coefficient': 5})
+    assert yanit.status_code == 200
+    veri = yanit.json
+    assert veri['success']
+    assert veri['activity_weights']['bayrak']['coefficient'] == 5
+
+    beklenen = istemci.post('/api/reweight', json={'coefficients': {'bayrak': 5}}).json
+    assert veri['top_provinces'] == beklenen['top_provinces']
+
+    # Analizde olmayan aktivitenin katsayısı sadece kaydedilir
+    yanit = istemci.post('/api/new-activity', json={'activity_name': 'genclik', 'coefficient': 2})
+    assert yanit.json['activity_weights']['bayrak']['coefficient'] == 5
+    assert 'genclik' not in yanit.json['activity_weights']
+
+
+def test_raporlar_session_klasorune_yazilir(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    analiz_et(istemci)
+    session_id = istemci.get('/api/session-info').json['session_id']
+
+    rapor = Path(web_uygulamasi.upload_klasoru()) / session_id / 'output_csv' / 'Dinamik_Genel_Performans_Raporu.csv'
+    assert rapor.exists()
+    assert not (Path(web_uygulamasi.UYGULAMA_KLASORU) / 'output_csv').exists()
+
+    yanit = istemci.get('/api/download/general')
+    assert yanit.status_code == 200
+    assert yanit.data.decode('utf-8-sig').startswith('İL,')
+
+
+def test_is_baska_sessiondan_gorunmez(web_uygulamasi):
+    job_id = analiz_et(web_uygulamasi.app.test_client())
+
+    baska = web_uygulamasi.app.test_client()
+    baska.get('/api/session-info')
+    assert baska.get(f'/api/jobs/{job_id}').status_code == 404
+    assert baska.get(f'/api/jobs/{job_id}/result').status_code == 404
+
+
+def test_is_durumu_ortak_depodan_okunur(web_uygulamasi, tmp_path, monkeypatch):
+    from session_store import SQLiteSessionStore
+
+    # İki worker aynı SQLite dosyasını kullanır: iş birinde çalışır, diğeri durumu okur
+    db = tmp_path / 'sessions.db'
+    monkeypatch.setattr(web_uygulamasi, 'session_store', SQLiteSessionStore(str(db)))
+    istemci = web_uygulamasi.app.test_client()
+    job_id = analiz_et(istemci)
+
+    diger_worker = SQLiteSessionStore(str(db))
+    is_kaydi = diger_worker.get_job(job_id)
+    assert is_kaydi['status'] == 'completed'
+    assert is_kaydi['result']['success']
+
+    monkeypatch.setattr(web_uygulamasi, 'session_store', diger_worker)
+    yanit = istemci.get(f'/api/jobs/{job_id}/result')
+    assert yanit.status_code == 200
+    assert yanit.json['result']['top_provinces'] == is_kaydi['result']['top_provinces']
+
+
+def test_takili_is_zaman_asiminda_basarisiz_olur(web_uygulamasi):
+    from datetime import datetime, timedelta
+
+    istemci = web_uygulamasi.app.test_client()
+    session_id = istemci.get('/api/session-info').json['session_id']
+    baslangic = (datetime.now() - timedelta(seconds=web_uygulamasi.ANALIZ_ZAMAN_ASIMI + 1)).isoformat()
+
+    # Worker'ı çökmüş, 'running' kalmış iş
+    web_uygulamasi.session_store.set_job('takili', {
+        'job_id': 'takili', 'session_id': session_id, 'status': 'running', 'progress': 40,
+        'stage': 'Puanlama', 'message': '', 'created_at': baslangic, 'started_at': baslangic,
+        'finished_at': None, 'result': None
+    })
+
+    durum = istemci.get('/api/jobs/takili').json
+    assert durum['status'] == 'failed'
+    assert 'zaman aşımı' in durum['message']
+    assert istemci.get('/api/jobs/takili/result').status_code == 200
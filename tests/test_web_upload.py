@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Akışlı CSV yükleme testleri: başlık doğrulama, boyut sınırı, SHA-256 tekilleştirme"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+KOK_KLASOR = Path(__file__).resolve().parent.parent
+BAYRAK = (KOK_KLASOR / 'data' / 'Bayrak_Çalışması.csv').read_bytes()
+
+
+def yukle(istemci, *dosyalar, **form):
+    veri = {'prime_cache': '0', **form}
+    for i, (ad, icerik) in enumerate(dosyalar):
+        veri[f'file{i}'] = (io.BytesIO(icerik), ad)
+    yanit = istemci.post('/api/upload', data=veri, content_type='multipart/form-data')
+    assert yanit.status_code == 200, yanit.json
+    return yanit.json
+
+
+def session_klasoru(web_uygulamasi, istemci):
+    return Path(web_uygulamasi.upload_klasoru()) / istemci.get('/api/session-info').json['session_id']
+
+
+def test_taninan_aktivite_standart_adla_kaydedilir(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    sonuc = yukle(istemci, ('bayrak verisi.csv', BAYRAK))
+
+    dosya = sonuc['files'][0]
+    assert dosya['saved_name'] == 'bayrak.csv'
+    assert dosya['activity'] == 'bayrak'
+    assert dosya['sha256'] == hashlib.sha256(BAYRAK).hexdigest()
+    assert dosya['size'] == len(BAYRAK)
+    assert (session_klasoru(web_uygulamasi, istemci) / 'bayrak.csv').read_bytes() == BAYRAK
+
+
+@pytest.mark.parametrize('icerik, neden', [
+    ('İLÇE,SAYI\nx,1\n'.encode('utf-8'), "'İL' sütunu"),
+    (b'', 'boş'),
+])
+def test_gecersiz_baslik_reddedilir(web_uygulamasi, icerik, neden):
+    istemci = web_uygulamasi.app.test_client()
+    sonuc = yukle(istemci, ('hatali.csv', icerik), ('bayrak.csv', BAYRAK))
+
+    assert [f['saved_name'] for f in sonuc['files']] == ['bayrak.csv']
+    assert len(sonuc['rejected_files']) == 1
+    assert sonuc['rejected_files'][0]['original_name'] == 'hatali.csv'
+    assert neden in sonuc['rejected_files'][0]['reason']
+
+    # Reddedilen dosyanın geçici parçası kalmaz
+    assert sorted(os.listdir(session_klasoru(web_uygulamasi, istemci))) == ['bayrak.csv']
+
+
+def test_baslik_parcalar_arasinda_bolunse_de_dogrulanir(web_uygulamasi, monkeypatch):
+    monkeypatch.setattr(web_uygulamasi, 'UPLOAD_PARCA_BOYUTU', 3)
+    sonuc = yukle(web_uygulamasi.app.test_client(), ('bayrak.csv', BAYRAK))
+    assert sonuc['files'][0]['activity'] == 'bayrak'
+    assert sonuc['files'][0]['sha256'] == hashlib.sha256(BAYRAK).hexdigest()
+
+
+def test_cok_uzun_baslik_reddedilir(web_uygulamasi, monkeypatch):
+    monkeypatch.setattr(web_uygulamasi, 'BASLIK_MAX_BOYUT', 32)
+    icerik = ('İL,' + ','.join(f'SUTUN_{i}' for i in range(20)) + '\nADANA\n').encode('utf-8')
+    sonuc = yukle(web_uygulamasi.app.test_client(), ('uzun.csv', icerik))
+    assert sonuc['files'] == []
+    assert 'çok uzun' in sonuc['rejected_files'][0]['reason']
+
+
+def test_boyut_siniri_asilinca_reddedilir(web_uygulamasi, monkeypatch):
+    monkeypatch.setattr(web_uygulamasi, 'MAX_FILE_SIZE', 100)
+    monkeypatch.setattr(web_uygulamasi, 'UPLOAD_PARCA_BOYUTU', 32)
+    istemci = web_uygulamasi.app.test_client()
+    sonuc = yukle(istemci, ('bayrak.csv', BAYRAK))
+
+    assert sonuc['files'] == []
+    assert 'boyutu' in sonuc['rejected_files'][0]['reason']
+    assert os.listdir(session_klasoru(web_uygulamasi, istemci)) == []
+
+
+def test_ayni_icerik_tekrar_yazilmaz(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    ilk = yukle(istemci, ('bayrak.csv', BAYRAK))['files'][0]
+    klasor = session_klasoru(web_uygulamasi, istemci)
+    degisme_zamani = os.path.getmtime(klasor / 'bayrak.csv')
+
+    # Aynı içerik başka adla: mevcut kayıt döner, dosya yeniden yazılmaz
+    tekrar = yukle(istemci, ('Bayrak (kopya).csv', BAYRAK))['files'][0]
+    assert tekrar['duplicate'] is True
+    assert tekrar['saved_name'] == ilk['saved_name']
+    assert tekrar['original_name'] == 'Bayrak (kopya).csv'
+    assert sorted(os.listdir(klasor)) == ['bayrak.csv']
+    assert os.path.getmtime(klasor / 'bayrak.csv') == degisme_zamani
+
+    session_dosyalari = istemci.get('/api/session-info').json['uploaded_files']
+    assert len(session_dosyalari) == 1
+
+
+def test_degisen_icerik_eskisinin_yerine_gecer(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    yukle(istemci, ('bayrak.csv', BAYRAK))
+    yeni_icerik = BAYRAK.rstrip(b'\r\n').rsplit(b'\n', 1)[0] + b'\n'
+    yeni = yukle(istemci, ('bayrak.csv', yeni_icerik))['files'][0]
+
+    assert yeni['duplicate'] is False
+    assert yeni['sha256'] == hashlib.sha256(yeni_icerik).hexdigest()
+    session_dosyalari = istemci.get('/api/session-info').json['uploaded_files']
+    assert [f['sha256'] for f in session_dosyalari] == [yeni['sha256']]
+
+    # Eski içerik artık session'da yok: tekrar yüklenince yeniden yazılır
+    eski = yukle(istemci, ('bayrak.csv', BAYRAK))['files'][0]
+    assert eski['duplicate'] is False
+
+
+def test_yuklemede_onbellek_hazirlanir(web_uygulamasi):
+    istemci = web_uygulamasi.app.test_client()
+    yukle(istemci, ('bayrak.csv', BAYRAK), prime_cache='1')
+
+    onbellek = Path(web_uygulamasi.UYGULAMA_KLASORU) / 'veri_cache'
+    bitis = time.time() + 30
+    while time.time() < bitis and not (onbellek.exists() and any(onbellek.iterdir())):
+        time.sleep(0.05)
+    assert any(ad.name.startswith('bayrak') for ad in onbellek.iterdir())
+
+
+def test_onbellek_hazirlama_analiz_havuzunu_kullanmaz(web_uygulamasi, monkeypatch):
+    calisan = []
+    monkeypatch.setattr(web_uygulamasi, 'onbellegi_hazirla',
+                        lambda *args: calisan.append(threading.current_thread().name))
+
+    def analiz_havuzu_kullanildi(*args, **kwargs):
+        raise AssertionError('Önbellek hazırlama analiz havuzuna gönderildi')
+
+    monkeypatch.setattr(web_uygulamasi.analiz_havuzu, 'submit', analiz_havuzu_kullanildi)
+    istemci = web_uygulamasi.app.test_client()
+    yukle(istemci, ('bayrak.csv', BAYRAK), prime_cache='1')
+
+    bitis = time.time() + 30
+    while time.time() < bitis and not calisan:
+        time.sleep(0.05)
+    assert calisan and calisan[0].startswith('onbellek')
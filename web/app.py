@@ -15,23 +15,79 @@ import tempfile
 import shutil
 from pathlib import Path
 import sys
+import csv
+import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
-# Aynı klasörden sistem.py'yi import et
-from sistem import DinamikPuanlamaSistemi
+# Puanlama sistemi (sistem.py) proje kök klasöründe;
+# web uygulaması ayrı bir kopya tutmaz, kök modülü genişletir
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sistem import DinamikPuanlamaSistemi, PuanSonuclari
+from session_store import create_session_store
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'your-secret-key-here')
 
 # Konfigürasyon
-UPLOAD_FOLDER = 'uploads'
+# Yükleme kök klasörü: göreli yol çalışma dizinine değil uygulama klasörüne göre çözülür (upload_klasoru)
+UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'uploads')
 ALLOWED_EXTENSIONS = {'csv'}
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
+# Yüklemede dosyanın temizlenmiş hali önbelleğe hazırlanır (analiz tekrar ayrıştırmaz)
+UPLOAD_ONBELLEK_HAZIRLA = os.environ.get('UPLOAD_ONBELLEK_HAZIRLA', '1') == '1'
+UPLOAD_PARCA_BOYUTU = 1024 * 1024
+BASLIK_MAX_BOYUT = 64 * 1024
+
+# Uygulama klasörü: ortak dosyalar (nüfus verisi, eşik tabloları, önbellek) buradan okunur
+UYGULAMA_KLASORU = os.path.dirname(os.path.abspath(__file__))
+
+# Arka plan analiz işleri (her analiz kendi session klasörüne yazar, paralel çalışabilir)
+ANALIZ_ISCI_SAYISI = int(os.environ.get('ANALIZ_ISCI_SAYISI', '4'))
+IS_SAKLAMA_SURESI = 60 * 60  # tamamlanan işler 1 saat saklanır
+# Bu süreyi (saniye) aşan sıradaki/çalışan işler başarısız sayılır (çöken worker'da takılı kalmasın)
+ANALIZ_ZAMAN_ASIMI = int(os.environ.get('ANALIZ_ZAMAN_ASIMI', 30 * 60))
+# Yüklemede önbellek hazırlama ayrı, küçük havuzda çalışır (analiz işlerini sıraya sokmasın)
+ONBELLEK_ISCI_SAYISI = int(os.environ.get('ONBELLEK_ISCI_SAYISI', '1'))
+
+def upload_klasoru():
+    """Upload kök klasörünün mutlak yolu (UPLOAD_FOLDER göreli ise UYGULAMA_KLASORU altında)"""
+    return os.path.join(UYGULAMA_KLASORU, UPLOAD_FOLDER)
+
+def upload_klasorunu_sil(session_id):
+    """Süresi dolan/silinen session'ın upload klasörünü sil"""
+    session_folder = os.path.join(upload_klasoru(), secure_filename(session_id))
+    if session_id and os.path.isdir(session_folder):
+        shutil.rmtree(session_folder, ignore_errors=True)
+
 # Global değişkenler
-current_session = {}
+# Session deposu: SESSION_STORE=sqlite ile tüm worker süreçleri aynı session'ları
+# ve analiz işlerini görür (iş hangi worker'da çalışırsa çalışsın durumu sorgulanabilir)
+session_store = create_session_store(on_evict=upload_klasorunu_sil)
+analiz_havuzu = ThreadPoolExecutor(max_workers=ANALIZ_ISCI_SAYISI, thread_name_prefix='analiz')
+onbellek_havuzu = ThreadPoolExecutor(max_workers=ONBELLEK_ISCI_SAYISI, thread_name_prefix='onbellek')
+
+def nufus_dosyasi_bul():
+    """Uygulama klasöründeki nüfus dosyası (yoksa None)
+    
+    Bulunamazsa tüm iller varsayılan nüfusla "Orta İl" sayılır; bu yüzden
+    başlangıçta kontrol edilir ve /api/status'ta bildirilir.
+    """
+    for dosya_adi in DinamikPuanlamaSistemi.NUFUS_DOSYA_ADLARI:
+        yol = os.path.join(UYGULAMA_KLASORU, 'data', dosya_adi)
+        if os.path.exists(yol):
+            return yol
+    print(f"⚠️ Nüfus dosyası bulunamadı ({os.path.join(UYGULAMA_KLASORU, 'data')}); "
+          "tüm iller varsayılan nüfusla puanlanacak")
+    return None
+
+NUFUS_DOSYASI = nufus_dosyasi_bul()
 
 def allowed_file(filename):
     """Dosya uzantısı kontrolü"""
@@ -46,10 +102,176 @@ def get_session_id():
 def get_session_folder():
     """Session klasörü oluştur"""
     session_id = get_session_id()
-    session_folder = os.path.join('uploads', session_id)
+    session_folder = os.path.join(upload_klasoru(), session_id)
     os.makedirs(session_folder, exist_ok=True)
     return session_folder
 
+def sahipsiz_upload_klasorlerini_temizle():
+    """Depoda karşılığı olmayan ve süresi dolmuş upload klasörlerini sil (ör. yeniden başlatma sonrası)"""
+    kok = upload_klasoru()
+    if not os.path.isdir(kok):
+        return
+    session_store.cleanup()
+    aktif_sessionlar = set(session_store.session_ids())
+    sinir = datetime.now().timestamp() - session_store.ttl
+    for klasor in os.listdir(kok):
+        klasor_yolu = os.path.join(kok, klasor)
+        if (klasor not in aktif_sessionlar and os.path.isdir(klasor_yolu)
+                and os.path.getmtime(klasor_yolu) < sinir):
+            shutil.rmtree(klasor_yolu, ignore_errors=True)
+
+def baslik_dogrula(baslik_satiri):
+    """CSV başlık satırını doğrula, sütunları ve tespit edilen aktiviteyi döndür"""
+    satir = baslik_satiri.decode('utf-8-sig')
+    sutunlar = [sutun.strip() for sutun in next(csv.reader([satir]), [])]
+    if 'İL' not in sutunlar:
+        raise ValueError("CSV başlığında 'İL' sütunu bulunamadı")
+    return sutunlar, DinamikPuanlamaSistemi.aktiviteyi_basliktan_bul(sutunlar)
+
+def csv_akisla_kaydet(file, gecici_yol):
+    """Yüklenen dosyayı parça parça diske yaz; başlık ilk parçada doğrulanır
+    
+    Dosya bir kez okunur: boyut sınırı, SHA-256 özeti ve başlık kontrolü yazarken yapılır.
+    Geçersiz dosyada okuma hemen kesilir ve geçici dosya silinir.
+    """
+    ozet = hashlib.sha256()
+    boyut = 0
+    bas = b''
+    sutunlar = aktivite = None
+    
+    try:
+        with open(gecici_yol, 'wb') as hedef:
+            while True:
+                parca = file.stream.read(UPLOAD_PARCA_BOYUTU)
+                if not parca:
+                    break
+                
+                boyut += len(parca)
+                if boyut > MAX_FILE_SIZE:
+                    raise ValueError(f'Dosya boyutu sınırı aşıldı ({MAX_FILE_SIZE // (1024 * 1024)}MB)')
+                
+                # Başlık satırı tamamlanınca doğrula
+                if sutunlar is None:
+                    bas += parca[:BASLIK_MAX_BOYUT]
+                    if b'\n' in bas:
+                        sutunlar, aktivite = baslik_dogrula(bas.split(b'\n', 1)[0].rstrip(b'\r'))
+                    elif len(bas) >= BASLIK_MAX_BOYUT:
+                        raise ValueError('CSV başlık satırı çok uzun')
+                
+                ozet.update(parca)
+                hedef.write(parca)
+        
+        if sutunlar is None:
+            if not bas:
+                raise ValueError('Dosya boş')
+            sutunlar, aktivite = baslik_dogrula(bas.rstrip(b'\r\n'))
+    except Exception:
+        if os.path.exists(gecici_yol):
+            os.remove(gecici_yol)
+        raise
+    
+    return {
+        'sha256': ozet.hexdigest(),
+        'size': boyut,
+        'columns': sutunlar,
+        'activity': aktivite
+    }
+
+def onbellegi_hazirla(session_folder, dosya_yolu, aktivite_adi, icerik_ozeti):
+    """Yüklenen dosyayı ayrıştırıp temizlenmiş halini önbelleğe yaz (arka planda)"""
+    try:
+        sistem = WebDinamikPuanlamaSistemi(data_folder=session_folder)
+        sistem.web_dosyasi_yukle(dosya_yolu, aktivite_adi, icerik_ozeti)
+    except Exception as e:
+        print(f"⚠️ Önbellek hazırlanamadı ({os.path.basename(dosya_yolu)}): {e}")
+
+def is_guncelle(job_id, **alanlar):
+    """Analiz işinin durum alanlarını güncelle (paylaşılan depoda)"""
+    session_store.update_job(job_id, **alanlar)
+
+def eski_isleri_temizle():
+    """Zaman aşımına uğrayan işleri başarısız işaretle, saklama süresi dolan işleri sil"""
+    session_store.cleanup_jobs(IS_SAKLAMA_SURESI, ANALIZ_ZAMAN_ASIMI)
+
+def is_durumu(job_id, session_id, sonuc_dahil=True):
+    """İşin JSON'a uygun durum kopyası (başka session'ın işi için None)"""
+    is_kaydi = session_store.get_job(job_id)
+    if not is_kaydi or is_kaydi['session_id'] != session_id:
+        return None
+    durum = {k: v for k, v in is_kaydi.items() if k != 'session_id'}
+    if not sonuc_dahil:
+        durum.pop('result', None)
+    return durum
+
+def session_puan_sonuclari(session_data):
+    """Session'daki düz puan matrisinden PuanSonuclari kur (analiz yoksa None)"""
+    puan_matrisi = (session_data or {}).get('puan_matrisi')
+    return PuanSonuclari.duz_veriden(puan_matrisi) if puan_matrisi else None
+
+def agirlikli_siralama(sonuclar, coefficients, limit=10):
+    """Normalize puan matrisini yeni katsayılarla ağırlıklandır (aktivite metodları çalışmaz)"""
+    toplamlar = sonuclar.agirlikli_toplamlar(coefficients)
+    
+    # Güncel katsayı ve ağırlıklar
+    katsayilar = dict(sonuclar.katsayilar)
+    katsayilar.update(coefficients)
+    toplam_katsayi = sum(katsayilar.values())
+    activity_weights = {
+        aktivite: {
+            'coefficient': katsayi,
+            'weight_percentage': round((katsayi / toplam_katsayi) * 100, 2) if toplam_katsayi > 0 else 0
+        }
+        for aktivite, katsayi in katsayilar.items()
+    }
+    
+    top_provinces = [
+        {
+            'province': sonuclar.iller[i],
+            'total_score': round(float(toplamlar[i]), 2),
+            'category': sonuclar.il_bilgileri['il_kategorisi'][i],
+            'population': int(sonuclar.il_bilgileri['nufus'][i])
+        }
+        for i in np.argsort(-toplamlar, kind='stable')[:limit]
+    ]
+    
+    return {
+        'total_coefficient': toplam_katsayi,
+        'activity_weights': activity_weights,
+        'top_provinces': top_provinces
+    }
+
+def analiz_isi_calistir(job_id, session_id, session_folder, openai_api_key):
+    """Analizi arka planda çalıştır ve sonucu session'a kaydet"""
+    is_guncelle(job_id, status='running', started_at=datetime.now().isoformat())
+    try:
+        sistem = WebDinamikPuanlamaSistemi(
+            openai_api_key=openai_api_key,
+            data_folder=session_folder,
+            ilerleme_bildir=lambda yuzde, asama: is_guncelle(job_id, progress=yuzde, stage=asama)
+        )
+        
+        # Analiz çalıştır
+        result = sistem.web_analiz_calistir()
+        
+        # Sonuçları session'a kaydet
+        # (puan_matrisi: katsayı değişikliklerinde yeniden hesaplamadan ağırlıklandırmak için düz veri)
+        puan_matrisi = sistem.sonuclar.duz_veri() if isinstance(sistem.sonuclar, PuanSonuclari) else None
+        session_store.update(session_id, analysis_result=result, puan_matrisi=puan_matrisi)
+        
+        is_guncelle(job_id,
+                    status='completed' if result.get('success') else 'failed',
+                    progress=100,
+                    stage='Tamamlandı' if result.get('success') else 'Hata',
+                    message=result.get('message', ''),
+                    result=result,
+                    finished_at=datetime.now().isoformat())
+    except Exception as e:
+        is_guncelle(job_id,
+                    status='failed',
+                    stage='Hata',
+                    message=f'Analiz hatası: {str(e)}',
+                    finished_at=datetime.now().isoformat())
+
 @app.route('/')
 def index():
     """Ana sayfa"""
@@ -61,6 +283,7 @@ def status():
     return jsonify({
         'status': 'active',
         'version': '1.0',
+        'population_data': NUFUS_DOSYASI is not None,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -70,39 +293,77 @@ def upload_files():
     try:
         session_folder = get_session_folder()
         session_id = get_session_id()
+        onbellek_hazirla = request.form.get('prime_cache', '1' if UPLOAD_ONBELLEK_HAZIRLA else '0') == '1'
+        
+        # Session'daki mevcut dosyalar (aynı içerik tekrar yazılmaz)
+        session_data = session_store.get(session_id) or {}
+        session_files = {f['saved_name']: f for f in session_data.get('uploaded_files', [])}
+        mevcut_ozetler = {f.get('sha256'): f['saved_name'] for f in session_files.values()}
         
         uploaded_files = []
+        rejected_files = []
         
         # Tüm dosyaları kontrol et
         for file_key in request.files:
             file = request.files[file_key]
             
             if file and file.filename and allowed_file(file.filename):
-                # Güvenli dosya adı
-                filename = secure_filename(file.filename)
-                filepath = os.path.join(session_folder, filename)
+                # Dosyayı akışla kaydet (başlık, boyut ve özet yazarken kontrol edilir)
+                gecici_yol = os.path.join(session_folder, f'.{uuid.uuid4().hex}.part')
+                try:
+                    bilgi = csv_akisla_kaydet(file, gecici_yol)
+                except ValueError as e:
+                    rejected_files.append({'original_name': file.filename, 'reason': str(e)})
+                    continue
                 
-                # Dosyayı kaydet
-                file.save(filepath)
+                # Aynı içerik session'da zaten varsa tekrar yazma
+                if bilgi['sha256'] in mevcut_ozetler:
+                    os.remove(gecici_yol)
+                    file_info = dict(session_files[mevcut_ozetler[bilgi['sha256']]],
+                                     original_name=file.filename, duplicate=True)
+                    uploaded_files.append(file_info)
+                    continue
+                
+                # Tanınan aktiviteler standart adla kaydedilir (yeniden yükleme eskisinin yerine geçer)
+                if bilgi['activity']:
+                    filename = f"{bilgi['activity']}.csv"
+                else:
+                    filename = secure_filename(file.filename)
+                filepath = os.path.join(session_folder, filename)
+                os.replace(gecici_yol, filepath)
+                if filename in session_files:
+                    mevcut_ozetler.pop(session_files[filename].get('sha256'), None)
                 
                 # Dosya bilgilerini kaydet
+                aktivite_adi = bilgi['activity'] or WebDinamikPuanlamaSistemi.dosya_aktivite_adi(filename)
                 file_info = {
                     'original_name': file.filename,
                     'saved_name': filename,
                     'path': filepath,
-                    'size': os.path.getsize(filepath)
+                    'size': bilgi['size'],
+                    'sha256': bilgi['sha256'],
+                    'activity': aktivite_adi,
+                    'duplicate': False
                 }
                 uploaded_files.append(file_info)
+                session_files[filename] = file_info
+                mevcut_ozetler[bilgi['sha256']] = filename
+                
+                # Ayrıştırılmış veriyi önbelleğe hazırla (analiz dosyayı tekrar ayrıştırmaz)
+                if onbellek_hazirla:
+                    onbellek_havuzu.submit(onbellegi_hazirla, session_folder, filepath, aktivite_adi, bilgi['sha256'])
         
         # Session'a kaydet
-        if session_id not in current_session:
-            current_session[session_id] = {}
-        current_session[session_id]['uploaded_files'] = uploaded_files
+        session_store.update(session_id, uploaded_files=list(session_files.values()))
+        
+        # Süresi dolan session'ların klasörlerini temizle
+        sahipsiz_upload_klasorlerini_temizle()
         
         return jsonify({
-            'success': True,
+            'success': len(uploaded_files) > 0 or not rejected_files,
             'message': f'{len(uploaded_files)} dosya başarıyla yüklendi',
-            'files': uploaded_files
+            'files': uploaded_files,
+            'rejected_files': rejected_files
         })
         
     except Exception as e:
@@ -113,11 +374,11 @@ def upload_files():
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_data():
-    """Veri analizi başlat"""
+    """Veri analizi başlat (arka plan işi - sonuç /api/jobs/<job_id> ile sorgulanır)"""
     try:
         session_id = get_session_id()
         
-        if session_id not in current_session:
+        if session_id not in session_store:
             return jsonify({
                 'success': False,
                 'message': 'Session bulunamadı. Lütfen dosyaları tekrar yükleyin.'
@@ -130,23 +391,31 @@ def analyze_data():
         # Session folder'ı data klasörü olarak kullan
         session_folder = get_session_folder()
         
-        # Sistem oluştur
-        sistem = WebDinamikPuanlamaSistemi(
-            openai_api_key=openai_api_key,
-            data_folder=session_folder
-        )
+        # İşi kaydet ve kuyruğa ekle
+        eski_isleri_temizle()
+        job_id = uuid.uuid4().hex
+        session_store.set_job(job_id, {
+            'job_id': job_id,
+            'session_id': session_id,
+            'status': 'queued',
+            'progress': 0,
+            'stage': 'Sırada bekliyor',
+            'message': '',
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None
+        })
+        session_store.update(session_id, last_job_id=job_id)
         
-        # Analiz çalıştır
-        result = sistem.web_analiz_calistir()
-        
-        # Sonuçları session'a kaydet
-        current_session[session_id]['analysis_result'] = result
+        analiz_havuzu.submit(analiz_isi_calistir, job_id, session_id, session_folder, openai_api_key)
         
         return jsonify({
             'success': True,
-            'message': 'Analiz başarıyla tamamlandı',
-            'result': result
-        })
+            'message': 'Analiz kuyruğa alındı',
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -154,35 +423,85 @@ def analyze_data():
             'message': f'Analiz hatası: {str(e)}'
         }), 500
 
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """Analiz işinin durumu ve ilerlemesi (tamamlandıysa sonuç dahil)"""
+    eski_isleri_temizle()
+    durum = is_durumu(job_id, get_session_id())
+    if durum is None:
+        return jsonify({
+            'success': False,
+            'message': 'İş bulunamadı'
+        }), 404
+    
+    return jsonify({'success': True, **durum})
+
+@app.route('/api/jobs/<job_id>/result')
+def job_result(job_id):
+    """Tamamlanan analiz işinin sonucu"""
+    durum = is_durumu(job_id, get_session_id())
+    if durum is None:
+        return jsonify({
+            'success': False,
+            'message': 'İş bulunamadı'
+        }), 404
+    
+    if durum['status'] in ('queued', 'running'):
+        return jsonify({
+            'success': False,
+            'message': 'Analiz henüz tamamlanmadı',
+            'status': durum['status'],
+            'progress': durum['progress']
+        }), 409
+    
+    return jsonify({
+        'success': durum['status'] == 'completed',
+        'message': durum['message'],
+        'result': durum['result']
+    })
+
 @app.route('/api/new-activity', methods=['POST'])
 def handle_new_activity():
     """Yeni aktivite işleme"""
     try:
         data = request.get_json()
         activity_name = data.get('activity_name')
-        coefficient = data.get('coefficient')
+        coefficient = float(data.get('coefficient'))
         
         session_id = get_session_id()
+        session_data = session_store.get(session_id)
         
-        if session_id not in current_session:
+        if session_data is None:
             return jsonify({
                 'success': False,
                 'message': 'Session bulunamadı'
             }), 400
         
         # Katsayıyı kaydet
-        if 'new_activities' not in current_session[session_id]:
-            current_session[session_id]['new_activities'] = {}
-        
-        current_session[session_id]['new_activities'][activity_name] = {
+        new_activities = dict(session_data.get('new_activities', {}))
+        new_activities[activity_name] = {
             'coefficient': coefficient,
             'timestamp': datetime.now().isoformat()
         }
+        session_store.update(session_id, new_activities=new_activities)
         
-        return jsonify({
+        yanit = {
             'success': True,
             'message': f'{activity_name} aktivitesi {coefficient} katsayı ile kaydedildi'
-        })
+        }
+        
+        # Analizde olan aktivitelerin kayıtlı katsayıları sonuçlara hemen uygulanır (/api/reweight gibi)
+        sonuclar = session_puan_sonuclari(session_data)
+        if sonuclar is not None:
+            coefficients = {
+                aktivite: float(kayit['coefficient'])
+                for aktivite, kayit in new_activities.items()
+                if aktivite in sonuclar.aktiviteler
+            }
+            if coefficients:
+                yanit.update(agirlikli_siralama(sonuclar, coefficients))
+        
+        return jsonify(yanit)
         
     except Exception as e:
         return jsonify({
@@ -190,6 +509,33 @@ def handle_new_activity():
             'message': f'Aktivite kaydetme hatası: {str(e)}'
         }), 500
 
+@app.route('/api/reweight', methods=['POST'])
+def reweight_results():
+    """Katsayı değişikliğini mevcut analiz üzerinde anında uygula (yeniden hesaplama yok)"""
+    try:
+        session_id = get_session_id()
+        sonuclar = session_puan_sonuclari(session_store.get(session_id))
+        if sonuclar is None:
+            return jsonify({
+                'success': False,
+                'message': 'Önce analiz çalıştırın.'
+            }), 400
+        
+        data = request.get_json()
+        coefficients = {
+            aktivite: float(katsayi)
+            for aktivite, katsayi in data.get('coefficients', {}).items()
+        }
+        
+        limit = int(data.get('limit', 10))
+        return jsonify(dict({'success': True}, **agirlikli_siralama(sonuclar, coefficients, limit)))
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Yeniden ağırlıklandırma hatası: {str(e)}'
+        }), 500
+
 @app.route('/api/download/<report_type>')
 def download_report(report_type):
     """Rapor indirme"""
@@ -209,8 +555,8 @@ def download_report(report_type):
                 'message': 'Geçersiz rapor türü'
             }), 400
         
-        # Rapor dosyası yolu
-        report_path = os.path.join(session_folder, 'output_csv', report_files[report_type])
+        # Rapor dosyası yolu (send_file göreli yolları uygulama klasörüne göre çözer)
+        report_path = os.path.abspath(os.path.join(session_folder, 'output_csv', report_files[report_type]))
         
         if not os.path.exists(report_path):
             return jsonify({
@@ -236,19 +582,22 @@ def session_info():
     try:
         session_id = get_session_id()
         
+        session_data = session_store.get(session_id)
+        
         info = {
             'session_id': session_id,
-            'has_data': session_id in current_session,
+            'has_data': session_data is not None,
             'uploaded_files': [],
             'new_activities': {},
             'analysis_completed': False
         }
         
-        if session_id in current_session:
-            session_data = current_session[session_id]
+        if session_data is not None:
             info['uploaded_files'] = session_data.get('uploaded_files', [])
             info['new_activities'] = session_data.get('new_activities', {})
             info['analysis_completed'] = 'analysis_result' in session_data
+            if session_data.get('last_job_id'):
+                info['last_job'] = is_durumu(session_data['last_job_id'], session_id, sonuc_dahil=False)
         
         return jsonify(info)
         
@@ -261,15 +610,61 @@ def session_info():
 class WebDinamikPuanlamaSistemi(DinamikPuanlamaSistemi):
     """Web uyumlu dinamik puanlama sistemi"""
     
-    def __init__(self, openai_api_key: str = None, data_folder: str = None):
-        # Parent class'ı initialize et
-        super().__init__(openai_api_key)
-        
+    def __init__(self, openai_api_key: str = None, data_folder: str = None, ilerleme_bildir=None):
         # Data klasörünü güncelle
         if data_folder:
             self.data_folder = data_folder
         else:
-            self.data_folder = 'uploads'
+            self.data_folder = upload_klasoru()
+        
+        # Parent class'ı initialize et - raporlar session klasörüne yazılır
+        super().__init__(
+            openai_api_key,
+            calisma_klasoru=UYGULAMA_KLASORU,
+            cikti_klasoru=os.path.join(self.data_folder, 'output_csv')
+        )
+        
+        # İlerleme bildirimi (yüzde, aşama) - arka plan işleri için
+        self.ilerleme_bildir = ilerleme_bildir
+    
+    def _ilerleme(self, yuzde: int, asama: str):
+        """İlerlemeyi bildir (bildirim fonksiyonu yoksa sessiz)"""
+        if self.ilerleme_bildir:
+            self.ilerleme_bildir(yuzde, asama)
+    
+    # Bilinen dosyalar (dosya adı -> aktivite adı, ilk varyasyon kullanılır)
+    DOSYA_AKTIVITE_ESLESMELERI = {
+        'üyelik': ['uyelik', 'üyelik', 'membership'],
+        'danışma_meclisi': ['danisma', 'danışma', 'danisma_meclisi', 'council'],
+        'ramazan_çalışmaları': ['ramazan', 'ramazan_calismalari', 'ramadan'],
+        'bayrak_çalışması': ['bayrak', 'bayrak_calismasi', 'flag']
+    }
+    
+    @classmethod
+    def dosya_aktivite_adi(cls, csv_file) -> str:
+        """Dosya adını aktivite adına çevir"""
+        file_stem = Path(csv_file).stem.lower()
+        
+        for original_name, variations in cls.DOSYA_AKTIVITE_ESLESMELERI.items():
+            if any(var in file_stem for var in variations):
+                return variations[0]  # İlk variation'ı kullan
+        
+        # Eğer bilinen bir aktivite değilse, dosya adını temizle
+        return file_stem.replace(' ', '_').replace('ç', 'c').replace('ğ', 'g').replace('ı', 'i').replace('ö', 'o').replace('ş', 's').replace('ü', 'u')
+    
+    def web_dosyasi_yukle(self, csv_file, aktivite_adi: str, icerik_ozeti: str = None) -> bool:
+        """Tek bir aktivite dosyasını yükle (temizlenmiş veri önbelleğe de yazılır)"""
+        # Danışma dosyası parça parça okunup il bazında sayılır
+        if aktivite_adi == 'danisma' and self.vektorel_hesaplama:
+            return self._danisma_dosyasini_akisla_oku(csv_file, icerik_ozeti=icerik_ozeti)
+        
+        try:
+            # İçeriği değişmemiş dosya önbellekten temizlenmiş olarak gelir
+            self.veriler[aktivite_adi] = self._veri_dosyasi_yukle(aktivite_adi, csv_file, icerik_ozeti)
+            return True
+        except Exception as e:
+            print(f"❌ {Path(csv_file).name} verisi yüklenemedi: {e}")
+            return False
     
     def web_dinamik_veri_yukle(self):
         """Web uyumlu veri yükleme"""
@@ -283,37 +678,13 @@ class WebDinamikPuanlamaSistemi(DinamikPuanlamaSistemi):
             
             csv_files = list(data_path.glob('*.csv'))
             
-            # Bilinen dosyalar
-            known_mappings = {
-                'üyelik': ['uyelik', 'üyelik', 'membership'],
-                'danışma_meclisi': ['danisma', 'danışma', 'danisma_meclisi', 'council'],
-                'ramazan_çalışmaları': ['ramazan', 'ramazan_calismalari', 'ramadan'],
-                'bayrak_çalışması': ['bayrak', 'bayrak_calismasi', 'flag']
-            }
-            
             loaded_activities = []
             
             for csv_file in csv_files:
-                file_stem = csv_file.stem.lower()
-                
-                # Dosya adını aktivite adına çevir
-                aktivite_adi = None
-                for original_name, variations in known_mappings.items():
-                    if any(var in file_stem for var in variations):
-                        aktivite_adi = variations[0]  # İlk variation'ı kullan
-                        break
-                
-                # Eğer bilinen bir aktivite değilse, dosya adını temizle
-                if not aktivite_adi:
-                    aktivite_adi = file_stem.replace(' ', '_').replace('ç', 'c').replace('ğ', 'g').replace('ı', 'i').replace('ö', 'o').replace('ş', 's').replace('ü', 'u')
-                
-                try:
-                    df = pd.read_csv(csv_file, encoding='utf-8')
-                    self.veriler[aktivite_adi] = df
+                aktivite_adi = self.dosya_aktivite_adi(csv_file)
+                if self.web_dosyasi_yukle(csv_file, aktivite_adi):
                     loaded_activities.append(aktivite_adi)
                     print(f"✅ {aktivite_adi.title()} verisi yüklendi: {csv_file.name}")
-                except Exception as e:
-                    print(f"❌ {csv_file.name} verisi yüklenemedi: {e}")
             
             # Veri temizleme
             self._veri_temizle()
@@ -334,6 +705,7 @@ class WebDinamikPuanlamaSistemi(DinamikPuanlamaSistemi):
             print("🚀 Web Dinamik Analiz Başlatılıyor...")
             
             # Veri yükleme
+            self._ilerleme(10, 'Veriler yükleniyor')
             if not self.web_dinamik_veri_yukle():
                 return {
                     'success': False,
@@ -341,27 +713,21 @@ class WebDinamikPuanlamaSistemi(DinamikPuanlamaSistemi):
                 }
             
             # Analiz adımları
+            self._ilerleme(40, 'İl kategorileri belirleniyor')
             self.il_kategorileri_belirle()
+            self._ilerleme(50, 'Puanlar hesaplanıyor')
             sonuclar = self.genel_puanlama_hesapla()
             
-            # Raporları oluştur (session klasörüne)
-            output_folder = os.path.join(self.data_folder, 'output_csv')
-            os.makedirs(output_folder, exist_ok=True)
-            
-            # Geçici olarak çıktı klasörünü değiştir
-            original_cwd = os.getcwd()
-            os.chdir(self.data_folder)
+            self._ilerleme(80, 'Raporlar oluşturuluyor')
             
-            try:
-                self.rapor_olustur()
-            finally:
-                os.chdir(original_cwd)
+            # Raporları oluştur (session klasörüne - cikti_klasoru)
+            self.rapor_olustur()
             
             # Sonuç özeti
             toplam_katsayi = sum(self.aktivite_katsayilari.values())
             aktivite_agirlikları = {}
             for aktivite, katsayi in self.aktivite_katsayilari.items():
-                agirlik = (katsayi / toplam_katsayi) * 100
+                agirlik = (katsayi / toplam_katsayi) * 100 if toplam_katsayi > 0 else 0
                 aktivite_agirlikları[aktivite] = {
                     'coefficient': katsayi,
                     'weight_percentage': round(agirlik, 2)
@@ -386,21 +752,15 @@ class WebDinamikPuanlamaSistemi(DinamikPuanlamaSistemi):
             }
     
     def _get_top_provinces(self, sonuclar, limit=10):
-        """En iyi illeri al"""
-        sorted_provinces = sorted(
-            sonuclar.items(),
-            key=lambda x: x[1]['toplam_puan'],
-            reverse=True
-        )[:limit]
-        
+        """En iyi illeri al (il × aktivite dizilerinden, il detayları oluşturulmadan)"""
         return [
             {
-                'province': il,
-                'total_score': round(veri['toplam_puan'], 2),
-                'category': veri['il_kategorisi'],
-                'population': veri['nufus']
+                'province': sonuclar.iller[i],
+                'total_score': round(float(sonuclar.toplam_puan[i]), 2),
+                'category': sonuclar.il_bilgileri['il_kategorisi'][i],
+                'population': int(sonuclar.il_bilgileri['nufus'][i])
             }
-            for il, veri in sorted_provinces
+            for i in sonuclar.siralama()[:limit]
         ]
 
 if __name__ == '__main__':
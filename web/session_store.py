@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AK Parti Dinamik Puanlama Sistemi - Session Deposu
+Sınırlı (LRU), süreli (TTL) ve boyut hesaplı sunucu tarafı session deposu
+"""
+
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+def veri_boyutu(data: Dict) -> int:
+    """Session verisinin yaklaşık boyutu (byte) - pickle uzunluğu"""
+    return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def bitis_zamani(is_kaydi: Dict) -> Optional[float]:
+    """İş kaydındaki finished_at (ISO) alanının zaman damgası (bitmemişse None)"""
+    bitis = is_kaydi.get('finished_at')
+    return datetime.fromisoformat(bitis).timestamp() if bitis else None
+
+
+def baslangic_zamani(is_kaydi: Dict) -> Optional[float]:
+    """İşin started_at (sıradaysa created_at) zaman damgası"""
+    baslangic = is_kaydi.get('started_at') or is_kaydi.get('created_at')
+    return datetime.fromisoformat(baslangic).timestamp() if baslangic else None
+
+
+def zaman_asimina_ugrat(is_kaydi: Dict, max_runtime: Optional[int], simdi: float) -> bool:
+    """Süresi içinde bitmeyen (sırada/çalışıyor) işi başarısız olarak işaretle
+
+    Worker süreci çöken veya takılan işler sonsuza kadar 'running' kalmasın diye
+    başlangıçtan max_runtime saniye sonra bitmiş sayılır. İşaretlendiyse True.
+    """
+    if max_runtime is None or is_kaydi.get('status') not in ('queued', 'running'):
+        return False
+    baslangic = baslangic_zamani(is_kaydi)
+    if baslangic is None or baslangic >= simdi - max_runtime:
+        return False
+    is_kaydi.update(
+        status='failed',
+        stage='Hata',
+        message=f'Analiz {max_runtime} saniye içinde tamamlanmadı (zaman aşımı)',
+        finished_at=datetime.fromtimestamp(simdi).isoformat()
+    )
+    return True
+
+
+class SessionStore(ABC):
+    """Session deposu arayüzü
+
+    Session verisi düz bir sözlüktür. Depodan alınan sözlük bir kopyadır;
+    değişiklikler set() veya update() ile geri yazılmalıdır.
+
+    ttl: son erişimden bu yana geçen süre (saniye) aşılınca session silinir
+    max_sessions / max_bytes: aşılınca en uzun süredir kullanılmayan silinir
+    on_evict: silinen her session_id için çağrılır (ör. upload klasörü temizliği)
+
+    Arka plan analiz işlerinin durumu da aynı depoda tutulur (get_job/set_job/
+    update_job); böylece işi başlatan worker dışındaki süreçler de durumu görür.
+    İşler session sınırlarına dahil değildir, cleanup_jobs ile silinir.
+    """
+
+    def __init__(self, ttl: int = 6 * 60 * 60, max_sessions: int = 200,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 on_evict: Optional[Callable[[str], None]] = None):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Dict]:
+        """Session verisinin kopyası (yoksa None) - son erişim zamanı güncellenir"""
+
+    @abstractmethod
+    def set(self, session_id: str, data: Dict):
+        """Session verisini tamamen değiştir"""
+
+    @abstractmethod
+    def update(self, session_id: str, **alanlar) -> Dict:
+        """Session'ı (yoksa oluşturarak) verilen alanlarla güncelle"""
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        """Session'ı sil (on_evict çağrılmaz)"""
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """Depodaki session id'leri"""
+
+    @abstractmethod
+    def cleanup(self) -> List[str]:
+        """Süresi dolan session'ları sil, silinen id'leri döndür"""
+
+    @abstractmethod
+    def stats(self) -> Dict:
+        """Session sayısı ve toplam boyut"""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """İş kaydının kopyası (yoksa None)"""
+
+    @abstractmethod
+    def set_job(self, job_id: str, data: Dict):
+        """İş kaydını yaz (varsa değiştirir)"""
+
+    @abstractmethod
+    def update_job(self, job_id: str, **alanlar) -> Optional[Dict]:
+        """Var olan işi verilen alanlarla güncelle (iş yoksa None)"""
+
+    @abstractmethod
+    def cleanup_jobs(self, max_age: int, max_runtime: Optional[int] = None) -> List[str]:
+        """Bitişinden (finished_at) bu yana max_age saniye geçen işleri sil
+
+        max_runtime verilirse başlangıcından bu yana max_runtime saniye geçip hâlâ
+        sırada/çalışıyor görünen işler önce başarısız (zaman aşımı) olarak işaretlenir.
+        """
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+    def _evicted(self, session_ids: List[str]):
+        """Silinen session'lar için temizlik geri çağrısını çalıştır"""
+        if not self.on_evict:
+            return
+        for session_id in session_ids:
+            try:
+                self.on_evict(session_id)
+            except Exception as e:
+                print(f"⚠️ Session temizliği başarısız ({session_id}): {e}")
+
+
+class MemorySessionStore(SessionStore):
+    """Tek süreç için bellek içi session deposu (LRU + TTL)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sessions = OrderedDict()  # session_id -> (data, boyut, son_erisim)
+        self._toplam_boyut = 0
+        self._isler = {}  # job_id -> data
+        self._kilit = threading.RLock()
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        with self._kilit:
+            silinenler = self._suresi_dolanlari_sil()
+            kayit = self._sessions.get(session_id)
+            if kayit is not None:
+                data, boyut, _ = kayit
+                self._sessions[session_id] = (data, boyut, time.time())
+                self._sessions.move_to_end(session_id)
+        self._evicted(silinenler)
+        return dict(kayit[0]) if kayit is not None else None
+
+    def set(self, session_id: str, data: Dict):
+        with self._kilit:
+            self._yaz(session_id, dict(data))
+            silinenler = self._suresi_dolanlari_sil() + self._sinirlari_uygula(session_id)
+        self._evicted(silinenler)
+
+    def update(self, session_id: str, **alanlar) -> Dict:
+        with self._kilit:
+            kayit = self._sessions.get(session_id)
+            data = dict(kayit[0]) if kayit is not None else {}
+            data.update(alanlar)
+            self._yaz(session_id, data)
+            silinenler = self._suresi_dolanlari_sil() + self._sinirlari_uygula(session_id)
+        self._evicted(silinenler)
+        return dict(data)
+
+    def delete(self, session_id: str):
+        with self._kilit:
+            self._sil(session_id)
+
+    def session_ids(self) -> List[str]:
+        with self._kilit:
+            return list(self._sessions.keys())
+
+    def cleanup(self) -> List[str]:
+        with self._kilit:
+            silinenler = self._suresi_dolanlari_sil()
+        self._evicted(silinenler)
+        return silinenler
+
+    def stats(self) -> Dict:
+        with self._kilit:
+            return {'sessions': len(self._sessions), 'bytes': self._toplam_boyut}
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        with self._kilit:
+            data = self._isler.get(job_id)
+            return dict(data) if data is not None else None
+
+    def set_job(self, job_id: str, data: Dict):
+        with self._kilit:
+            self._isler[job_id] = dict(data)
+
+    def update_job(self, job_id: str, **alanlar) -> Optional[Dict]:
+        with self._kilit:
+            data = self._isler.get(job_id)
+            if data is None:
+                return None
+            data.update(alanlar)
+            return dict(data)
+
+    def cleanup_jobs(self, max_age: int, max_runtime: Optional[int] = None) -> List[str]:
+        simdi = time.time()
+        sinir = simdi - max_age
+        with self._kilit:
+            for data in self._isler.values():
+                zaman_asimina_ugrat(data, max_runtime, simdi)
+            silinenler = [job_id for job_id, data in self._isler.items()
+                          if (bitis_zamani(data) or sinir) < sinir]
+            for job_id in silinenler:
+                del self._isler[job_id]
+        return silinenler
+
+    def _yaz(self, session_id: str, data: Dict):
+        self._sil(session_id)
+        boyut = veri_boyutu(data)
+        self._sessions[session_id] = (data, boyut, time.time())
+        self._toplam_boyut += boyut
+
+    def _sil(self, session_id: str):
+        kayit = self._sessions.pop(session_id, None)
+        if kayit is not None:
+            self._toplam_boyut -= kayit[1]
+
+    def _suresi_dolanlari_sil(self) -> List[str]:
+        # OrderedDict son erişim sırasında: en eskiden başlayıp süresi dolmayana kadar
+        sinir = time.time() - self.ttl
+        silinenler = []
+        for session_id, (_, _, son_erisim) in list(self._sessions.items()):
+            if son_erisim >= sinir:
+                break
+            self._sil(session_id)
+            silinenler.append(session_id)
+        return silinenler
+
+    def _sinirlari_uygula(self, korunan: str) -> List[str]:
+        # Sayı/boyut sınırı aşıldıkça en uzun süredir kullanılmayanı sil (az önce yazılan hariç)
+        silinenler = []
+        while (len(self._sessions) > self.max_sessions or self._toplam_boyut > self.max_bytes) \
+                and len(self._sessions) > 1:
+            session_id = next(iter(self._sessions))
+            if session_id == korunan:
+                break
+            self._sil(session_id)
+            silinenler.append(session_id)
+        return silinenler
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite tabanlı session deposu - aynı dosyayı kullanan tüm worker süreçleri paylaşır"""
+
+    def __init__(self, db_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        klasor = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(klasor, exist_ok=True)
+        # journal_mode işlem (transaction) içinde değiştirilemez; ayrı bağlantıyla ayarlanır
+        baglanti = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            baglanti.execute('PRAGMA journal_mode=WAL')
+        finally:
+            baglanti.close()
+        with self._baglanti() as baglanti:
+            baglanti.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                ' session_id TEXT PRIMARY KEY,'
+                ' data BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+            baglanti.execute('CREATE INDEX IF NOT EXISTS idx_sessions_last_access ON sessions(last_access)')
+            baglanti.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                ' job_id TEXT PRIMARY KEY,'
+                ' data BLOB NOT NULL,'
+                ' finished_at REAL)'
+            )
+
+    def _baglanti(self) -> sqlite3.Connection:
+        # Her işlem kendi bağlantısını açar (thread ve süreçler arası güvenli)
+        baglanti = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        return _IslemBaglantisi(baglanti)
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        with self._baglanti() as baglanti:
+            silinenler = self._suresi_dolanlari_sil(baglanti)
+            satir = baglanti.execute(
+                'SELECT data FROM sessions WHERE session_id = ?', (session_id,)
+            ).fetchone()
+            if satir is not None:
+                baglanti.execute(
+                    'UPDATE sessions SET last_access = ? WHERE session_id = ?',
+                    (time.time(), session_id)
+                )
+        self._evicted(silinenler)
+        return pickle.loads(satir[0]) if satir is not None else None
+
+    def set(self, session_id: str, data: Dict):
+        with self._baglanti() as baglanti:
+            self._yaz(baglanti, session_id, data)
+            silinenler = self._suresi_dolanlari_sil(baglanti) + self._sinirlari_uygula(baglanti, session_id)
+        self._evicted(silinenler)
+
+    def update(self, session_id: str, **alanlar) -> Dict:
+        with self._baglanti() as baglanti:
+            satir = baglanti.execute(
+                'SELECT data FROM sessions WHERE session_id = ?', (session_id,)
+            ).fetchone()
+            data = pickle.loads(satir[0]) if satir is not None else {}
+            data.update(alanlar)
+            self._yaz(baglanti, session_id, data)
+            silinenler = self._suresi_dolanlari_sil(baglanti) + self._sinirlari_uygula(baglanti, session_id)
+        self._evicted(silinenler)
+        return data
+
+    def delete(self, session_id: str):
+        with self._baglanti() as baglanti:
+            baglanti.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def session_ids(self) -> List[str]:
+        with self._baglanti() as baglanti:
+            return [satir[0] for satir in baglanti.execute('SELECT session_id FROM sessions')]
+
+    def cleanup(self) -> List[str]:
+        with self._baglanti() as baglanti:
+            silinenler = self._suresi_dolanlari_sil(baglanti)
+        self._evicted(silinenler)
+        return silinenler
+
+    def stats(self) -> Dict:
+        with self._baglanti() as baglanti:
+            sayi, boyut = baglanti.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM sessions').fetchone()
+        return {'sessions': sayi, 'bytes': boyut}
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        with self._baglanti() as baglanti:
+            satir = baglanti.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return pickle.loads(satir[0]) if satir is not None else None
+
+    def set_job(self, job_id: str, data: Dict):
+        with self._baglanti() as baglanti:
+            self._is_yaz(baglanti, job_id, data)
+
+    def update_job(self, job_id: str, **alanlar) -> Optional[Dict]:
+        with self._baglanti() as baglanti:
+            satir = baglanti.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+            if satir is None:
+                return None
+            data = pickle.loads(satir[0])
+            data.update(alanlar)
+            self._is_yaz(baglanti, job_id, data)
+        return data
+
+    def cleanup_jobs(self, max_age: int, max_runtime: Optional[int] = None) -> List[str]:
+        simdi = time.time()
+        sinir = simdi - max_age
+        with self._baglanti() as baglanti:
+            if max_runtime is not None:
+                for job_id, blob in baglanti.execute(
+                        'SELECT job_id, data FROM jobs WHERE finished_at IS NULL').fetchall():
+                    data = pickle.loads(blob)
+                    if zaman_asimina_ugrat(data, max_runtime, simdi):
+                        self._is_yaz(baglanti, job_id, data)
+            silinenler = [satir[0] for satir in baglanti.execute(
+                'SELECT job_id FROM jobs WHERE finished_at < ?', (sinir,)
+            )]
+            if silinenler:
+                baglanti.execute('DELETE FROM jobs WHERE finished_at < ?', (sinir,))
+        return silinenler
+
+    def _is_yaz(self, baglanti, job_id: str, data: Dict):
+        baglanti.execute(
+            'INSERT OR REPLACE INTO jobs (job_id, data, finished_at) VALUES (?, ?, ?)',
+            (job_id, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), bitis_zamani(data))
+        )
+
+    def _yaz(self, baglanti, session_id: str, data: Dict):
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        baglanti.execute(
+            'INSERT OR REPLACE INTO sessions (session_id, data, size, last_access) VALUES (?, ?, ?, ?)',
+            (session_id, blob, len(blob), time.time())
+        )
+
+    def _suresi_dolanlari_sil(self, baglanti) -> List[str]:
+        sinir = time.time() - self.ttl
+        silinenler = [satir[0] for satir in baglanti.execute(
+            'SELECT session_id FROM sessions WHERE last_access < ?', (sinir,)
+        )]
+        if silinenler:
+            baglanti.execute('DELETE FROM sessions WHERE last_access < ?', (sinir,))
+        return silinenler
+
+    def _sinirlari_uygula(self, baglanti, korunan: str) -> List[str]:
+        sayi, boyut = baglanti.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM sessions').fetchone()
+        if sayi <= self.max_sessions and boyut <= self.max_bytes:
+            return []
+
+        # En uzun süredir kullanılmayandan başlayarak sınırların altına inene kadar sil
+        silinenler = []
+        for session_id, satir_boyutu in baglanti.execute(
+                'SELECT session_id, size FROM sessions WHERE session_id != ? ORDER BY last_access',
+                (korunan,)).fetchall():
+            if sayi <= self.max_sessions and boyut <= self.max_bytes:
+                break
+            silinenler.append(session_id)
+            sayi -= 1
+            boyut -= satir_boyutu
+        baglanti.executemany('DELETE FROM sessions WHERE session_id = ?', [(s,) for s in silinenler])
+        return silinenler
+
+
+class _IslemBaglantisi:
+    """SQLite bağlantısını tek bir yazma işlemi (BEGIN IMMEDIATE) olarak kullan ve kapat"""
+
+    def __init__(self, baglanti: sqlite3.Connection):
+        self.baglanti = baglanti
+
+    def __enter__(self) -> sqlite3.Connection:
+        # Okuma-değiştirme-yazma adımları süreçler arasında sıralı çalışsın
+        self.baglanti.execute('BEGIN IMMEDIATE')
+        return self.baglanti
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.baglanti.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.baglanti.close()
+        return False
+
+
+def create_session_store(on_evict: Optional[Callable[[str], None]] = None) -> SessionStore:
+    """Ortam değişkenlerine göre session deposu oluştur
+
+    SESSION_STORE=memory|sqlite, SESSION_DB (sqlite dosyası), SESSION_TTL (saniye),
+    SESSION_MAX_COUNT, SESSION_MAX_BYTES
+    """
+    ayarlar = {
+        'ttl': int(os.environ.get('SESSION_TTL', 6 * 60 * 60)),
+        'max_sessions': int(os.environ.get('SESSION_MAX_COUNT', 200)),
+        'max_bytes': int(os.environ.get('SESSION_MAX_BYTES', 256 * 1024 * 1024)),
+        'on_evict': on_evict
+    }
+
+    if os.environ.get('SESSION_STORE', 'memory').lower() == 'sqlite':
+        return SQLiteSessionStore(os.environ.get('SESSION_DB', 'sessions.db'), **ayarlar)
+    return MemorySessionStore(**ayarlar)